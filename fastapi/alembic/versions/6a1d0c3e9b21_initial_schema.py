@@ -0,0 +1,144 @@
+"""Initial schema
+
+Revision ID: 6a1d0c3e9b21
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+Tables as they were created by Base.metadata.create_all before migrations
+were introduced. Databases created that way are stamped at this revision.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "6a1d0c3e9b21"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("email", sa.String(length=100), nullable=False),
+        sa.Column("username", sa.String(length=50), nullable=True),
+        sa.Column("password_hash", sa.String(length=255), nullable=False),
+        sa.Column("is_admin", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_user_id", "users", ["user_id"])
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+
+    op.create_table(
+        "lists",
+        sa.Column("list_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("title", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"]),
+        sa.PrimaryKeyConstraint("list_id"),
+    )
+    op.create_index("ix_lists_list_id", "lists", ["list_id"])
+
+    op.create_table(
+        "items",
+        sa.Column("item_id", sa.Uuid(), nullable=False),
+        sa.Column("list_id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("image_url", sa.String(length=255), nullable=True),
+        sa.Column("prev_item_id", sa.Uuid(), nullable=True),
+        sa.Column("next_item_id", sa.Uuid(), nullable=True),
+        sa.Column("rating", sa.Double(), nullable=True),
+        sa.Column("tier", sa.String(length=1), nullable=True),
+        sa.Column("tier_set", sa.String(length=10), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["list_id"], ["lists.list_id"]),
+        sa.PrimaryKeyConstraint("item_id"),
+    )
+    op.create_index("ix_items_item_id", "items", ["item_id"])
+
+    op.create_table(
+        "comparison_sessions",
+        sa.Column("session_id", sa.Uuid(), nullable=False),
+        sa.Column("list_id", sa.Uuid(), nullable=False),
+        sa.Column("new_item_id", sa.Uuid(), nullable=False),
+        sa.Column("target_item_id", sa.Uuid(), nullable=True),
+        sa.Column("tier_set", sa.String(length=10), nullable=False),
+        sa.Column("min_index", sa.Integer(), nullable=False),
+        sa.Column("max_index", sa.Integer(), nullable=False),
+        sa.Column("comparison_index", sa.Integer(), nullable=False),
+        sa.Column("is_complete", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["list_id"], ["lists.list_id"]),
+        sa.ForeignKeyConstraint(["new_item_id"], ["items.item_id"]),
+        sa.ForeignKeyConstraint(["target_item_id"], ["items.item_id"]),
+        sa.PrimaryKeyConstraint("session_id"),
+    )
+    op.create_index(
+        "ix_comparison_sessions_session_id", "comparison_sessions", ["session_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comparison_sessions_session_id", "comparison_sessions")
+    op.drop_table("comparison_sessions")
+    op.drop_index("ix_items_item_id", "items")
+    op.drop_table("items")
+    op.drop_index("ix_lists_list_id", "lists")
+    op.drop_table("lists")
+    op.drop_index("ix_users_username", "users")
+    op.drop_index("ix_users_user_id", "users")
+    op.drop_index("ix_users_email", "users")
+    op.drop_table("users")
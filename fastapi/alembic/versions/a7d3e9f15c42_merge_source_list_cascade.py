@@ -0,0 +1,48 @@
+"""Cascade merge sessions with their source list
+
+Revision ID: a7d3e9f15c42
+Revises: f4a9c2e7b318
+Create Date: 2026-10-19 16:20:00.000000
+
+merge_sessions.source_list_id becomes a foreign key to lists with ON DELETE
+CASCADE, so a session never outlives either of its lists, and gets an index
+for the open merge checks made before a list is changed or deleted.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "a7d3e9f15c42"
+down_revision: Union[str, None] = "f4a9c2e7b318"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Names SQLite's reflected, unnamed constraints as in f4a9c2e7b318
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+FOREIGN_KEY = "merge_sessions_source_list_id_fkey"
+INDEX = "ix_merge_sessions_source_list_id_is_complete"
+
+
+def upgrade() -> None:
+    # Sessions left behind by source lists deleted before this revision
+    op.execute(
+        "DELETE FROM merge_sessions "
+        "WHERE source_list_id NOT IN (SELECT list_id FROM lists)"
+    )
+    with op.batch_alter_table(
+        "merge_sessions", naming_convention=NAMING_CONVENTION
+    ) as batch_op:
+        batch_op.create_foreign_key(
+            FOREIGN_KEY, "lists", ["source_list_id"], ["list_id"], ondelete="CASCADE"
+        )
+    op.create_index(INDEX, "merge_sessions", ["source_list_id", "is_complete"])
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, "merge_sessions")
+    with op.batch_alter_table(
+        "merge_sessions", naming_convention=NAMING_CONVENTION
+    ) as batch_op:
+        batch_op.drop_constraint(FOREIGN_KEY, type_="foreignkey")
@@ -0,0 +1,163 @@
+"""Merge sessions, item positions, list versions and list counters
+
+Revision ID: b47e2f5a8c13
+Revises: 6a1d0c3e9b21
+Create Date: 2026-10-19 09:10:00.000000
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "b47e2f5a8c13"
+down_revision: Union[str, None] = "6a1d0c3e9b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIER_COUNTER_COLUMNS = {
+    "S": "tier_s",
+    "A": "tier_a",
+    "B": "tier_b",
+    "C": "tier_c",
+    "D": "tier_d",
+    "F": "tier_f",
+}
+
+
+def _backfill_positions() -> None:
+    """Number every ranked chain from its head, lowest ranked first."""
+    bind = op.get_bind()
+    items = sa.table(
+        "items",
+        sa.column("item_id", sa.Uuid()),
+        sa.column("list_id", sa.Uuid()),
+        sa.column("tier_set", sa.String()),
+        sa.column("prev_item_id", sa.Uuid()),
+        sa.column("next_item_id", sa.Uuid()),
+        sa.column("position", sa.Integer()),
+    )
+    sessions = sa.table(
+        "comparison_sessions",
+        sa.column("new_item_id", sa.Uuid()),
+        sa.column("is_complete", sa.Boolean()),
+    )
+    # Items still waiting on a comparison are not part of a chain yet
+    pending = sa.select(sessions.c.new_item_id).where(
+        sessions.c.is_complete == sa.false()
+    )
+    rows = bind.execute(
+        sa.select(
+            items.c.item_id,
+            items.c.list_id,
+            items.c.tier_set,
+            items.c.prev_item_id,
+            items.c.next_item_id,
+        ).where(items.c.tier_set.is_not(None), items.c.item_id.not_in(pending))
+    ).all()
+
+    chains: Dict[Tuple, List] = defaultdict(list)
+    for row in rows:
+        chains[(row.list_id, row.tier_set)].append(row)
+
+    for chain in chains.values():
+        by_id = {row.item_id: row for row in chain}
+        current = next((row for row in chain if row.prev_item_id is None), None)
+        position = 0
+        while current is not None:
+            bind.execute(
+                items.update()
+                .where(items.c.item_id == current.item_id)
+                .values(position=position)
+            )
+            position += 1
+            current = by_id.pop(current.next_item_id, None)
+
+
+def _backfill_counters() -> None:
+    """Count each list's items and tier distribution."""
+    items = sa.table("items", sa.column("list_id"), sa.column("tier"))
+    lists = sa.table(
+        "lists",
+        sa.column("list_id"),
+        sa.column("item_count"),
+        *(sa.column(column) for column in TIER_COUNTER_COLUMNS.values()),
+    )
+
+    def count(*criteria: sa.ColumnElement) -> sa.ScalarSelect:
+        return (
+            sa.select(sa.func.count())
+            .select_from(items)
+            .where(items.c.list_id == lists.c.list_id, *criteria)
+            .scalar_subquery()
+        )
+
+    values = {"item_count": count()}
+    for tier, column in TIER_COUNTER_COLUMNS.items():
+        values[column] = count(items.c.tier == tier)
+    op.execute(lists.update().values(values))
+
+
+def upgrade() -> None:
+    # Databases created by create_all may already have this table
+    if not sa.inspect(op.get_bind()).has_table("merge_sessions"):
+        op.create_table(
+            "merge_sessions",
+            sa.Column("session_id", sa.Uuid(), nullable=False),
+            sa.Column("list_id", sa.Uuid(), nullable=False),
+            sa.Column("source_list_id", sa.Uuid(), nullable=False),
+            sa.Column("tier_set", sa.String(length=10), nullable=False),
+            sa.Column("decisions", sa.JSON(), nullable=False),
+            sa.Column("is_complete", sa.Boolean(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+            sa.ForeignKeyConstraint(["list_id"], ["lists.list_id"]),
+            sa.PrimaryKeyConstraint("session_id"),
+        )
+        op.create_index(
+            "ix_merge_sessions_session_id", "merge_sessions", ["session_id"]
+        )
+
+    with op.batch_alter_table("items") as batch_op:
+        batch_op.add_column(sa.Column("position", sa.Integer(), nullable=True))
+
+    with op.batch_alter_table("lists") as batch_op:
+        batch_op.add_column(
+            sa.Column("version", sa.Integer(), server_default="1", nullable=False)
+        )
+        batch_op.add_column(
+            sa.Column("item_count", sa.Integer(), server_default="0", nullable=False)
+        )
+        for column in TIER_COUNTER_COLUMNS.values():
+            batch_op.add_column(
+                sa.Column(column, sa.Integer(), server_default="0", nullable=False)
+            )
+
+    _backfill_positions()
+    _backfill_counters()
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("lists") as batch_op:
+        for column in reversed(TIER_COUNTER_COLUMNS.values()):
+            batch_op.drop_column(column)
+        batch_op.drop_column("item_count")
+        batch_op.drop_column("version")
+
+    with op.batch_alter_table("items") as batch_op:
+        batch_op.drop_column("position")
+
+    op.drop_index("ix_merge_sessions_session_id", "merge_sessions")
+    op.drop_table("merge_sessions")
@@ -0,0 +1,46 @@
+"""Composite indexes for the hot queries in app.crud
+
+Revision ID: d93c7a1f4e56
+Revises: b47e2f5a8c13
+Create Date: 2026-10-19 09:20:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "d93c7a1f4e56"
+down_revision: Union[str, None] = "b47e2f5a8c13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_users_created_at_user_id", "users", ["created_at", "user_id"]),
+    ("ix_lists_user_id_updated_at", "lists", ["user_id", "updated_at", "list_id"]),
+    ("ix_lists_user_id_title", "lists", ["user_id", "title"]),
+    (
+        "ix_items_list_id_tier_set_position",
+        "items",
+        ["list_id", "tier_set", "position"],
+    ),
+    (
+        "ix_comparison_sessions_session_id_is_complete",
+        "comparison_sessions",
+        ["session_id", "is_complete"],
+    ),
+    (
+        "ix_comparison_sessions_list_id_is_complete",
+        "comparison_sessions",
+        ["list_id", "is_complete"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table)
@@ -0,0 +1,30 @@
+"""Count answered comparisons per comparison session
+
+Revision ID: e2b8c4d61f07
+Revises: d93c7a1f4e56
+Create Date: 2026-10-19 11:05:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e2b8c4d61f07"
+down_revision: Union[str, None] = "d93c7a1f4e56"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("comparison_sessions") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "comparison_count", sa.Integer(), server_default="0", nullable=False
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("comparison_sessions") as batch_op:
+        batch_op.drop_column("comparison_count")
@@ -0,0 +1,72 @@
+"""Cascade deletes of users, lists and items in the database
+
+Revision ID: f4a9c2e7b318
+Revises: e2b8c4d61f07
+Create Date: 2026-10-19 13:40:00.000000
+
+Foreign keys get ON DELETE CASCADE so deleting a list or user is a single
+statement instead of the ORM loading and deleting every child row. The
+referencing columns without an index get one, since each cascaded row is
+looked up by them.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from alembic import op
+
+revision: str = "f4a9c2e7b318"
+down_revision: Union[str, None] = "e2b8c4d61f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The constraints were created unnamed. This convention gives SQLite's
+# reflected constraints the names PostgreSQL generated for them.
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+# Referencing table -> (column, referenced table, referenced column)
+FOREIGN_KEYS: Dict[str, List[Tuple[str, str, str]]] = {
+    "lists": [("user_id", "users", "user_id")],
+    "items": [("list_id", "lists", "list_id")],
+    "comparison_sessions": [
+        ("list_id", "lists", "list_id"),
+        ("new_item_id", "items", "item_id"),
+        ("target_item_id", "items", "item_id"),
+    ],
+    "merge_sessions": [("list_id", "lists", "list_id")],
+}
+
+INDEXES = (
+    ("ix_comparison_sessions_new_item_id", "comparison_sessions", ["new_item_id"]),
+    (
+        "ix_comparison_sessions_target_item_id",
+        "comparison_sessions",
+        ["target_item_id"],
+    ),
+    ("ix_merge_sessions_list_id", "merge_sessions", ["list_id"]),
+)
+
+
+def _replace_foreign_keys(ondelete: Optional[str]) -> None:
+    for table, foreign_keys in FOREIGN_KEYS.items():
+        # One table rebuild per table on SQLite
+        with op.batch_alter_table(
+            table, naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            for column, referent, referent_column in foreign_keys:
+                name = f"{table}_{column}_fkey"
+                batch_op.drop_constraint(name, type_="foreignkey")
+                batch_op.create_foreign_key(
+                    name, referent, [column], [referent_column], ondelete=ondelete
+                )
+
+
+def upgrade() -> None:
+    _replace_foreign_keys("CASCADE")
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table)
+    _replace_foreign_keys(None)
@@ -1,3 +1,8 @@
 """Ranking App Backend API"""
 
+import time
+
 __version__ = "0.1.0"
+
+# When the app's own imports began, for the startup timing breakdown
+IMPORT_STARTED = time.perf_counter()
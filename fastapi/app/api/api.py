@@ -1,4 +1,4 @@
-from app.api.endpoints import items, lists, users
+from app.api.endpoints import admin, images, items, lists, users
 from fastapi import APIRouter
 
 api_router = APIRouter()
@@ -7,3 +7,5 @@ api_router = APIRouter()
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(lists.router, prefix="/lists", tags=["lists"])
 api_router.include_router(items.router, prefix="/items", tags=["items"])
+api_router.include_router(images.router, prefix="/images", tags=["images"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
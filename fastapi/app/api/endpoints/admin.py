@@ -0,0 +1,31 @@
+from typing import Any, Dict
+
+from app.core.auth import get_current_admin_user
+from app.core.response_cache import response_cache
+from app.core.security import hashing_pool
+from app.core.user_cache import user_cache
+from app.db.database import engine, replica_engine
+from app.db.pool import get_pool_stats
+from app.schemas.user import User
+from fastapi import APIRouter, Depends
+
+router = APIRouter()
+
+
+@router.get("/stats")
+async def read_stats(
+    current_user: User = Depends(get_current_admin_user),
+) -> Dict[str, Any]:
+    """
+    Get runtime cache, hashing and connection pool statistics. Requires admin
+    access.
+    """
+    return {
+        "response_cache": response_cache.stats(),
+        "user_cache": user_cache.stats(),
+        "password_hashing": hashing_pool.stats(),
+        "db_pool": get_pool_stats(engine),
+        "db_replica_pool": (
+            get_pool_stats(replica_engine) if replica_engine is not None else None
+        ),
+    }
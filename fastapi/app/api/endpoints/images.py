@@ -0,0 +1,205 @@
+import asyncio
+from pathlib import Path
+from typing import Callable, Coroutine, Optional
+
+from starlette.types import Message
+
+from app.core.auth import get_current_user
+from app.core.constants import (
+    IMAGE_NOT_FOUND_ERROR,
+    IMAGE_TOO_LARGE_ERROR,
+    UNSUPPORTED_IMAGE_TYPE_ERROR,
+)
+from app.core.etag import etag_matches
+from app.core.images import (
+    IMAGE_ID_RE,
+    IMMUTABLE_CACHE_CONTROL,
+    MEDIA_TYPES,
+    THUMBNAIL_FORMAT,
+    image_store,
+    sniff_image_type,
+)
+from app.schemas.image import ImageUpload
+from app.schemas.user import User
+from app.settings import settings
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import FileResponse
+from fastapi.routing import APIRoute
+
+# Room for the multipart boundaries and part headers around the file
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=IMAGE_TOO_LARGE_ERROR
+    )
+
+
+def limit_body(request: Request, max_bytes: int) -> Request:
+    """
+    Refuse request bodies over `max_bytes` before they are spooled.
+
+    Declared lengths are checked up front; chunked bodies are counted as
+    they arrive and cut off once over the limit.
+    """
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise _too_large()
+
+    receive = request.receive
+    received = 0
+
+    async def limited_receive() -> Message:
+        nonlocal received
+        message = await receive()
+        received += len(message.get("body", b""))
+        if received > max_bytes:
+            raise _too_large()
+        return message
+
+    return Request(request.scope, limited_receive)
+
+
+class UploadLimitRoute(APIRoute):
+    """
+    Route applying the upload size limit while the body is read.
+
+    FastAPI parses form bodies before dependencies or the endpoint run, so
+    by then an oversized upload would already be on disk.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[None, None, Response]]:
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request) -> Response:
+            max_bytes = settings.IMAGE_MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES
+            return await handler(limit_body(request, max_bytes))
+
+        return limited_handler
+
+
+router = APIRouter(route_class=UploadLimitRoute)
+
+
+def _serve(
+    path: Path,
+    media_type: str,
+    etag: str,
+    cache_control: str,
+    if_none_match: Optional[str],
+) -> Response:
+    """Send a stored file, or a 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
+def _original_path(image_id: str) -> Path:
+    """Stored original for an image ID, or 404."""
+    if IMAGE_ID_RE.match(image_id):
+        path = image_store.original_path(image_id)
+        if path.is_file():
+            return path
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail=IMAGE_NOT_FOUND_ERROR
+    )
+
+
+@router.post("/", response_model=ImageUpload)
+async def upload_image(
+    request: Request,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+) -> ImageUpload:
+    """
+    Upload a JPEG, PNG, GIF or WebP image.
+
+    Identical uploads share one stored file. The thumbnail is generated in
+    the background; its URL serves the original until it is ready.
+    """
+    # The route caps the whole body; this is the exact limit for the file
+    data = await file.read(settings.IMAGE_MAX_UPLOAD_BYTES + 1)
+    if len(data) > settings.IMAGE_MAX_UPLOAD_BYTES:
+        raise _too_large()
+    # The declared content type is not trusted; files are served by format
+    extension = sniff_image_type(data)
+    if extension is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=UNSUPPORTED_IMAGE_TYPE_ERROR,
+        )
+
+    # Hashing and writing megabytes would stall the event loop
+    image_id, _ = await asyncio.to_thread(image_store.save, data, extension)
+    image_store.schedule_thumbnail(image_id)
+
+    return ImageUpload(
+        image_id=image_id,
+        image_url=str(request.url_for("read_image", image_id=image_id)),
+        thumbnail_url=str(request.url_for("read_thumbnail", image_id=image_id)),
+    )
+
+
+@router.get("/{image_id}")
+async def read_image(
+    image_id: str,
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
+    """
+    Get an uploaded image.
+
+    Image IDs are content hashes, so responses are cacheable forever and
+    need no authentication (the ID is unguessable).
+    """
+    path = _original_path(image_id)
+    extension = image_id.rsplit(".", 1)[1]
+    return _serve(
+        path,
+        MEDIA_TYPES[extension],
+        f'"{image_id}"',
+        IMMUTABLE_CACHE_CONTROL,
+        if_none_match,
+    )
+
+
+@router.get("/{image_id}/thumbnail")
+async def read_thumbnail(
+    image_id: str,
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
+    """
+    Get the thumbnail of an uploaded image.
+
+    While the thumbnail is not ready (or Pillow is not installed) the
+    original is sent with no-cache, so clients revalidate and switch to the
+    thumbnail once it exists.
+    """
+    original = _original_path(image_id)
+    thumbnail = image_store.thumbnail_path(image_id)
+    if thumbnail.is_file():
+        return _serve(
+            thumbnail,
+            MEDIA_TYPES[THUMBNAIL_FORMAT],
+            f'"{thumbnail.name}-thumbnail"',
+            IMMUTABLE_CACHE_CONTROL,
+            if_none_match,
+        )
+
+    # Queued work is dropped on shutdown, so missing thumbnails are retried
+    image_store.schedule_thumbnail(image_id)
+    extension = image_id.rsplit(".", 1)[1]
+    return _serve(
+        original, MEDIA_TYPES[extension], f'"{image_id}"', "no-cache", if_none_match
+    )
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Union
+from typing import List, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,15 +8,21 @@ from app.core.auth import get_current_user
 from app.core.constants import (
     COMPARISON_SESSION_NOT_FOUND_ERROR,
     ITEM_NOT_FOUND_ERROR,
+    MERGE_IN_PROGRESS_ERROR,
     SESSION_NOT_FOUND_ERROR,
 )
+from app.core.metrics import RANKING_COMPARISONS_PER_INSERTION
+from app.core.traffic_capture import annotate_trace
 from app.crud import comparison as comparison_crud
 from app.crud import item as item_crud
 from app.crud import list as list_crud
-from app.db.database import get_db
+from app.crud import merge as merge_crud
+from app.db.database import get_db, get_read_db
 from app.db.models import Item as ItemModel
+from app.db.query_stats import query_budget
 from app.schemas.item import (
     Comparison,
+    ComparisonExpansion,
     ComparisonResultRequest,
     ComparisonSession,
     Item,
@@ -32,20 +38,31 @@ from app.services.comparison_service import (
 )
 from app.services.ranking import filter_ranked_items, get_initial_tier
 from app.utils.helper import sort_items_linked_list_style
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 router = APIRouter()
 
 
 @router.post("/", response_model=Union[Item, ComparisonSession])
+@query_budget(7)
 async def create_item(
     list_title: str,
     item_in: ItemCreate,
+    expand: List[ComparisonExpansion] = Query([]),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> Union[Item, ComparisonSession]:
     """
     Create a new item within a list.
+
+    A started comparison carries the full reference item, which stays the
+    same for the whole session, and a summary of the target item unless
+    expand=target_item is given.
+
+    Besides authentication this reads the list, checks for a merge in
+    progress and reads the tier set, then writes the item, the list counters
+    and the session in one transaction; nothing is read back, as every
+    response field is already in memory.
     """
     # Check if list exists and belongs to current user
     list_obj = await list_crud.get_by_title_and_user(
@@ -56,6 +73,11 @@ async def create_item(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="List not found or does not belong to current user",
         )
+    # A merge replays its answers against the chains as they were
+    if await merge_crud.has_active_for_lists(db, [list_obj.list_id]):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=MERGE_IN_PROGRESS_ERROR
+        )
 
     # Create item
     item_obj = ItemModel(
@@ -66,6 +88,7 @@ async def create_item(
         image_url=str(item_in.image_url) if item_in.image_url else None,
         prev_item_id=None,
         next_item_id=None,
+        position=None,
         rating=None,
         tier=None,
         tier_set=item_in.tier_set.value,
@@ -80,71 +103,74 @@ async def create_item(
 
     # Filter to only ranked items
     ranked_items = filter_ranked_items(set_items)
-
-    # If no ranked items exist in this set, this is the first item
-    if not ranked_items:
-        item_obj.tier = get_initial_tier(item_in.tier_set.value)
-        await item_crud.create(db, item_obj)
-        await db.commit()
-        await db.refresh(item_obj)
-        return item_obj  # type: ignore[return-value]
+    annotate_trace(
+        list=list_obj.list_id,
+        tier_set=item_in.tier_set.value,
+        tier_set_size=len(ranked_items),
+    )
 
     # Sort the ranked items by linked list order
     try:
-        sort_items_linked_list_style(ranked_items)  # type: ignore[arg-type]
+        sorted_items = sort_items_linked_list_style(
+            ranked_items  # type: ignore[arg-type]
+        )
     except ValueError:
         # Invalid linked list structure, treat as empty
+        sorted_items = []
+
+    # If no ranked items exist in this set, this is the first item
+    if not sorted_items:
         item_obj.tier = get_initial_tier(item_in.tier_set.value)
+        if not ranked_items:
+            item_obj.position = 0
         await item_crud.create(db, item_obj)
         await db.commit()
-        await db.refresh(item_obj)
+        RANKING_COMPARISONS_PER_INSERTION.observe(0)
         return item_obj  # type: ignore[return-value]
 
-    # Initialize comparison - save new item first to get a valid item_id
-    await item_crud.create(db, item_obj)
-    await db.flush()
-
-    # Start comparison session
+    # The item is inserted in the same flush as the session
+    db.add(item_obj)
     db_session = await start_comparison(
         db,
         item_obj,
         list_obj.list_id,
         item_in.tier_set.value,
-        ranked_items,
+        sorted_items,
     )
     await db.commit()
-    await db.refresh(db_session)
-    await db.refresh(item_obj)
-
-    # Get target item for response
-    target_item = await item_crud.get_by_id(db, db_session.target_item_id)
+    annotate_trace(session=db_session.session_id)
 
-    # Build comparison for response
-    all_items = sort_items_linked_list_style(ranked_items)  # type: ignore[arg-type]
+    target_item = db_session.target_item
     comparison = Comparison(
         reference_item=item_obj,  # type: ignore[arg-type]
         target_item=target_item,  # type: ignore[arg-type]
         min_index=0,
-        comparison_index=len(all_items) // 2,
-        max_index=len(all_items) - 1,
+        comparison_index=db_session.comparison_index,
+        max_index=db_session.max_index,
         is_winner=None,
         done=False,
     )
 
     return build_comparison_session_response(
-        db_session, item_obj, target_item, comparison
+        db_session, item_obj, target_item, comparison, {"reference_item", *expand}
     )
 
 
 @router.post("/comparison/result", response_model=Union[ComparisonSession, None])
+@query_budget(15)
 async def submit_comparison_result(
     session_id: str,
     result_request: ComparisonResultRequest,
+    expand: List[ComparisonExpansion] = Query([]),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> Union[ComparisonSession, None]:
     """
     Submit a comparison result and get the next comparison.
+
+    The next comparison only summarizes the target item and leaves out the
+    reference item the client already has; pass expand=reference_item and/or
+    expand=target_item for full objects.
     """
     # Parse session_id as UUID
     try:
@@ -182,6 +208,13 @@ async def submit_comparison_result(
 
     # Filter to ranked items only (exclude the new item being ranked)
     ranked_items = filter_ranked_items(set_items, db_session.new_item_id)
+    annotate_trace(
+        list=db_session.list_id,
+        session=session_uuid,
+        tier_set=ref_tier_set,
+        tier_set_size=len(ranked_items),
+        answer=result_request.result,
+    )
 
     # Get the new item and current target item
     new_item = await item_crud.get_by_id(db, db_session.new_item_id)
@@ -228,14 +261,15 @@ async def submit_comparison_result(
     new_target_item = await item_crud.get_by_id(db, comparison.target_item.item_id)
 
     return build_comparison_session_response(
-        db_session, new_item, new_target_item, comparison
+        db_session, new_item, new_target_item, comparison, set(expand)
     )
 
 
 @router.get("/items/{item_id}", response_model=Item)
+@query_budget(2)
 async def read_item(
     item_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> Item:
     """
@@ -254,6 +288,7 @@ async def read_item(
 
 
 @router.put("/items/{item_id}", response_model=Item)
+@query_budget(5)
 async def update_item(
     item_id: uuid.UUID,
     item_in: ItemUpdate,
@@ -281,6 +316,7 @@ async def update_item(
 
 
 @router.delete("/items/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(5)
 async def delete_item(
     item_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
@@ -298,18 +334,28 @@ async def delete_item(
             detail=ITEM_NOT_FOUND_ERROR,
         )
 
+    if await merge_crud.has_active_for_lists(db, [item_obj.list_id]):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=MERGE_IN_PROGRESS_ERROR
+        )
+
     await item_crud.delete(db, item_obj)
     await db.commit()
 
 
 @router.get("/comparison/{session_id}/status", response_model=ComparisonSession)
+@query_budget(4)
 async def get_comparison_status(
     session_id: str,
-    db: AsyncSession = Depends(get_db),
+    expand: List[ComparisonExpansion] = Query([]),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> ComparisonSession:
     """
     Get the status of a comparison session.
+
+    The comparison is compact like in submit_comparison_result; clients
+    resuming a session pass expand=reference_item to get the item back.
     """
     # Parse session_id as UUID
     try:
@@ -348,4 +394,6 @@ async def get_comparison_status(
             detail=ITEM_NOT_FOUND_ERROR,
         )
 
-    return build_comparison_session_response(db_session, new_item, target_item)
+    return build_comparison_session_response(
+        db_session, new_item, target_item, expand=set(expand)
+    )
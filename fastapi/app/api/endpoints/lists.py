@@ -2,42 +2,127 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any
 from typing import List as TypeList
+from typing import Optional, Union
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.auth import get_current_user
-from app.core.constants import LIST_ALREADY_EXISTS_ERROR, LIST_NOT_FOUND_ERROR
+from app.core.constants import (
+    INVALID_CURSOR_ERROR,
+    LIST_ALREADY_EXISTS_ERROR,
+    LIST_NOT_FOUND_ERROR,
+    MERGE_IN_PROGRESS_ERROR,
+    MERGE_PENDING_COMPARISON_ERROR,
+    MERGE_SAME_LIST_ERROR,
+    MERGE_SESSION_NOT_FOUND_ERROR,
+)
+from app.core.etag import etag_matches, make_etag, not_modified_response
+from app.core.response_cache import CachedResponse, response_cache
+from app.core.traffic_capture import annotate_trace
+from app.crud import comparison as comparison_crud
 from app.crud import item as item_crud
 from app.crud import list as list_crud
-from app.db.database import get_db
+from app.crud import merge as merge_crud
+from app.db.database import get_db, get_read_db, get_session_factory
 from app.db.models import List as ListModel
-from app.schemas.item import Item
-from app.schemas.list import List, ListSimple, ListUpdate
+from app.db.query_stats import query_budget
+from app.schemas.item import ComparisonResultRequest, Item, TierRank, TierSet
+from app.schemas.list import ExportFormat, List, ListSimple, ListUpdate, MergeSession
 from app.schemas.user import User
+from app.services.deletion_service import run_list_deletion
+from app.services.export_service import EXPORT_MEDIA_TYPES, stream_export
 from app.services.list_service import (
+    ITEMS_WINDOW_DEFAULT_LIMIT,
+    ITEMS_WINDOW_MAX_LIMIT,
     build_list_response,
     build_list_simple_response,
     get_items_sorted_by_tier_set,
+    get_ranked_items_window,
+    serialize_items,
+    serialize_list_summaries,
+)
+from app.services.merge_service import (
+    build_merge_session_response,
+    finalize_merge,
+    find_merge_pair,
+    get_next_merge_pair,
+    record_merge_decision,
+    start_merge,
+)
+from app.settings import settings
+from app.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
 )
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 router = APIRouter()
 
 
 @router.get("/", response_model=TypeList[ListSimple])
-async def read_lists(
+@query_budget(3)
+async def read_lists(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> Any:
     """
-    Retrieve lists created by the current user.
+    Retrieve lists created by the current user, most recently updated first.
+
+    When a full page is returned, the cursor for the next page is sent in the
+    X-Next-Cursor header; passing it back seeks straight to the following rows,
+    so deep pages cost the same as the first one.
+
+    The ETag covers the versions of all the user's lists, so a matching
+    If-None-Match is answered with 304 without running the stats query, and
+    the encoded body is served from the response cache while they are unchanged.
     """
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_keyset_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR_ERROR
+            )
+
+    versions = await list_crud.get_versions_by_user(db, current_user.user_id)
+    etag = make_etag(current_user.user_id, skip, limit, cursor, *versions)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    cache_key = (current_user.user_id, None, etag, request.url.query)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response()
+
     lists_with_counts = await list_crud.get_by_user_with_stats(
-        db, current_user.user_id, skip, limit
+        db, current_user.user_id, skip, limit, after=after
     )
-    return [build_list_simple_response(row) for row in lists_with_counts]
+    headers = {"ETag": etag}
+    if lists_with_counts and len(lists_with_counts) == limit:
+        last = lists_with_counts[-1][0]
+        headers["X-Next-Cursor"] = encode_keyset_cursor(last.updated_at, last.list_id)
+    entry = CachedResponse(
+        serialize_list_summaries(
+            [build_list_simple_response(row) for row in lists_with_counts]
+        ),
+        headers,
+    )
+    response_cache.set(cache_key, entry)
+    return entry.to_response()
 
 
 @router.post("/", response_model=List)
@@ -67,19 +152,22 @@ async def create_list(
         updated_at=datetime.now(timezone.utc),
     )
     list_obj = await list_crud.create(db, list_obj)
+    annotate_trace(list=list_obj.list_id)
 
     return build_list_response(list_obj)
 
 
 @router.get("/{list_id}", response_model=List)
+@query_budget(2)
 async def read_list(
     list_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> Any:
     """
     Get a specific list by ID with all its items.
     """
+    annotate_trace(list=list_id)
     list_obj = await list_crud.get_by_id_and_user(db, list_id, current_user.user_id)
     if not list_obj:
         raise HTTPException(
@@ -90,26 +178,104 @@ async def read_list(
 
 
 @router.get("/{list_id}/items", response_model=TypeList[Item])
-async def read_list_items(
+@query_budget(5)
+async def read_list_items(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     list_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=ITEMS_WINDOW_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    tier_set: Optional[TierSet] = None,
+    tier: Optional[TierRank] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> Any:
     """
     Get all items for a list, ordered by tier then by linked list position.
+
+    Passing any of limit, offset, cursor, tier_set or tier returns a window of
+    ranked items instead. The cursor for the next window is sent in the
+    X-Next-Cursor header. Responses carry an ETag derived from the list
+    version; a matching If-None-Match is answered with 304 right after the
+    version lookup. Encoded bodies are cached per list version and query.
     """
+    annotate_trace(list=list_id)
     # Verify list exists and belongs to current user
+    version = await list_crud.get_version(db, list_id, current_user.user_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=LIST_NOT_FOUND_ERROR
+        )
+
+    etag = make_etag(list_id, version, request.url.query)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    cache_key = (current_user.user_id, list_id, version, request.url.query)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response()
+    headers = {"ETag": etag}
+
+    windowed = (
+        limit is not None
+        or offset
+        or cursor is not None
+        or tier_set is not None
+        or tier is not None
+    )
+    if windowed:
+        try:
+            window, next_cursor = await get_ranked_items_window(
+                db,
+                list_id,
+                limit or ITEMS_WINDOW_DEFAULT_LIMIT,
+                offset=offset,
+                cursor=cursor,
+                tier_set=tier_set.value if tier_set else None,
+                tier=tier.value if tier else None,
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR_ERROR
+            )
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        items = window
+    else:
+        items = get_items_sorted_by_tier_set(
+            await item_crud.get_rows_by_list_id(db, list_id)
+        )
+        annotate_trace(list_size=len(items))
+
+    entry = CachedResponse(serialize_items(items), headers)
+    response_cache.set(cache_key, entry)
+    return entry.to_response()
+
+
+@router.get("/{list_id}/export")
+async def export_list(
+    list_id: uuid.UUID,
+    format: ExportFormat = ExportFormat.NDJSON,  # pylint: disable=redefined-builtin
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Stream all items of a list in rank order as NDJSON or CSV.
+    """
     list_obj = await list_crud.get_by_id_and_user(db, list_id, current_user.user_id)
     if not list_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=LIST_NOT_FOUND_ERROR
         )
 
-    items = await item_crud.get_by_list_id(db, list_id)
-    if not items:
-        return []
-
-    return get_items_sorted_by_tier_set(items)
+    filename = f"list-{list_id}.{format.value}"
+    return StreamingResponse(
+        stream_export(db, current_user.user_id, format, list_id=list_id),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.put("/{list_id}", response_model=List)
@@ -153,19 +319,173 @@ async def update_list(
     return build_list_response(list_obj, items_data)
 
 
-@router.delete("/{list_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{list_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None
+)
 async def delete_list(
     list_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
     current_user: User = Depends(get_current_user),
-) -> None:
+) -> Optional[Response]:
     """
     Delete a list.
+
+    Lists with at least DELETE_IN_BACKGROUND_MIN_ITEMS items are deleted by a
+    background job in chunks; the response is then 202 and the list
+    disappears once its items are gone.
     """
     list_obj = await list_crud.get_by_id_and_user(db, list_id, current_user.user_id)
     if not list_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=LIST_NOT_FOUND_ERROR
         )
+    # An open merge on either side would be left pointing at a missing list
+    if await merge_crud.has_active_for_lists(db, [list_obj.list_id]):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=MERGE_IN_PROGRESS_ERROR
+        )
+
+    threshold = settings.DELETE_IN_BACKGROUND_MIN_ITEMS
+    if threshold and list_obj.item_count >= threshold:
+        background_tasks.add_task(
+            run_list_deletion, session_factory, list_id, settings.DELETE_CHUNK_SIZE
+        )
+        return Response(status_code=status.HTTP_202_ACCEPTED)
 
     await list_crud.delete(db, list_obj)
+    return None
+
+
+@router.post("/{list_id}/merge", response_model=Union[List, MergeSession])
+async def merge_lists(
+    list_id: uuid.UUID,
+    source_list_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Merge another ranked list into this one.
+
+    Each tier_set is merged like the last step of a merge sort, asking at most
+    n + m - 1 questions. The source list is removed once the merge completes.
+    """
+    list_obj = await list_crud.get_by_id_and_user(db, list_id, current_user.user_id)
+    source_list = await list_crud.get_by_id_and_user(
+        db, source_list_id, current_user.user_id
+    )
+    if not list_obj or not source_list:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=LIST_NOT_FOUND_ERROR
+        )
+    if list_obj.list_id == source_list.list_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=MERGE_SAME_LIST_ERROR
+        )
+    if await comparison_crud.has_active_for_lists(
+        db, [list_obj.list_id, source_list.list_id]
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=MERGE_PENDING_COMPARISON_ERROR,
+        )
+    # A second merge would be stranded once the first drops the source list
+    if await merge_crud.has_active_for_lists(
+        db, [list_obj.list_id, source_list.list_id]
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=MERGE_IN_PROGRESS_ERROR
+        )
+
+    db_session = await start_merge(db, list_obj.list_id, source_list.list_id)
+    pair = await get_next_merge_pair(db, db_session)
+    if pair is None:
+        # Nothing to compare, e.g. the lists use disjoint tier_sets
+        await finalize_merge(db, db_session, source_list)
+        await db.commit()
+        return build_list_response(list_obj)
+
+    await db.commit()
+    return build_merge_session_response(db_session, *pair)
+
+
+@router.post("/merge/result", response_model=Union[MergeSession, None])
+async def submit_merge_result(
+    session_id: uuid.UUID,
+    result_request: ComparisonResultRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Submit whether the left item is better than the right item of a merge.
+    """
+    db_session = await merge_crud.get_active(db, session_id)
+    if not db_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MERGE_SESSION_NOT_FOUND_ERROR,
+        )
+
+    # Verify ownership of both lists
+    list_obj = await list_crud.get_by_id_and_user(
+        db, db_session.list_id, current_user.user_id
+    )
+    source_list = await list_crud.get_by_id_and_user(
+        db, db_session.source_list_id, current_user.user_id
+    )
+    if not list_obj or not source_list:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MERGE_SESSION_NOT_FOUND_ERROR,
+        )
+
+    # The session's tier_set always points at the pair awaiting an answer
+    await record_merge_decision(db, db_session, result_request.result == "better")
+
+    pair = await get_next_merge_pair(db, db_session)
+    if pair is None:
+        await finalize_merge(db, db_session, source_list)
+        await db.commit()
+        return None
+
+    await db.commit()
+    return build_merge_session_response(db_session, *pair)
+
+
+@router.get("/merge/{session_id}/status", response_model=MergeSession)
+# Two chain reads per tier_set scanned, when the pending ones are exhausted
+@query_budget(8)
+async def get_merge_status(
+    session_id: uuid.UUID,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Get the status of a merge session, including the pair awaiting an answer.
+    """
+    db_session = await merge_crud.get_by_id(db, session_id)
+    if not db_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MERGE_SESSION_NOT_FOUND_ERROR,
+        )
+
+    list_obj = await list_crud.get_by_id_and_user(
+        db, db_session.list_id, current_user.user_id
+    )
+    if not list_obj:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MERGE_SESSION_NOT_FOUND_ERROR,
+        )
+
+    if db_session.is_complete:
+        return build_merge_session_response(db_session)
+
+    # Read-only: the submit path moves the session on to the pair's tier_set
+    found = await find_merge_pair(db, db_session)
+    if found is None:
+        return build_merge_session_response(db_session)
+    tier_set, left_item, right_item = found
+    return build_merge_session_response(db_session, left_item, right_item, tier_set)
@@ -1,7 +1,6 @@
 from datetime import timedelta
-from typing import Any, List
+from typing import Any, List, Optional
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import (
@@ -10,12 +9,21 @@ from app.core.auth import (
     get_current_admin_user,
     get_current_user,
 )
-from app.core.constants import INCORRECT_LOGIN_ERROR, USER_ALREADY_EXISTS_ERROR
+from app.core.constants import (
+    INCORRECT_LOGIN_ERROR,
+    INVALID_CREDENTIALS_ERROR,
+    INVALID_CURSOR_ERROR,
+    USER_ALREADY_EXISTS_ERROR,
+)
+from app.crud.crud_user import get_user_by_id, get_users
 from app.crud.crud_user import update_user as crud_update_user
-from app.db.database import get_db
-from app.db.models import User as UserModel
+from app.db.database import get_db, get_read_db
+from app.schemas.list import ExportFormat
 from app.schemas.user import Token, User, UserCreate, UserPublic, UserUpdate
-from fastapi import APIRouter, Depends, HTTPException, status
+from app.services.export_service import EXPORT_MEDIA_TYPES, stream_export
+from app.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 router = APIRouter()
@@ -69,18 +77,35 @@ async def login_for_access_token(
 
 
 @router.get("/", response_model=List[UserPublic])
-async def read_users(
+async def read_users(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ) -> Any:
     """
-    Retrieve users. Requires authentication.
+    Retrieve users in signup order. Requires authentication.
+
+    When a full page is returned, the cursor for the next page is sent in the
+    X-Next-Cursor header.
     """
-    query = select(UserModel).offset(skip).limit(limit)
-    result = await db.execute(query)
-    users = result.scalars().all()
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_keyset_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR_ERROR
+            )
+
+    users = await get_users(db, skip=skip, limit=limit, after=after)
+    if users and len(users) == limit:
+        last = users[-1]
+        response.headers["X-Next-Cursor"] = encode_keyset_cursor(
+            last.created_at, last.user_id
+        )
 
     return [
         {
@@ -105,10 +130,34 @@ async def read_users_me(current_user: User = Depends(get_current_user)) -> Any:
 async def update_current_user(
     user_in: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user),
+    current_user: User = Depends(get_current_user),
 ) -> Any:
     """
     Update current user profile.
     """
-    updated_user = await crud_update_user(db, current_user, user_in)
-    return updated_user
+    db_user = await get_user_by_id(db, current_user.user_id)
+    if db_user is None:
+        # Deleted since its snapshot was cached
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=INVALID_CREDENTIALS_ERROR,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await crud_update_user(db, db_user, user_in)
+
+
+@router.get("/me/export")
+async def export_current_user(
+    format: ExportFormat = ExportFormat.NDJSON,  # pylint: disable=redefined-builtin
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Stream every list and item of the current user as NDJSON or CSV.
+    """
+    filename = f"tiernerd-export.{format.value}"
+    return StreamingResponse(
+        stream_export(db, current_user.user_id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 
 from app.schemas.item import Comparison
 
@@ -20,3 +20,46 @@ def find_next_comparison(all_items: List[Any], comparison: Comparison) -> Compar
         True if comparison.max_index - comparison.min_index <= 1 else False
     )
     return comparison
+
+
+# Merge decisions: which chain supplies the next (lower ranked) item
+MERGE_TAKE_LEFT = "L"
+MERGE_TAKE_RIGHT = "R"
+
+
+def find_next_merge_pair(
+    left_len: int, right_len: int, decisions: str
+) -> Optional[Tuple[int, int]]:
+    """
+    Return the (left, right) indices of the next pair to compare in a merge.
+
+    Both chains are sorted from lowest to highest. Every decision consumes one
+    item from one chain, so a merge needs at most left_len + right_len - 1
+    comparisons before one of the chains runs out.
+    """
+    left_index = decisions.count(MERGE_TAKE_LEFT)
+    right_index = decisions.count(MERGE_TAKE_RIGHT)
+    if left_index >= left_len or right_index >= right_len:
+        return None
+    return left_index, right_index
+
+
+def merge_by_decisions(left: List[Any], right: List[Any], decisions: str) -> List[Any]:
+    """
+    Interleave two chains sorted from lowest to highest using recorded decisions.
+
+    Whatever remains of either chain once the decisions run out is appended
+    in order, exactly as in the final step of a merge sort.
+    """
+    merged: List[Any] = []
+    left_index = right_index = 0
+    for decision in decisions:
+        if decision == MERGE_TAKE_LEFT and left_index < len(left):
+            merged.append(left[left_index])
+            left_index += 1
+        elif decision == MERGE_TAKE_RIGHT and right_index < len(right):
+            merged.append(right[right_index])
+            right_index += 1
+    merged.extend(left[left_index:])
+    merged.extend(right[right_index:])
+    return merged
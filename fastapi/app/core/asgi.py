@@ -0,0 +1,18 @@
+"""Type aliases for pure ASGI middleware."""
+
+from typing import Any, Awaitable, Callable, MutableMapping
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route, e.g. /api/lists/{list_id}."""
+    # Routes of included routers only know their own path on newer FastAPI
+    # versions; the full template lives in the effective route context
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    path = getattr(context, "path", None) or getattr(scope.get("route"), "path", None)
+    return path or "unmatched"
@@ -2,12 +2,17 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Union
 from uuid import UUID
 
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants import INVALID_CREDENTIALS_ERROR
-from app.core.security import verify_password
-from app.crud.crud_user import get_user_by_email, get_user_by_username
+from app.core.security import verify_and_update_password_async
+from app.core.traffic_capture import annotate_trace
+from app.core.user_cache import user_cache
+from app.crud.crud_user import (
+    get_user_by_email,
+    get_user_by_username,
+    set_password_hash,
+)
 from app.db.database import get_db
 from app.db.models import User as UserModel
 from app.schemas.user import TokenPayload, User
@@ -33,8 +38,14 @@ async def authenticate_user(
 
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    valid, new_hash = await verify_and_update_password_async(
+        password, user.password_hash
+    )
+    if not valid:
         return None
+    if new_hash is not None:
+        # Hashed with weaker Argon2 parameters; upgrade it now we know the password
+        user = await set_password_hash(db, user, new_hash)
     return user
 
 
@@ -42,13 +53,15 @@ def create_access_token(
     subject: Union[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create a JWT access token."""
+    # jose pulls in cryptography, so it is imported on first use
+    from jose import jwt
+
+    now = datetime.now(timezone.utc)
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    to_encode = {"exp": expire, "sub": str(subject)}
+        expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode = {"exp": expire, "iat": now, "sub": str(subject)}
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
@@ -57,13 +70,21 @@ def create_access_token(
 
 async def get_current_user(
     db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> Union[User, UserModel]:
-    """Get the current authenticated user."""
+) -> User:
+    """
+    Get the current authenticated user.
+
+    Users are served from the user cache, keyed by user ID and token issue
+    time, so most requests skip the user lookup. The result is a detached
+    snapshot; load the ORM user when it needs to be modified.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail=INVALID_CREDENTIALS_ERROR,
         headers={"WWW-Authenticate": "Bearer"},
     )
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -71,21 +92,29 @@ async def get_current_user(
         user_id: Optional[str] = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-        token_data = TokenPayload(sub=user_id)
+        token_data = TokenPayload(sub=user_id, iat=payload.get("iat"))
     except JWTError:
         raise credentials_exception
 
+    user_uuid = UUID(token_data.sub)
+    annotate_trace(user=user_uuid)
+    cached = user_cache.get(user_uuid, token_data.iat)
+    if cached is not None:
+        return cached
+
     from app.crud.crud_user import get_user_by_id
 
-    user = await get_user_by_id(db, UUID(token_data.sub))
+    user = await get_user_by_id(db, user_uuid)
     if user is None:
         raise credentials_exception
-    return user
+    snapshot = User.model_validate(user)
+    user_cache.set(user_uuid, token_data.iat, snapshot)
+    return snapshot
 
 
 def get_current_admin_user(
-    current_user: UserModel = Depends(get_current_user),
-) -> UserModel:
+    current_user: User = Depends(get_current_user),
+) -> User:
     """Require the current user to be an admin."""
     if not current_user.is_admin:
         raise HTTPException(
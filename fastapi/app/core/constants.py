@@ -7,3 +7,12 @@ LIST_ALREADY_EXISTS_ERROR = "List already exists for current user"
 USER_ALREADY_EXISTS_ERROR = "A user with this email already exists"
 INCORRECT_LOGIN_ERROR = "Incorrect email or password"
 INVALID_CREDENTIALS_ERROR = "Could not validate credentials"
+MERGE_SESSION_NOT_FOUND_ERROR = "Merge session not found or invalid"
+MERGE_SAME_LIST_ERROR = "A list cannot be merged into itself"
+MERGE_PENDING_COMPARISON_ERROR = "Finish pending comparisons before merging these lists"
+MERGE_IN_PROGRESS_ERROR = "Finish the merge in progress before changing these lists"
+INVALID_CURSOR_ERROR = "Invalid pagination cursor"
+PASSWORD_HASHING_BUSY_ERROR = "Too many sign-in requests, please retry shortly"
+IMAGE_NOT_FOUND_ERROR = "Image not found"
+IMAGE_TOO_LARGE_ERROR = "Image is too large"
+UNSUPPORTED_IMAGE_TYPE_ERROR = "Only JPEG, PNG, GIF and WebP images are supported"
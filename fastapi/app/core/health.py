@@ -0,0 +1,156 @@
+"""Background database and pool checks behind the health probes."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.pool import get_pool_stats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HealthSnapshot:
+    """Result of one round of checks."""
+
+    checked_at: float
+    database_ok: bool
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def is_saturated(stats: Dict[str, Any]) -> bool:
+    """Whether a pool has no connection left to hand out without waiting."""
+    if "checked_out" not in stats:
+        return False
+    capacity = stats["size"] + max(stats["max_overflow"], 0)
+    return bool(stats["checked_out"] >= capacity)
+
+
+class HealthMonitor:
+    """
+    Probe the databases on an interval so health endpoints answer instantly.
+
+    Each round runs SELECT 1 on every engine, bounded by the timeout.
+    Engines whose pool is saturated are skipped so the check never waits
+    behind user requests. Without a running background task, e.g. in tests
+    or scripts, probes run a round inline whenever the last one is stale.
+    """
+
+    def __init__(
+        self,
+        engines: Dict[str, Optional[AsyncEngine]],
+        interval_seconds: float,
+        timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.engines = {name: e for name, e in engines.items() if e is not None}
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self._clock = clock
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.snapshot: Optional[HealthSnapshot] = None
+
+    async def _ping(self, engine: AsyncEngine) -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def check(self) -> HealthSnapshot:
+        """Run one round of checks and cache the result."""
+        previous = self.snapshot.errors if self.snapshot else {}
+        errors: Dict[str, str] = {}
+        for name, engine in self.engines.items():
+            if is_saturated(get_pool_stats(engine)):
+                # Don't queue behind user requests; readiness reports the
+                # saturation itself, so keep the last known database state
+                if name in previous:
+                    errors[name] = previous[name]
+                continue
+            try:
+                await asyncio.wait_for(self._ping(engine), self.timeout_seconds)
+            except asyncio.TimeoutError:
+                errors[name] = f"no answer within {self.timeout_seconds:g}s"
+            except Exception as e:  # pylint: disable=broad-except
+                errors[name] = str(e) or type(e).__name__
+        self.snapshot = HealthSnapshot(
+            checked_at=self._clock(),
+            database_ok=not errors,
+            errors=errors,
+        )
+        return self.snapshot
+
+    def is_stale(self, snapshot: HealthSnapshot) -> bool:
+        """Whether the background task has stopped refreshing results."""
+        max_age = max(3 * self.interval_seconds, self.interval_seconds + 1)
+        return self._clock() - snapshot.checked_at > max_age
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is probing."""
+        return self._task is not None and not self._task.done()
+
+    async def current(self) -> HealthSnapshot:
+        """Latest result, checking inline if nothing is refreshing it."""
+        snapshot = self.snapshot
+        if snapshot is None or (not self.running and self.is_stale(snapshot)):
+            snapshot = await self.check()
+        return snapshot
+
+    def saturated_pools(self) -> List[str]:
+        """Pools that are saturated right now (no I/O)."""
+        return [
+            name
+            for name, engine in self.engines.items()
+            if is_saturated(get_pool_stats(engine))
+        ]
+
+    async def readiness(self) -> Dict[str, Any]:
+        """
+        Decide whether this worker should receive traffic.
+
+        Returns:
+            Dictionary with "ready" plus the reasons it is not
+        """
+        snapshot = await self.current()
+        reasons = [f"{name}: {error}" for name, error in snapshot.errors.items()]
+        if self.is_stale(snapshot):
+            reasons.append("health checks are not running")
+        # Pool usage moves faster than the check interval and costs nothing
+        # to read, so saturation is evaluated live
+        reasons.extend(
+            f"{name}: connection pool saturated" for name in self.saturated_pools()
+        )
+        return {
+            "ready": not reasons,
+            "database": "connected" if snapshot.database_ok else "disconnected",
+            "checked_seconds_ago": round(self._clock() - snapshot.checked_at, 3),
+            "reasons": reasons,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.check()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Health check failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start probing in the background."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
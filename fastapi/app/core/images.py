@@ -0,0 +1,203 @@
+"""Content-addressed image storage with background thumbnail generation."""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Optional, Set, Tuple
+
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Magic numbers of the formats accepted for upload, mapped to the extension
+# that ends up in the image ID
+IMAGE_SIGNATURES: Tuple[Tuple[bytes, str], ...] = (
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+MEDIA_TYPES = {
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+}
+THUMBNAIL_FORMAT = "webp"
+
+# Stored files never change, so clients and CDNs may keep them forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+IMAGE_ID_RE = re.compile(r"^[0-9a-f]{64}\.(?:jpg|png|gif|webp)$")
+UPLOADED_IMAGE_URL_RE = re.compile(r"/api/images/([0-9a-f]{64}\.(?:jpg|png|gif|webp))$")
+
+
+def sniff_image_type(data: bytes) -> Optional[str]:
+    """Extension for the image format of `data`, or None if unsupported."""
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    for signature, extension in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return extension
+    return None
+
+
+def thumbnail_url_for(image_url: Any) -> Optional[str]:
+    """
+    Thumbnail URL for an image uploaded here; None for remote image URLs.
+
+    Derived from the image URL so items need no extra column and the list
+    read path can compute it per row without a lookup.
+    """
+    if not image_url:
+        return None
+    url = str(image_url)
+    if UPLOADED_IMAGE_URL_RE.search(url) is None:
+        return None
+    return f"{url}/thumbnail"
+
+
+def make_thumbnail(source: Path, destination: Path, max_size: int) -> bool:
+    """
+    Write a downscaled WebP copy of `source` to `destination`.
+
+    Returns:
+        False if Pillow (the "images" extra) is not installed
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return False
+
+    with Image.open(source) as image:
+        image.seek(0)  # First frame of animations
+        image.thumbnail((max_size, max_size))
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        _write_atomically(
+            destination,
+            lambda handle: image.save(handle, format=THUMBNAIL_FORMAT, quality=80),
+        )
+    return True
+
+
+def _write_atomically(destination: Path, write: Callable[[BinaryIO], object]) -> None:
+    """Write through a temp file so readers never see a partial file."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=destination.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            write(handle)
+        os.replace(tmp, destination)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ImageStore:
+    """
+    Images on local disk, named by the SHA-256 of their content.
+
+    Uploading the same bytes twice yields the same image ID and a single
+    file. Thumbnails are generated on worker threads after the upload
+    returns; Pillow releases the GIL while decoding and resizing, so the
+    threads don't stall the event loop. Until a thumbnail exists (or if
+    Pillow is not installed) the original is served in its place.
+    """
+
+    def __init__(self, root: Path, thumbnail_size: int, max_workers: int) -> None:
+        self.root = root
+        self.thumbnail_size = thumbnail_size
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Done callbacks run on the worker threads; single dict operations
+        # are atomic, so no lock is needed
+        self._pending: Dict[str, "Future[bool]"] = {}
+        # Set once a worker finds Pillow missing; originals are served then
+        self.pillow_missing = False
+
+    def original_path(self, image_id: str) -> Path:
+        """Where an original is stored, sharded by the first hash bytes."""
+        return self.root / "originals" / image_id[:2] / image_id
+
+    def thumbnail_path(self, image_id: str) -> Path:
+        """Where the thumbnail of an image is stored."""
+        digest = image_id.split(".", 1)[0]
+        return self.root / "thumbnails" / digest[:2] / f"{digest}.{THUMBNAIL_FORMAT}"
+
+    def save(self, data: bytes, extension: str) -> Tuple[str, bool]:
+        """
+        Store image bytes under their content hash (blocking).
+
+        Args:
+            data: Image file content
+            extension: Extension from sniff_image_type
+
+        Returns:
+            Tuple of (image ID, whether a new file was written)
+        """
+        image_id = f"{hashlib.sha256(data).hexdigest()}.{extension}"
+        path = self.original_path(image_id)
+        if path.exists():
+            return image_id, False
+        _write_atomically(path, lambda handle: handle.write(data))
+        return image_id, True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="thumbnail"
+            )
+        return self._executor
+
+    def schedule_thumbnail(self, image_id: str) -> Optional["Future[bool]"]:
+        """Generate the thumbnail in the background unless it exists or is queued."""
+        if self.pillow_missing:
+            return None
+        if image_id in self._pending or self.thumbnail_path(image_id).exists():
+            return self._pending.get(image_id)
+        future = self._get_executor().submit(
+            make_thumbnail,
+            self.original_path(image_id),
+            self.thumbnail_path(image_id),
+            self.thumbnail_size,
+        )
+        self._pending[image_id] = future
+        future.add_done_callback(lambda done: self._finished(image_id, done))
+        return future
+
+    def _finished(self, image_id: str, future: "Future[bool]") -> None:
+        self._pending.pop(image_id, None)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.warning("Thumbnail for %s failed: %s", image_id, error)
+        elif not future.result() and not self.pillow_missing:
+            self.pillow_missing = True
+            logger.warning(
+                "Pillow is not installed; serving originals as thumbnails "
+                "(install the 'images' extra)"
+            )
+
+    @property
+    def pending(self) -> Set[str]:
+        """Image IDs whose thumbnails are queued or being generated."""
+        return set(self._pending)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, dropping queued thumbnails."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+image_store = ImageStore(
+    Path(settings.IMAGE_STORAGE_DIR),
+    thumbnail_size=settings.IMAGE_THUMBNAIL_SIZE,
+    max_workers=settings.IMAGE_THUMBNAIL_WORKERS,
+)
@@ -0,0 +1,383 @@
+"""In-process metrics exposed in the Prometheus text format."""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+from app.core.asgi import ASGIApp, Message, Receive, Scope, Send, route_template
+from app.db.query_stats import (
+    QueryBudgetExceededError,
+    QueryStats,
+    current_query_stats,
+    get_query_budget,
+)
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, LabelValues, float]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+COUNT_BUCKETS = (0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30, 50)
+
+
+def _format_labels(names: Sequence[str], values: LabelValues) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base class for a metric family with optional labels."""
+
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def samples(self) -> Iterable[Sample]:
+        """Yield (suffix, label values, value) for every series."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Render the family, including its HELP and TYPE lines."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for suffix, values, value in self.samples():
+            names = self.labelnames
+            if suffix == "_bucket":
+                names = (*names, "le")
+            labels = _format_labels(names, values)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add to the counter for the given label values."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, *labels: str) -> float:
+        """Current value for the given label values."""
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield "_total", labels, value
+
+
+class Gauge(Metric):
+    """Value that can go up and down per label set."""
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add to the gauge for the given label values."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """Subtract from the gauge for the given label values."""
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        """Set the gauge for the given label values."""
+        with self._lock:
+            self._values[labels] = value
+
+    def get(self, *labels: str) -> float:
+        """Current value for the given label values."""
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield "", labels, value
+
+
+class Histogram(Metric):
+    """Bucketed distribution of observations per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (last one is +Inf) and sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for the given label values."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[labels] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        """Number of observations for the given label values."""
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def sum(self, *labels: str) -> float:
+        """Sum of observations for the given label values."""
+        series = self._series.get(labels)
+        return series[1][0] if series else 0.0
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            items = [
+                (labels, list(counts), total[0])
+                for labels, (counts, total) in self._series.items()
+            ]
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                yield "_bucket", (*labels, _format_value(bound)), cumulative
+            yield "_count", labels, cumulative
+            yield "_sum", labels, total
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class Registry:
+    """Collection of metrics plus callbacks that refresh gauges on scrape."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Add a metric to the registry and return it."""
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run a callback before each scrape, e.g. to read pool sizes."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        for collector in self._collectors:
+            collector()
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# Process
+APP_STARTUP_PHASE_DURATION = registry.register(
+    Gauge(
+        "app_startup_phase_seconds",
+        "Time this worker spent in each startup phase.",
+        ("phase",),
+    )
+)
+
+# HTTP
+HTTP_REQUESTS = registry.register(
+    Counter(
+        "http_requests",
+        "HTTP requests by route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template.",
+        ("method", "route"),
+    )
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being served.")
+)
+
+# Database
+DB_QUERIES_PER_REQUEST = registry.register(
+    Histogram(
+        "db_queries_per_request",
+        "Database round trips made while serving a request.",
+        ("route",),
+        buckets=COUNT_BUCKETS,
+    )
+)
+DB_TIME_PER_REQUEST = registry.register(
+    Histogram(
+        "db_time_per_request_seconds",
+        "Time spent waiting on the database while serving a request.",
+        ("route",),
+    )
+)
+DB_QUERY_BUDGET_EXCEEDED = registry.register(
+    Counter(
+        "db_query_budget_exceeded",
+        "Requests that issued more statements than their route's budget.",
+        ("route",),
+    )
+)
+DB_POOL_CONNECTIONS = registry.register(
+    Gauge(
+        "db_pool_connections",
+        "Pooled database connections by state.",
+        ("pool", "state"),
+    )
+)
+DB_POOL_CHECKOUT_TIMEOUTS = registry.register(
+    Gauge(
+        "db_pool_checkout_timeouts",
+        "Connection checkouts that timed out since startup.",
+        ("pool",),
+    )
+)
+DB_POOL_CHECKOUT_WAIT = registry.register(
+    Gauge(
+        "db_pool_checkout_wait_seconds",
+        "Total time spent waiting for pooled connections since startup.",
+        ("pool",),
+    )
+)
+
+# Ranking
+RANKING_COMPARISONS_PER_INSERTION = registry.register(
+    Histogram(
+        "ranking_comparisons_per_insertion",
+        "Comparisons answered to place a new item.",
+        buckets=COUNT_BUCKETS,
+    )
+)
+RANKING_FINALIZE_DURATION = registry.register(
+    Histogram(
+        "ranking_finalize_comparison_seconds",
+        "Time spent in finalize_comparison.",
+        buckets=FAST_BUCKETS,
+    )
+)
+RANKING_SORT_DURATION = registry.register(
+    Histogram(
+        "ranking_sort_linked_list_seconds",
+        "Time spent in sort_items_linked_list_style.",
+        buckets=FAST_BUCKETS,
+    )
+)
+
+
+class MetricsMiddleware:
+    """
+    Record latency, in-flight requests and database round trips per route.
+
+    Routes are labelled by their path template so IDs don't explode the
+    number of series; unmatched paths share one label. Statement counts and
+    database time are also sent in the X-DB-Queries and X-DB-Time-Ms headers
+    and checked against the endpoint's query budget.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.QUERY_STATS_HEADERS:
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"x-db-queries", str(stats.count).encode()),
+                        (b"x-db-time-ms", f"{stats.seconds * 1000:.2f}".encode()),
+                    ]
+            await send(message)
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            current_query_stats.reset(token)
+            path = route_template(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method, path, str(status_code))
+            HTTP_REQUEST_DURATION.observe(elapsed, method, path)
+            DB_QUERIES_PER_REQUEST.observe(stats.count, path)
+            DB_TIME_PER_REQUEST.observe(stats.seconds, path)
+
+        budget = get_query_budget(scope.get("endpoint"))
+        if budget is not None and stats.count > budget:
+            DB_QUERY_BUDGET_EXCEEDED.inc(path)
+            message = (
+                f"{scope['method']} {path} issued {stats.count} statements, "
+                f"over its budget of {budget}"
+            )
+            if settings.QUERY_BUDGET_STRICT:
+                raise QueryBudgetExceededError(message)
+            logger.warning(message)
@@ -0,0 +1,61 @@
+"""Read-your-writes stickiness for replica reads."""
+
+import math
+import time
+
+from app.core.asgi import ASGIApp, Message, Receive, Scope, Send
+from app.settings import settings
+from fastapi import Request
+
+# Set on successful writes; while present, reads stay on the primary
+LAST_WRITE_COOKIE = "tn_last_write"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether the client wrote within the read-your-writes window."""
+    value = request.cookies.get(LAST_WRITE_COOKIE)
+    if value is None:
+        return False
+    try:
+        written_at = float(value)
+    except ValueError:
+        return False
+    return time.time() - written_at < settings.READ_YOUR_WRITES_SECONDS
+
+
+class ReadYourWritesMiddleware:
+    """
+    Mark clients that just wrote so their next reads skip the replica.
+
+    Successful non-GET responses set a short-lived cookie holding the write
+    time. Only active when a replica is configured.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or not settings.DATABASE_REPLICA_URL
+            or settings.READ_YOUR_WRITES_SECONDS <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                max_age = math.ceil(settings.READ_YOUR_WRITES_SECONDS)
+                cookie = (
+                    f"{LAST_WRITE_COOKIE}={time.time():.3f}; Max-Age={max_age}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie.encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, NamedTuple, Optional
+
+from app.settings import settings
+from fastapi import Response
+
+
+class CachedResponse(NamedTuple):
+    """Pre-encoded JSON body and the headers that go with it."""
+
+    body: bytes
+    headers: Dict[str, str]
+
+    @property
+    def size(self) -> int:
+        """Approximate memory used by the entry in bytes."""
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers.items())
+
+    def to_response(self) -> Response:
+        """Build a JSON response from the cached body."""
+        return Response(
+            content=self.body, media_type="application/json", headers=self.headers
+        )
+
+
+class ResponseCache:
+    """LRU cache of encoded responses, bounded by the total size of its entries."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Return the cached response for a key, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += len(entry.body)
+            return entry
+
+    def set(self, key: Hashable, entry: CachedResponse) -> None:
+        """Store a response, evicting least recently used entries to make room."""
+        size = entry.size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            while self._entries and self._size + size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.evictions += 1
+            self._entries[key] = entry
+            self._size += size
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = self.bytes_saved = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit ratio, size and eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_BYTES)
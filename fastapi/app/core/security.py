@@ -1,15 +1,185 @@
-from passlib.context import CryptContext
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+from app.settings import settings
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+def build_pwd_context(
+    time_cost: Optional[int] = None,
+    memory_cost: Optional[int] = None,
+    parallelism: Optional[int] = None,
+) -> "CryptContext":
+    """
+    Build the password context, overriding passlib's Argon2 defaults.
+
+    Hashes weaker than these parameters are re-hashed on the next
+    successful login (see needs_rehash).
+    """
+    # passlib is slow to import and only needed once someone logs in
+    from passlib.context import CryptContext
+
+    options: Dict[str, Any] = {"schemes": ["argon2"], "deprecated": "auto"}
+    for key, value in (
+        ("argon2__time_cost", time_cost),
+        ("argon2__memory_cost", memory_cost),
+        ("argon2__parallelism", parallelism),
+    ):
+        if value is not None:
+            options[key] = value
+    return CryptContext(**options)
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context() -> "CryptContext":
+    """The app's password context, built on first use."""
+    # Parameters come from scripts/calibrate_argon2.py
+    return build_pwd_context(
+        settings.ARGON2_TIME_COST,
+        settings.ARGON2_MEMORY_COST,
+        settings.ARGON2_PARALLELISM,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps `from app.core.security import pwd_context` working lazily
+    if name == "pwd_context":
+        return get_pwd_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+class HashingPool:
+    """
+    Runs password hashing on worker threads with a bounded queue.
+
+    argon2-cffi releases the GIL while hashing, so threads keep the event loop
+    free without the cost of a process pool. At most `max_workers` hashes run
+    at once and up to `max_queue` more wait; anything beyond that is rejected
+    with PasswordHashingBusyError instead of piling up behind the others.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Only touched from the event loop thread
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a hashing function on the pool, shedding load when it is full."""
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHashingBusyError()
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return queue depth and load shedding counters."""
+        return {
+            "in_flight": self.in_flight,
+            "queued": max(self.in_flight - self.max_workers, 0),
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+hashing_pool = HashingPool(
+    settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_LIMIT
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    result: bool = pwd_context.verify(plain_password, hashed_password)
+    result: bool = get_pwd_context().verify(plain_password, hashed_password)
     return result
 
 
 def get_password_hash(password: str) -> str:
     """Generate a password hash."""
-    result: str = pwd_context.hash(password)
+    result: str = get_pwd_context().hash(password)
     return result
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Whether a hash is weaker than this host's Argon2 parameters.
+
+    Hosts calibrate their own parameters, so passlib's needs_update (any
+    difference) would have hosts sharing a database re-hash each other's
+    hashes on every login. Hashes at least as costly are kept; parallelism
+    only changes how the cost is spread and is ignored.
+    """
+    context = get_pwd_context()
+    if context.identify(hashed_password) != "argon2":
+        return bool(context.needs_update(hashed_password))
+    local = context.handler("argon2")
+    stored = local.from_string(hashed_password)
+    return bool(
+        stored.type != local.type
+        or stored.version < local.max_version
+        or stored.rounds < local.default_rounds
+        or stored.memory_cost < local.memory_cost
+    )
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password, returning a new hash if the old one is too weak."""
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if not needs_rehash(hashed_password):
+        return True, None
+    return True, get_password_hash(plain_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool without blocking the event loop."""
+    return await hashing_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing pool without blocking the event loop."""
+    return await hashing_pool.run(get_password_hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify and, if needed, re-hash a password on the hashing pool."""
+    return await hashing_pool.run(
+        verify_and_update_password, plain_password, hashed_password
+    )
@@ -0,0 +1,43 @@
+"""Startup phase timing."""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from app.core.metrics import APP_STARTUP_PHASE_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Seconds spent in each named startup phase, in the order they ran."""
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a phase that was timed elsewhere."""
+        self.phases[name] = seconds
+        APP_STARTUP_PHASE_DURATION.set(seconds, name)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    @property
+    def total(self) -> float:
+        """Seconds across all phases."""
+        return sum(self.phases.values())
+
+    def summary(self) -> str:
+        """One line breakdown, e.g. 'ready in 412 ms (imports 300 ms, ...)'."""
+        parts = ", ".join(
+            f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.phases.items()
+        )
+        return f"ready in {self.total * 1000:.0f} ms ({parts})"
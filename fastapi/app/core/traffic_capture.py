@@ -0,0 +1,131 @@
+"""Opt-in capture of anonymized request traces for replay benchmarks."""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import IO, Any, Dict, Optional
+from uuid import UUID
+
+from app.core.asgi import ASGIApp, Message, Receive, Scope, Send, route_template
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Fields annotated by endpoints for the request being served; None when
+# capture is off so annotate_trace costs a context variable lookup
+current_trace: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "current_trace", default=None
+)
+
+PSEUDONYM_LENGTH = 16
+
+
+def pseudonymize(value: UUID) -> str:
+    """
+    Stable, non-reversible stand-in for an ID.
+
+    Keyed with the secret key, so every worker maps an ID to the same
+    pseudonym while the trace alone can't be joined back to the database.
+    """
+    digest = hmac.new(
+        settings.SECRET_KEY.encode(), value.bytes, hashlib.sha256
+    ).hexdigest()
+    return digest[:PSEUDONYM_LENGTH]
+
+
+def annotate_trace(**fields: Any) -> None:
+    """Attach fields to the current request's trace; UUIDs are pseudonymized."""
+    trace = current_trace.get()
+    if trace is None:
+        return
+    for key, value in fields.items():
+        trace[key] = pseudonymize(value) if isinstance(value, UUID) else value
+
+
+class TraceWriter:
+    """Buffered JSONL appender shared by the requests of one process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._path: Optional[str] = None
+        self._file: Optional[IO[str]] = None
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append one trace to the configured file."""
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        path = (settings.TRAFFIC_CAPTURE_PATH or "").format(pid=os.getpid())
+        with self._lock:
+            if path != self._path:
+                self._close()
+                self._file = open(path, "a", encoding="utf-8")
+                self._path = path
+            assert self._file is not None
+            self._file.write(line)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._path = None
+
+
+trace_writer = TraceWriter()
+
+
+class TrafficCaptureMiddleware:
+    """
+    Append one anonymized line per request when TRAFFIC_CAPTURE_PATH is set.
+
+    Each line holds the start time, method, route template, status and
+    duration plus whatever the endpoint annotated: user, list and session
+    pseudonyms, tier set sizes and comparison answers. Raw IDs, names and
+    request bodies are never written.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.TRAFFIC_CAPTURE_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        trace: Dict[str, Any] = {}
+        token = current_trace.set(trace)
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            current_trace.reset(token)
+            record = {
+                "t": round(started_at, 6),
+                "method": scope["method"],
+                "route": route_template(scope),
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 3),
+                **trace,
+            }
+            try:
+                trace_writer.write(record)
+            except OSError:
+                logger.exception("Could not write traffic trace")
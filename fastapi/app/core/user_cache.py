@@ -0,0 +1,113 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from app.schemas.user import User
+from app.settings import settings
+
+# (user_id, token issued-at) so a fresh login never sees an older snapshot
+UserCacheKey = Tuple[uuid.UUID, Optional[int]]
+
+
+class UserCache:
+    """
+    LRU cache of authenticated user snapshots with a time-to-live.
+
+    Each worker process keeps its own cache. Invalidation is immediate in the
+    worker that changed the user; other workers drop their copy when its TTL
+    runs out, so the TTL bounds how stale a snapshot can be anywhere.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[UserCacheKey, Tuple[float, User]]" = OrderedDict()
+        self._keys_by_user: Dict[uuid.UUID, Set[UserCacheKey]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _remove(self, key: UserCacheKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+    def get(self, user_id: uuid.UUID, issued_at: Optional[int]) -> Optional[User]:
+        """Return the cached user for a token, if present and not expired."""
+        key = (user_id, issued_at)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, user = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return user
+
+    def set(self, user_id: uuid.UUID, issued_at: Optional[int], user: User) -> None:
+        """Store a user snapshot, evicting the least recently used entries."""
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        key = (user_id, issued_at)
+        with self._lock:
+            self._remove(key)
+            while len(self._entries) >= self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            self._entries[key] = (self._clock() + self.ttl_seconds, user)
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop every cached snapshot of a user."""
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+            self.hits = self.misses = self.evictions = 0
+            self.expirations = self.invalidations = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit ratio, size, expiry and invalidation counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+user_cache = UserCache(settings.USER_CACHE_MAX_ENTRIES, settings.USER_CACHE_TTL_SECONDS)
@@ -1,3 +1,3 @@
-from app.crud import comparison, crud_user, item, list
+from app.crud import comparison, crud_user, item, list, merge
 
-__all__ = ["crud_user", "item", "list", "comparison"]
+__all__ = ["crud_user", "item", "list", "comparison", "merge"]
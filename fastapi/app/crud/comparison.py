@@ -1,7 +1,8 @@
 import uuid
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import ComparisonSession as ComparisonSessionModel
@@ -49,7 +50,8 @@ async def update(  # pylint: disable=too-many-arguments,too-many-positional-argu
     max_index: int,
     comparison_index: int,
 ) -> ComparisonSessionModel:
-    """Update comparison session state."""
+    """Update comparison session state after another answered comparison."""
+    session.comparison_count += 1
     session.target_item_id = target_item_id
     session.min_index = min_index
     session.max_index = max_index
@@ -62,7 +64,32 @@ async def mark_complete(
     db: AsyncSession,
     session: ComparisonSessionModel,
 ) -> ComparisonSessionModel:
-    """Mark a comparison session as complete."""
+    """Mark a comparison session as complete after its final comparison."""
+    session.comparison_count += 1
     session.is_complete = True
     await db.flush()
     return session
+
+
+async def has_active_for_lists(db: AsyncSession, list_ids: List[uuid.UUID]) -> bool:
+    """Check whether any of the given lists has an unfinished comparison session."""
+    result = await db.execute(
+        select(ComparisonSessionModel.session_id)
+        .where(
+            ComparisonSessionModel.list_id.in_(list_ids),
+            ComparisonSessionModel.is_complete.is_(False),
+        )
+        .limit(1)
+    )
+    return result.first() is not None
+
+
+async def reassign_list(
+    db: AsyncSession, from_list_id: uuid.UUID, to_list_id: uuid.UUID
+) -> None:
+    """Move comparison sessions from one list to another."""
+    await db.execute(
+        sa_update(ComparisonSessionModel)
+        .where(ComparisonSessionModel.list_id == from_list_id)
+        .values(list_id=to_list_id)
+    )
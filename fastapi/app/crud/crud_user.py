@@ -1,11 +1,12 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
+from app.core.user_cache import user_cache
 from app.db.models import User
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -34,6 +35,26 @@ async def get_user_by_id(db: AsyncSession, user_id: uuid.UUID) -> Optional[User]
     return result.scalar_one_or_none()
 
 
+async def get_users(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[datetime, uuid.UUID]] = None,
+) -> List[User]:
+    """
+    Get users in signup order.
+
+    Pass the (created_at, user_id) of the last row of a page as `after` to seek
+    to the next page through the (created_at, user_id) index.
+    """
+    query = select(User)
+    if after is not None:
+        query = query.where(tuple_(User.created_at, User.user_id) > after)
+    query = query.order_by(User.created_at, User.user_id).offset(skip).limit(limit)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
 async def create_user(db: AsyncSession, obj_in: UserCreate) -> User:
     """
     Create a new user.
@@ -42,7 +63,7 @@ async def create_user(db: AsyncSession, obj_in: UserCreate) -> User:
         user_id=uuid.uuid4(),
         email=obj_in.email,
         username=obj_in.username,
-        password_hash=get_password_hash(obj_in.password),
+        password_hash=await get_password_hash_async(obj_in.password),
         created_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
     )
@@ -60,7 +81,7 @@ async def update_user(db: AsyncSession, db_obj: User, obj_in: UserUpdate) -> Use
 
     # Handle password update separately
     if "password" in update_data:
-        hashed_password = get_password_hash(update_data["password"])
+        hashed_password = await get_password_hash_async(update_data["password"])
         del update_data["password"]
         update_data["password_hash"] = hashed_password
 
@@ -71,14 +92,27 @@ async def update_user(db: AsyncSession, db_obj: User, obj_in: UserUpdate) -> Use
     db.add(db_obj)
     await db.commit()
     await db.refresh(db_obj)
+    user_cache.invalidate(db_obj.user_id)
+    return db_obj
+
+
+async def set_password_hash(db: AsyncSession, db_obj: User, password_hash: str) -> User:
+    """
+    Replace a user's password hash.
+    """
+    db_obj.password_hash = password_hash
+    db.add(db_obj)
+    await db.commit()
     return db_obj
 
 
 async def delete_user(db: AsyncSession, user_id: uuid.UUID) -> None:
     """
-    Delete a user.
+    Delete a user. The database deletes their lists, items and sessions
+    (ON DELETE CASCADE).
     """
     user = await get_user_by_id(db, user_id)
     if user:
         await db.delete(user)
         await db.commit()
+        user_cache.invalidate(user_id)
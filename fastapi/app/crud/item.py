@@ -1,11 +1,35 @@
 import uuid
-from typing import Any, Dict, List, Optional
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import Row
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import func, or_, select
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.models import TIER_COUNTER_COLUMNS
 from app.db.models import Item as ItemModel
 from app.db.models import List as ListModel
+from app.schemas.item import ItemRow
+
+# Columns of the Item response in field order, for reads that skip the ORM
+ITEM_ROW_COLUMNS = tuple(getattr(ItemModel, name) for name in ItemRow.__annotations__)
+
+# Item columns of an export row, after the list_id and list title
+EXPORT_ITEM_COLUMNS = (
+    ItemModel.item_id,
+    ItemModel.name,
+    ItemModel.description,
+    ItemModel.image_url,
+    ItemModel.tier_set,
+    ItemModel.tier,
+    ItemModel.position,
+    ItemModel.rating,
+    ItemModel.created_at,
+    ItemModel.updated_at,
+)
 
 
 async def get_by_id(db: AsyncSession, item_id: uuid.UUID) -> Optional[ItemModel]:
@@ -33,6 +57,14 @@ async def get_by_list_id(db: AsyncSession, list_id: uuid.UUID) -> List[ItemModel
     return list(result.scalars().all())
 
 
+async def get_rows_by_list_id(db: AsyncSession, list_id: uuid.UUID) -> List[Row]:
+    """Get all items for a list as plain rows, without building ORM objects."""
+    result = await db.execute(
+        select(*ITEM_ROW_COLUMNS).where(ItemModel.list_id == list_id)
+    )
+    return list(result.all())
+
+
 async def get_by_list_and_tier_set(
     db: AsyncSession, list_id: uuid.UUID, tier_set: str
 ) -> List[ItemModel]:
@@ -46,6 +78,133 @@ async def get_by_list_and_tier_set(
     return list(result.scalars().all())
 
 
+async def get_ranked_window(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    db: AsyncSession,
+    list_id: uuid.UUID,
+    tier_set: str,
+    limit: int,
+    offset: int = 0,
+    after_position: Optional[int] = None,
+    tier: Optional[str] = None,
+) -> List[Row]:
+    """Get a window of ranked items in a tier_set as plain rows, by position."""
+    query = select(*ITEM_ROW_COLUMNS).where(
+        ItemModel.list_id == list_id,
+        ItemModel.tier_set == tier_set,
+        ItemModel.position.is_not(None),
+    )
+    if after_position is not None:
+        query = query.where(ItemModel.position > after_position)
+    if tier is not None:
+        query = query.where(ItemModel.tier == tier)
+    query = query.order_by(ItemModel.position).offset(offset).limit(limit)
+    result = await db.execute(query)
+    return list(result.all())
+
+
+async def count_ranked_by_tier_set(
+    db: AsyncSession, list_id: uuid.UUID, tier: Optional[str] = None
+) -> Dict[str, int]:
+    """Count the ranked items of a list per tier_set."""
+    query = select(ItemModel.tier_set, func.count()).where(
+        ItemModel.list_id == list_id,
+        ItemModel.position.is_not(None),
+    )
+    if tier is not None:
+        query = query.where(ItemModel.tier == tier)
+    result = await db.execute(query.group_by(ItemModel.tier_set))
+    return {tier_set: count for tier_set, count in result.all() if tier_set is not None}
+
+
+async def shift_positions(
+    db: AsyncSession,
+    list_id: uuid.UUID,
+    tier_set: str,
+    from_position: int,
+    delta: int,
+) -> None:
+    """Shift the positions of items at or above from_position in a tier_set."""
+    await db.execute(
+        sa_update(ItemModel)
+        .where(
+            ItemModel.list_id == list_id,
+            ItemModel.tier_set == tier_set,
+            ItemModel.position >= from_position,
+        )
+        .values(position=ItemModel.position + delta)
+    )
+
+
+async def stream_export_rows(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    tier_set_order: Sequence[str],
+    list_id: Optional[uuid.UUID] = None,
+    batch_size: int = 500,
+) -> AsyncIterator[Sequence[Tuple[Any, ...]]]:
+    """
+    Stream a user's lists and items in rank order, one batch of rows at a time.
+
+    Rows are (list_id, list_title, *EXPORT_ITEM_COLUMNS) tuples. Ranked items
+    are read per tier_set through a server-side cursor ordered by
+    (list_id, tier_set, position), so the index serves the order and memory
+    use does not depend on how many items are exported. Unranked items, and
+    any outside tier_set_order, are few and read up front per list; each
+    follows the ranked items of its tier_set. Lists without items yield a
+    single row with empty item columns.
+    """
+    lists_query = (
+        select(ListModel.list_id, ListModel.title)
+        .where(ListModel.user_id == user_id)
+        .order_by(ListModel.created_at, ListModel.list_id)
+    )
+    if list_id is not None:
+        lists_query = lists_query.where(ListModel.list_id == list_id)
+    lists = (await db.execute(lists_query)).all()
+
+    for list_row in lists:
+        unranked_result = await db.execute(
+            select(*EXPORT_ITEM_COLUMNS)
+            .where(
+                ItemModel.list_id == list_row.list_id,
+                or_(
+                    ItemModel.position.is_(None),
+                    ItemModel.tier_set.is_(None),
+                    ItemModel.tier_set.not_in(tier_set_order),
+                ),
+            )
+            .order_by(ItemModel.created_at)
+        )
+        unranked: Dict[Optional[str], List[Row]] = defaultdict(list)
+        for row in unranked_result.all():
+            tier_set = row.tier_set if row.tier_set in tier_set_order else None
+            unranked[tier_set].append(row)
+
+        exported = False
+        for tier_set in tier_set_order:
+            result = await db.stream(
+                select(*EXPORT_ITEM_COLUMNS)
+                .where(
+                    ItemModel.list_id == list_row.list_id,
+                    ItemModel.tier_set == tier_set,
+                    ItemModel.position.is_not(None),
+                )
+                .order_by(ItemModel.position)
+                .execution_options(yield_per=batch_size)
+            )
+            async for partition in result.partitions():
+                exported = True
+                yield [(*list_row, *row) for row in partition]
+            if unranked[tier_set]:
+                exported = True
+                yield [(*list_row, *row) for row in unranked[tier_set]]
+        if unranked[None]:
+            exported = True
+            yield [(*list_row, *row) for row in unranked[None]]
+        if not exported:
+            yield [(*list_row, *(None,) * len(EXPORT_ITEM_COLUMNS))]
+
+
 async def create(db: AsyncSession, item: ItemModel) -> ItemModel:
     """Create a new item (add to session, commit not performed)."""
     db.add(item)
@@ -67,5 +226,58 @@ async def update(
 
 
 async def delete(db: AsyncSession, item: ItemModel) -> None:
-    """Delete an item."""
+    """Delete an item, closing the gap it leaves in its tier_set positions."""
     await db.delete(item)
+    if item.position is not None and item.tier_set is not None:
+        await db.flush()
+        await shift_positions(db, item.list_id, item.tier_set, item.position + 1, -1)
+
+
+async def delete_in_chunks(
+    db: AsyncSession, list_ids: Sequence[uuid.UUID], chunk_size: int
+) -> int:
+    """
+    Delete all items of the given lists, committing every chunk_size rows.
+
+    Keeps each transaction short when emptying very large lists. Comparison
+    sessions on the items go with them (ON DELETE CASCADE). Each chunk bumps
+    the list versions and decrements the item and tier counters in its own
+    transaction, so a run that stops partway leaves the counters exact.
+    """
+    deleted = 0
+    while True:
+        result = await db.execute(
+            select(ItemModel.item_id, ItemModel.list_id, ItemModel.tier)
+            .where(ItemModel.list_id.in_(list_ids))
+            .limit(chunk_size)
+        )
+        rows = result.all()
+        if not rows:
+            return deleted
+        await db.execute(
+            sa_delete(ItemModel)
+            .where(ItemModel.item_id.in_([row.item_id for row in rows]))
+            .execution_options(synchronize_session=False)
+        )
+
+        deltas: Dict[uuid.UUID, Counter] = defaultdict(Counter)
+        for row in rows:
+            deltas[row.list_id]["item_count"] -= 1
+            if row.tier in TIER_COUNTER_COLUMNS:
+                deltas[row.list_id][TIER_COUNTER_COLUMNS[row.tier]] -= 1
+        now = datetime.now(timezone.utc)
+        for list_id, counter in deltas.items():
+            values: Dict[str, Any] = {
+                "version": ListModel.version + 1,
+                "updated_at": now,
+            }
+            for column, delta in counter.items():
+                values[column] = getattr(ListModel, column) + delta
+            await db.execute(
+                sa_update(ListModel).where(ListModel.list_id == list_id).values(values)
+            )
+        await db.commit()
+
+        deleted += len(rows)
+        if len(rows) < chunk_size:
+            return deleted
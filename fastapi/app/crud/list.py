@@ -1,12 +1,21 @@
 import uuid
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import case, func, select
+from sqlalchemy import case, func, select, tuple_
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.models import TIER_COUNTER_COLUMNS
 from app.db.models import Item as ItemModel
 from app.db.models import List as ListModel
 
+# Denormalized counters in build_list_simple_response row order
+COUNTER_COLUMNS = (
+    ListModel.item_count,
+    *(getattr(ListModel, column) for column in TIER_COUNTER_COLUMNS.values()),
+)
+
 
 async def get_by_id(db: AsyncSession, list_id: uuid.UUID) -> Optional[ListModel]:
     """Get a list by ID."""
@@ -27,6 +36,31 @@ async def get_by_id_and_user(
     return result.scalar_one_or_none()
 
 
+async def get_version(
+    db: AsyncSession, list_id: uuid.UUID, user_id: uuid.UUID
+) -> Optional[int]:
+    """Get a list's version, verifying user ownership."""
+    result = await db.execute(
+        select(ListModel.version).where(
+            ListModel.list_id == list_id,
+            ListModel.user_id == user_id,
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_versions_by_user(
+    db: AsyncSession, user_id: uuid.UUID
+) -> List[Tuple[uuid.UUID, int]]:
+    """Get the (list_id, version) pairs of all lists of a user."""
+    result = await db.execute(
+        select(ListModel.list_id, ListModel.version)
+        .where(ListModel.user_id == user_id)
+        .order_by(ListModel.list_id)
+    )
+    return [(list_id, version) for list_id, version in result.all()]
+
+
 async def get_by_title_and_user(
     db: AsyncSession, title: str, user_id: uuid.UUID
 ) -> Optional[ListModel]:
@@ -41,28 +75,83 @@ async def get_by_title_and_user(
 
 
 async def get_by_user_with_stats(
-    db: AsyncSession, user_id: uuid.UUID, skip: int = 0, limit: int = 100
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[datetime, uuid.UUID]] = None,
 ) -> List[Tuple]:
-    """Get all lists for a user with item counts and tier distribution."""
+    """
+    Get lists for a user with item counts and tier distribution.
+
+    Lists are ordered by most recently updated first. Pass the
+    (updated_at, list_id) of the last row of a page as `after` to seek to the
+    next page through the (user_id, updated_at, list_id) index.
+    """
+    # populate_existing refreshes lists already in the session, whose counters,
+    # version and updated_at may have been changed by app.db.events
+    query = (
+        select(ListModel, *COUNTER_COLUMNS)
+        .where(ListModel.user_id == user_id)
+        .execution_options(populate_existing=True)
+    )
+    if after is not None:
+        query = query.where(tuple_(ListModel.updated_at, ListModel.list_id) < after)
+    query = (
+        query.order_by(ListModel.updated_at.desc(), ListModel.list_id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    return list(result.all())
+
+
+async def count_items_by_list(
+    db: AsyncSession,
+) -> Dict[uuid.UUID, Dict[str, int]]:
+    """Count every list's items and tier distribution from the items table."""
     query = (
         select(
-            ListModel,
+            ListModel.list_id,
             func.count(ItemModel.item_id).label("item_count"),
-            func.sum(case((ItemModel.tier == "S", 1), else_=0)).label("tier_s"),
-            func.sum(case((ItemModel.tier == "A", 1), else_=0)).label("tier_a"),
-            func.sum(case((ItemModel.tier == "B", 1), else_=0)).label("tier_b"),
-            func.sum(case((ItemModel.tier == "C", 1), else_=0)).label("tier_c"),
-            func.sum(case((ItemModel.tier == "D", 1), else_=0)).label("tier_d"),
-            func.sum(case((ItemModel.tier == "F", 1), else_=0)).label("tier_f"),
+            *(
+                func.sum(case((ItemModel.tier == tier, 1), else_=0)).label(column)
+                for tier, column in TIER_COUNTER_COLUMNS.items()
+            ),
         )
         .outerjoin(ItemModel)
-        .where(ListModel.user_id == user_id)
         .group_by(ListModel.list_id)
-        .offset(skip)
-        .limit(limit)
     )
     result = await db.execute(query)
-    return list(result.all())
+    return {
+        row.list_id: {
+            column.key: getattr(row, column.key) or 0 for column in COUNTER_COLUMNS
+        }
+        for row in result
+    }
+
+
+async def get_counters(db: AsyncSession) -> Dict[uuid.UUID, Dict[str, int]]:
+    """Get the stored item and tier counters of every list."""
+    result = await db.execute(select(ListModel.list_id, *COUNTER_COLUMNS))
+    return {
+        row.list_id: {
+            column.key: getattr(row, column.key) for column in COUNTER_COLUMNS
+        }
+        for row in result
+    }
+
+
+async def set_counters(
+    db: AsyncSession, list_id: uuid.UUID, counters: Dict[str, int]
+) -> None:
+    """Overwrite a list's stored counters, bumping its version."""
+    await db.execute(
+        sa_update(ListModel)
+        .where(ListModel.list_id == list_id)
+        .values(version=ListModel.version + 1, **counters)
+    )
+    await db.commit()
 
 
 async def create(db: AsyncSession, list_obj: ListModel) -> ListModel:
@@ -86,6 +175,6 @@ async def update(
 
 
 async def delete(db: AsyncSession, list_obj: ListModel) -> None:
-    """Delete a list (items cascade deleted via relationship)."""
+    """Delete a list; its items and sessions go with it (ON DELETE CASCADE)."""
     await db.delete(list_obj)
     await db.commit()
@@ -0,0 +1,80 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import MergeSession as MergeSessionModel
+
+
+async def get_by_id(
+    db: AsyncSession, session_id: uuid.UUID
+) -> Optional[MergeSessionModel]:
+    """Get a merge session by ID."""
+    result = await db.execute(
+        select(MergeSessionModel).where(MergeSessionModel.session_id == session_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_active(
+    db: AsyncSession, session_id: uuid.UUID
+) -> Optional[MergeSessionModel]:
+    """Get an active (not complete) merge session by ID."""
+    result = await db.execute(
+        select(MergeSessionModel).where(
+            MergeSessionModel.session_id == session_id,
+            MergeSessionModel.is_complete.is_(False),
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def has_active_for_lists(db: AsyncSession, list_ids: List[uuid.UUID]) -> bool:
+    """Check whether any of the given lists is part of an unfinished merge."""
+    result = await db.execute(
+        select(MergeSessionModel.session_id)
+        .where(
+            or_(
+                MergeSessionModel.list_id.in_(list_ids),
+                MergeSessionModel.source_list_id.in_(list_ids),
+            ),
+            MergeSessionModel.is_complete.is_(False),
+        )
+        .limit(1)
+    )
+    return result.first() is not None
+
+
+async def create(db: AsyncSession, session: MergeSessionModel) -> MergeSessionModel:
+    """Create a new merge session."""
+    db.add(session)
+    await db.flush()
+    return session
+
+
+async def update(
+    db: AsyncSession,
+    session: MergeSessionModel,
+    tier_set: str,
+    decisions: Dict[str, str],
+) -> MergeSessionModel:
+    """Update merge session state."""
+    session.tier_set = tier_set
+    # Assign a new dict so the JSON column is flagged as modified
+    session.decisions = dict(decisions)
+    session.updated_at = datetime.now(timezone.utc)
+    await db.flush()
+    return session
+
+
+async def mark_complete(
+    db: AsyncSession,
+    session: MergeSessionModel,
+) -> MergeSessionModel:
+    """Mark a merge session as complete."""
+    session.is_complete = True
+    session.updated_at = datetime.now(timezone.utc)
+    await db.flush()
+    return session
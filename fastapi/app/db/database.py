@@ -1,32 +1,105 @@
 import uuid
-from typing import AsyncGenerator, Optional
-
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import Any, AsyncGenerator, Dict, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from app.db.models import Base, Item, List, User
+from app.core.metrics import registry
+from app.core.read_your_writes import wrote_recently
+from app.db import events  # noqa: F401  # registers session event hooks
+from app.db.models import Item, List, User
+from app.db.pool import InstrumentedAsyncQueuePool, record_pool_metrics
 from app.settings import settings
+from fastapi import Request
+
+
+def engine_options(database_url: str, pool_name: str) -> Dict[str, Any]:
+    """Build create_async_engine keyword arguments from settings."""
+    options: Dict[str, Any] = {"echo": False}
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite uses a single static connection
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=pool_name,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    if settings.APP_ENV == "production" and url.get_backend_name() == "postgresql":
+        # asyncpg driver options
+        options["connect_args"] = {
+            "server_settings": {"jit": "off"},
+            "command_timeout": 60,
+        }
+    return options
+
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    """
+    Make SQLite enforce foreign keys on every connection of an engine.
+
+    SQLite ignores them, including ON DELETE CASCADE, unless each connection
+    opts in. Other databases are left alone.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 
-# Create async engine with connection pool settings for production
-connect_args = {}
-if settings.APP_ENV == "production":
-    # Production connection pool settings
-    connect_args = {
-        "server_settings": {"jit": "off"},
-        "command_timeout": 60,
-        "pool_size": 20,
-        "max_overflow": 40,
-    }
 
 engine = create_async_engine(
     str(settings.DATABASE_URL),
-    echo=False,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    connect_args=connect_args,
+    **engine_options(str(settings.DATABASE_URL), "primary"),
 )
+enable_sqlite_foreign_keys(engine)
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+replica_engine = (
+    create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        **engine_options(settings.DATABASE_REPLICA_URL, "replica"),
+    )
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+if replica_engine is not None:
+    enable_sqlite_foreign_keys(replica_engine)
+# Read-only sessions refuse to flush (see app.db.events)
+ReadSessionLocal = async_sessionmaker(
+    replica_engine or engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    info={"read_only": True},
+)
+PrimaryReadSessionLocal = async_sessionmaker(
+    engine, expire_on_commit=False, class_=AsyncSession, info={"read_only": True}
+)
+
+
+def collect_pool_metrics() -> None:
+    """Refresh pool gauges before each /metrics scrape."""
+    record_pool_metrics("primary", engine)
+    if replica_engine is not None:
+        record_pool_metrics("replica", replica_engine)
+
+
+registry.add_collector(collect_pool_metrics)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -48,21 +121,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def create_tables() -> None:
-    """Create all database tables and seed dev users."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency for work that outlives the request, e.g. background tasks."""
+    return SessionLocal
+
 
-    # Auto-seed dev users in development
-    if settings.APP_ENV == "development":
-        import sys
-        from pathlib import Path
+def read_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
+    """Pick the replica, or the primary if the client wrote moments ago."""
+    if replica_engine is None or wrote_recently(request):
+        return PrimaryReadSessionLocal
+    return ReadSessionLocal
 
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-        from scripts.seed import seed_users
 
-        async with SessionLocal() as session:
-            await seed_users(session)
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function that yields read-only db sessions.
+
+    Sessions go to the read replica when one is configured and are never
+    committed; closing them just releases the connection.
+    """
+    async with read_session_factory(request)() as session:
+        yield session
 
 
 async def create_user(
@@ -0,0 +1,115 @@
+"""Session event hooks that keep denormalized list state in step with items."""
+
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import event, inspect, update
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.db.models import TIER_COUNTER_COLUMNS, Item, List
+
+
+def _touched_list_ids(session: Session) -> Set[uuid.UUID]:
+    """Collect the lists whose items or own columns changed in this flush."""
+    touched: Set[uuid.UUID] = set()
+    deleted_lists: Set[uuid.UUID] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, List):
+            if obj in session.deleted:
+                deleted_lists.add(obj.list_id)
+            elif obj in session.dirty and session.is_modified(obj):
+                touched.add(obj.list_id)
+        elif isinstance(obj, Item):
+            if obj in session.dirty and not session.is_modified(obj):
+                continue
+            touched.add(obj.list_id)
+            # An item moved between lists changes both of them
+            touched.update(inspect(obj).attrs.list_id.history.deleted or ())
+    touched.discard(None)  # type: ignore[arg-type]
+    return touched - deleted_lists
+
+
+def _previous_value(obj: Item, key: str) -> Any:
+    """Get the value an item attribute had before this flush."""
+    history = inspect(obj).attrs[key].history
+    if history.has_changes():
+        return history.deleted[0] if history.deleted else None
+    return getattr(obj, key)
+
+
+def _counter_deltas(session: Session) -> Dict[uuid.UUID, Dict[str, int]]:
+    """Compute the change to each list's item and tier counters in this flush."""
+    deltas: Dict[uuid.UUID, Counter] = defaultdict(Counter)
+
+    def count(list_id: Optional[uuid.UUID], tier: Optional[str], sign: int) -> None:
+        if list_id is None:
+            return
+        deltas[list_id]["item_count"] += sign
+        if tier in TIER_COUNTER_COLUMNS:
+            deltas[list_id][TIER_COUNTER_COLUMNS[tier]] += sign
+
+    for obj in session.new:
+        if isinstance(obj, Item):
+            count(obj.list_id, obj.tier, 1)
+    for obj in session.deleted:
+        if isinstance(obj, Item):
+            count(_previous_value(obj, "list_id"), _previous_value(obj, "tier"), -1)
+    for obj in session.dirty:
+        if isinstance(obj, Item) and session.is_modified(obj):
+            before = (_previous_value(obj, "list_id"), _previous_value(obj, "tier"))
+            after = (obj.list_id, obj.tier)
+            if before != after:
+                count(*before, -1)
+                count(*after, 1)
+
+    changed: Dict[uuid.UUID, Dict[str, int]] = {}
+    for list_id, counter in deltas.items():
+        nonzero = {column: delta for column, delta in counter.items() if delta}
+        if nonzero:
+            changed[list_id] = nonzero
+    return changed
+
+
+@event.listens_for(Session, "before_flush")
+def reject_read_only_writes(
+    session: Session, flush_context: Any, instances: Optional[Any]
+) -> None:
+    """Stop changes from being flushed through a read-only session."""
+    if not session.info.get("read_only"):
+        return
+    if (
+        session.new
+        or session.deleted
+        or any(session.is_modified(obj) for obj in session.dirty)
+    ):
+        raise InvalidRequestError("Cannot write through a read-only session")
+
+
+@event.listens_for(Session, "after_flush")
+def bump_list_versions(session: Session, flush_context: Any) -> None:
+    """Increment list versions and apply item counter changes from the flush."""
+    list_ids = _touched_list_ids(session)
+    if not list_ids:
+        return
+    deltas = _counter_deltas(session)
+    # updated_at is set in Python so every row stores the same timestamp
+    # precision, which keeps (updated_at, list_id) cursors exact
+    now = datetime.now(timezone.utc)
+    # Executed on the connection directly so it bypasses the ORM and autoflush
+    connection = session.connection()
+    for list_id in list_ids & deltas.keys():
+        values: Dict[str, Any] = {"version": List.version + 1, "updated_at": now}
+        for column, delta in deltas[list_id].items():
+            values[column] = getattr(List, column) + delta
+        connection.execute(update(List).where(List.list_id == list_id).values(values))
+    version_only = list_ids - deltas.keys()
+    if version_only:
+        connection.execute(
+            update(List)
+            .where(List.list_id.in_(version_only))
+            .values(version=List.version + 1, updated_at=now)
+        )
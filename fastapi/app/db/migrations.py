@@ -0,0 +1,128 @@
+"""Apply and verify Alembic migrations from inside the app."""
+
+import ast
+from pathlib import Path
+from typing import TYPE_CHECKING, Set, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+VERSIONS_DIR = ALEMBIC_INI.parent / "alembic" / "versions"
+
+# Schema that Base.metadata.create_all produced before migrations existed
+BASELINE_REVISION = "6a1d0c3e9b21"
+
+
+class SchemaOutOfDateError(RuntimeError):
+    """Raised at startup when the database is not at the latest revision."""
+
+
+def get_alembic_config(connection: Connection) -> "Config":
+    """Build an Alembic config that runs on an existing connection."""
+    # Alembic is only needed for migrations, so it stays out of app imports
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def _upgrade(connection: Connection, revision: str) -> None:
+    from alembic import command
+
+    config = get_alembic_config(connection)
+    tables = inspect(connection).get_table_names()
+    if "users" in tables and "alembic_version" not in tables:
+        # Created by create_all before migrations existed
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+
+
+async def upgrade_database(engine: AsyncEngine, revision: str = "head") -> None:
+    """Upgrade the database schema to the given revision."""
+    async with engine.connect() as conn:
+        if conn.dialect.name != "sqlite":
+            async with conn.begin():
+                await conn.run_sync(_upgrade, revision)
+            return
+        # Altering a table on SQLite copies and drops it, and dropping a table
+        # with foreign keys enforced would cascade-delete the rows that
+        # reference it. The pragma only takes effect outside a transaction.
+        enforced = (await conn.exec_driver_sql("PRAGMA foreign_keys")).scalar()
+        await conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        await conn.commit()
+        try:
+            async with conn.begin():
+                await conn.run_sync(_upgrade, revision)
+        finally:
+            if enforced:
+                await conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+                await conn.commit()
+
+
+def get_head_revisions() -> Tuple[str, ...]:
+    """
+    Latest revisions in alembic/versions.
+
+    Read straight from the revision identifiers in the migration files;
+    importing Alembic's script directory takes longer than the whole check.
+    """
+    revisions: Set[str] = set()
+    parents: Set[str] = set()
+    for path in VERSIONS_DIR.glob("*.py"):
+        for node in ast.parse(path.read_text()).body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target, value = node.targets[0], node.value
+            elif isinstance(node, ast.AnnAssign) and node.value is not None:
+                target, value = node.target, node.value
+            else:
+                continue
+            if not isinstance(target, ast.Name):
+                continue
+            if target.id == "revision":
+                revisions.add(ast.literal_eval(value))
+            elif target.id == "down_revision":
+                down = ast.literal_eval(value)
+                if isinstance(down, str):
+                    parents.add(down)
+                elif down:
+                    parents.update(down)
+    return tuple(sorted(revisions - parents))
+
+
+def _current_revisions(connection: Connection) -> Tuple[str, ...]:
+    if not inspect(connection).has_table("alembic_version"):
+        return ()
+    rows = connection.execute(text("SELECT version_num FROM alembic_version"))
+    return tuple(sorted(row[0] for row in rows))
+
+
+async def verify_schema(engine: AsyncEngine) -> Tuple[str, ...]:
+    """
+    Check the database is at the latest revision without changing it.
+
+    Args:
+        engine: Engine for the database to check
+
+    Returns:
+        The current (head) revisions
+
+    Raises:
+        SchemaOutOfDateError: If migrations are missing or unknown
+    """
+    async with engine.connect() as conn:
+        current = await conn.run_sync(_current_revisions)
+    heads = get_head_revisions()
+    if current != heads:
+        raise SchemaOutOfDateError(
+            f"Database schema is at {', '.join(current) or 'no revision'} but the "
+            f"code expects {', '.join(heads)}; run `make migrate` "
+            "(alembic upgrade head) before starting the app"
+        )
+    return current
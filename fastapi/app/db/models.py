@@ -1,9 +1,10 @@
 import datetime
 import uuid
+from typing import Dict
 from typing import List as ListType
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -17,6 +18,10 @@ class User(Base):
     """User model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination of the admin user listing
+        Index("ix_users_created_at_user_id", "created_at", "user_id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, index=True, default=uuid.uuid4
@@ -35,8 +40,13 @@ class User(Base):
     )
 
     # Relationships
+    # The database deletes a user's lists (ON DELETE CASCADE) without the
+    # ORM loading them first
     lists: Mapped[ListType["List"]] = relationship(
-        "List", back_populates="user", cascade="all, delete-orphan"
+        "List",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -44,13 +54,31 @@ class List(Base):
     """List model."""
 
     __tablename__ = "lists"
+    __table_args__ = (
+        # Keyset pagination of a user's lists, most recently updated first
+        Index("ix_lists_user_id_updated_at", "user_id", "updated_at", "list_id"),
+        # Duplicate title check on create
+        Index("ix_lists_user_id_title", "user_id", "title"),
+    )
 
     list_id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, index=True, default=uuid.uuid4
     )
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.user_id"))
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.user_id", ondelete="CASCADE")
+    )
     title: Mapped[str] = mapped_column(String(100))
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Bumped on every change to the list or its items (see app.db.events)
+    version: Mapped[int] = mapped_column(default=1, server_default="1")
+    # Denormalized item counters, maintained by app.db.events
+    item_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    tier_s: Mapped[int] = mapped_column(default=0, server_default="0")
+    tier_a: Mapped[int] = mapped_column(default=0, server_default="0")
+    tier_b: Mapped[int] = mapped_column(default=0, server_default="0")
+    tier_c: Mapped[int] = mapped_column(default=0, server_default="0")
+    tier_d: Mapped[int] = mapped_column(default=0, server_default="0")
+    tier_f: Mapped[int] = mapped_column(default=0, server_default="0")
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -61,26 +89,51 @@ class List(Base):
     # Relationships
     user: Mapped[User] = relationship("User", back_populates="lists")
     items: Mapped[ListType["Item"]] = relationship(
-        "Item", back_populates="list", cascade="all, delete-orphan"
+        "Item",
+        back_populates="list",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
+# List counter column for each tier letter
+TIER_COUNTER_COLUMNS = {
+    "S": "tier_s",
+    "A": "tier_a",
+    "B": "tier_b",
+    "C": "tier_c",
+    "D": "tier_d",
+    "F": "tier_f",
+}
+
+
 class Item(Base):
     """Item model."""
 
     __tablename__ = "items"
+    __table_args__ = (
+        # Item reads by list, by tier_set and ranked windows ordered by position
+        Index("ix_items_list_id_tier_set_position", "list_id", "tier_set", "position"),
+    )
 
     item_id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, index=True, default=uuid.uuid4
     )
-    list_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("lists.list_id"))
+    # active_history so the counters in app.db.events see the previous value
+    list_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("lists.list_id", ondelete="CASCADE"), active_history=True
+    )
     name: Mapped[str] = mapped_column(String(100))
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     image_url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     prev_item_id: Mapped[Optional[uuid.UUID]] = mapped_column(nullable=True)
     next_item_id: Mapped[Optional[uuid.UUID]] = mapped_column(nullable=True)
+    # Zero-based rank within the tier_set chain, lowest first (None if unranked)
+    position: Mapped[Optional[int]] = mapped_column(nullable=True)
     rating: Mapped[Optional[float]] = mapped_column(nullable=True)
-    tier: Mapped[Optional[str]] = mapped_column(String(1), nullable=True)
+    tier: Mapped[Optional[str]] = mapped_column(
+        String(1), nullable=True, active_history=True
+    )
     tier_set: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -97,19 +150,38 @@ class ComparisonSession(Base):
     """Comparison session model for persisting active comparison sessions."""
 
     __tablename__ = "comparison_sessions"
+    __table_args__ = (
+        # Active session lookups by ID
+        Index(
+            "ix_comparison_sessions_session_id_is_complete",
+            "session_id",
+            "is_complete",
+        ),
+        # Pending comparison checks and reassignment when merging lists
+        Index("ix_comparison_sessions_list_id_is_complete", "list_id", "is_complete"),
+        # ON DELETE CASCADE lookups for each deleted item
+        Index("ix_comparison_sessions_new_item_id", "new_item_id"),
+        Index("ix_comparison_sessions_target_item_id", "target_item_id"),
+    )
 
     session_id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, index=True, default=uuid.uuid4
     )
-    list_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("lists.list_id"))
-    new_item_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("items.item_id"))
+    list_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("lists.list_id", ondelete="CASCADE")
+    )
+    new_item_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("items.item_id", ondelete="CASCADE")
+    )
     target_item_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("items.item_id"), nullable=True
+        ForeignKey("items.item_id", ondelete="CASCADE"), nullable=True
     )
     tier_set: Mapped[str] = mapped_column(String(10))
     min_index: Mapped[int] = mapped_column(default=0)
     max_index: Mapped[int] = mapped_column(default=0)
     comparison_index: Mapped[int] = mapped_column(default=0)
+    # Answers submitted so far, for the comparisons-per-insertion metric
+    comparison_count: Mapped[int] = mapped_column(default=0, server_default="0")
     is_complete: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -126,3 +198,43 @@ class ComparisonSession(Base):
     target_item: Mapped[Optional[Item]] = relationship(
         "Item", foreign_keys=[target_item_id], lazy="joined"
     )
+
+
+class MergeSession(Base):
+    """Merge session model for interleaving two ranked lists into one."""
+
+    __tablename__ = "merge_sessions"
+    __table_args__ = (
+        # ON DELETE CASCADE lookups when a list is deleted
+        Index("ix_merge_sessions_list_id", "list_id"),
+        # Open merge checks on the source side, also used by the cascade
+        Index(
+            "ix_merge_sessions_source_list_id_is_complete",
+            "source_list_id",
+            "is_complete",
+        ),
+    )
+
+    session_id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, index=True, default=uuid.uuid4
+    )
+    list_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("lists.list_id", ondelete="CASCADE")
+    )
+    # The session is deleted with the source list once the merge completes
+    source_list_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("lists.list_id", ondelete="CASCADE")
+    )
+    tier_set: Mapped[str] = mapped_column(String(10))
+    # Recorded answers per tier_set, e.g. {"good": "LRL"}
+    decisions: Mapped[Dict[str, str]] = mapped_column(JSON, default=dict)
+    is_complete: Mapped[bool] = mapped_column(default=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    # Relationships
+    list: Mapped[List] = relationship("List", foreign_keys=[list_id])
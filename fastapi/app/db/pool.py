@@ -0,0 +1,133 @@
+"""Connection pool instrumentation."""
+
+import asyncio
+import threading
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from app.core.metrics import (
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTIONS,
+)
+
+
+class PoolMetrics:
+    """Checkout wait time and timeout counters for one pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited: float, timed_out: bool) -> None:
+        """Record one checkout attempt."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return the counters as a dictionary."""
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_avg": (
+                    self.wait_seconds_total / attempts if attempts else 0.0
+                ),
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+
+# Keyed by the pool's logging name so metrics survive engine.dispose(), which
+# replaces the pool object
+POOL_METRICS: Dict[str, PoolMetrics] = {}
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait."""
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        """Metrics shared by every pool with this pool's logging name."""
+        name = self._orig_logging_name or "default"
+        return POOL_METRICS.setdefault(name, PoolMetrics())
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start, timed_out=False)
+        return entry
+
+
+def get_pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    """Return live usage of an engine's connection pool."""
+    pool = engine.sync_engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+            }
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats.update(pool.metrics.snapshot())
+    return stats
+
+
+def record_pool_metrics(name: str, engine: AsyncEngine) -> None:
+    """Copy an engine's pool usage into the Prometheus gauges."""
+    stats = get_pool_stats(engine)
+    if "checked_out" not in stats:
+        return
+    DB_POOL_CONNECTIONS.set(stats["checked_out"], name, "checked_out")
+    DB_POOL_CONNECTIONS.set(stats["checked_in"], name, "checked_in")
+    DB_POOL_CONNECTIONS.set(stats["overflow"], name, "overflow")
+    if "timeouts" in stats:
+        DB_POOL_CHECKOUT_TIMEOUTS.set(stats["timeouts"], name)
+        DB_POOL_CHECKOUT_WAIT.set(stats["wait_seconds_total"], name)
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open pooled connections up front so early requests skip the handshake.
+
+    Args:
+        engine: Engine whose pool to fill
+        connections: How many connections to open, capped at the pool size
+
+    Returns:
+        Number of connections opened
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return 0
+    count = max(0, min(connections, pool.size()))
+    # Hold them all at once, otherwise the pool hands back the same connection
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(count))
+        )
+    return count
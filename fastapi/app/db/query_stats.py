@@ -0,0 +1,84 @@
+"""Per-request SQL statement accounting and query budgets."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+
+class QueryStats:
+    """Statements executed and time spent in the database."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+
+class QueryBudgetExceededError(AssertionError):
+    """An endpoint issued more statements than its declared budget."""
+
+
+# Set per request by the metrics middleware; SQLAlchemy copies the context
+# into the greenlets that run cursor events, so the hooks below see it
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(
+    conn: Any, cursor: Any, statement: Any, parameters: Any, context: Any, many: Any
+) -> None:
+    if current_query_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(
+    conn: Any, cursor: Any, statement: Any, parameters: Any, context: Any, many: Any
+) -> None:
+    stats = current_query_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is None or not started:
+        return
+    stats.count += 1
+    stats.seconds += time.perf_counter() - started.pop()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed inside the block."""
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+def query_budget(max_queries: int) -> Callable[[EndpointT], EndpointT]:
+    """
+    Declare the most statements an endpoint may issue per request.
+
+    Requests over budget are logged and counted in /metrics; with
+    QUERY_BUDGET_STRICT set (as in the test suite) they raise
+    QueryBudgetExceededError instead.
+    """
+
+    def decorate(endpoint: EndpointT) -> EndpointT:
+        setattr(endpoint, "query_budget", max_queries)
+        return endpoint
+
+    return decorate
+
+
+def get_query_budget(endpoint: Any) -> Optional[int]:
+    """Return the budget declared on an endpoint, if any."""
+    return getattr(endpoint, "query_budget", None)
@@ -1,15 +1,71 @@
-from sqlalchemy import text
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+from app import IMPORT_STARTED
 from app.api.api import api_router
-from app.db.database import create_tables
+from app.core.constants import PASSWORD_HASHING_BUSY_ERROR
+from app.core.health import HealthMonitor
+from app.core.images import image_store
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from app.core.read_your_writes import ReadYourWritesMiddleware
+from app.core.security import PasswordHashingBusyError, hashing_pool
+from app.core.startup import StartupTimer
+from app.core.traffic_capture import TrafficCaptureMiddleware, trace_writer
+from app.db.database import engine, replica_engine
+from app.db.migrations import verify_schema
+from app.db.pool import warm_pool
 from app.settings import settings
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+logger = logging.getLogger(__name__)
+
+health_monitor = HealthMonitor(
+    {"primary": engine, "replica": replica_engine},
+    interval_seconds=settings.HEALTH_CHECK_INTERVAL_SECONDS,
+    timeout_seconds=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Get a worker ready to serve, then release its resources on shutdown.
+
+    Startup only checks the schema revision and opens pooled connections;
+    migrations (make migrate) and dev users (make seed) are applied out of
+    band so restarts stay fast.
+    """
+    timer = StartupTimer()
+    timer.record("imports", time.perf_counter() - IMPORT_STARTED)
+    with timer.phase("schema_check"):
+        await verify_schema(engine)
+    with timer.phase("pool_warmup"):
+        await warm_pool(engine, settings.DB_POOL_WARMUP)
+        if replica_engine is not None:
+            await warm_pool(replica_engine, settings.DB_POOL_WARMUP)
+    logger.info("Startup %s", timer.summary())
+    health_monitor.start()
+
+    yield
+
+    await health_monitor.stop()
+    hashing_pool.shutdown()
+    image_store.shutdown()
+    trace_writer.close()
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
 
 app = FastAPI(
     title="Ranking App API",
     description="API for a ranking application that uses binary comparisons",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Set up CORS
@@ -21,14 +77,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Keep clients on the primary right after they write
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Record anonymized traces for replay benchmarks when TRAFFIC_CAPTURE_PATH is set
+app.add_middleware(TrafficCaptureMiddleware)
+
+# Outermost, so latency covers the whole stack
+app.add_middleware(MetricsMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix="/api")
 
 
-@app.on_event("startup")
-async def startup() -> None:
-    """Initialize application on startup."""
-    await create_tables()
+@app.exception_handler(PasswordHashingBusyError)
+async def password_hashing_busy_handler(
+    request: Request, exc: PasswordHashingBusyError
+) -> JSONResponse:
+    """Shed login and signup load when the hashing queue is full."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": PASSWORD_HASHING_BUSY_ERROR},
+        headers={"Retry-After": "1"},
+    )
 
 
 @app.get("/")
@@ -39,28 +110,48 @@ async def root() -> dict[str, str]:
 
 @app.get("/health")
 async def health_check() -> dict[str, str]:
-    """Health check endpoint for container monitoring."""
-    from app.db.database import engine
-
-    try:
-        # Check database connectivity
-        async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
-
-        return {
-            "status": "healthy",
-            "service": "tiernerd-backend",
-            "version": "0.1.0",
-            "database": "connected",
-        }
-    except Exception as e:
-        return {
-            "status": "unhealthy",
-            "service": "tiernerd-backend",
-            "version": "0.1.0",
-            "database": "disconnected",
-            "error": str(e),
-        }
+    """Health summary for container monitoring, from the cached check."""
+    snapshot = await health_monitor.current()
+    response = {
+        "status": "healthy" if snapshot.database_ok else "unhealthy",
+        "service": "tiernerd-backend",
+        "version": "0.1.0",
+        "database": "connected" if snapshot.database_ok else "disconnected",
+    }
+    if snapshot.errors:
+        response["error"] = "; ".join(snapshot.errors.values())
+    return response
+
+
+@app.get("/health/live")
+async def liveness() -> dict[str, str]:
+    """Liveness probe: the worker is up and its event loop is responsive."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness() -> JSONResponse:
+    """
+    Readiness probe: 503 while the database is down or the pool is saturated.
+
+    Answers from the background health check, so probes never touch the
+    database themselves.
+    """
+    result = await health_monitor.readiness()
+    return JSONResponse(
+        status_code=(
+            status.HTTP_200_OK
+            if result["ready"]
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        content={"status": "ready" if result["ready"] else "not_ready", **result},
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Prometheus scrape endpoint."""
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class ImageUpload(BaseModel):
+    """Schema for a stored image."""
+
+    image_id: str
+    # Use as an item's image_url
+    image_url: str
+    thumbnail_url: str
@@ -1,9 +1,12 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, computed_field
+from typing_extensions import TypedDict
+
+from app.core.images import thumbnail_url_for
 
 
 # Tier ranking enum
@@ -66,18 +69,54 @@ class Item(ItemBase):
     image_url: Optional[HttpUrl] = None
     prev_item_id: Optional[uuid.UUID] = None
     next_item_id: Optional[uuid.UUID] = None
+    position: Optional[int] = None
     rating: Optional[float] = None
     tier: Optional[TierRank] = None
     tier_set: Optional[TierSet] = None
     created_at: datetime
     updated_at: datetime
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def thumbnail_url(self) -> Optional[str]:
+        """Small cacheable variant of an uploaded image_url."""
+        return thumbnail_url_for(self.image_url)
+
     class Config:
         """Pydantic config."""
 
         from_attributes = True
 
 
+class ItemRow(TypedDict):
+    """
+    Item response as read from the database, with fields in Item's order.
+
+    Serializing rows through this skips validating values that were validated
+    on write, e.g. image_url is stored as the already normalized HttpUrl.
+    """
+
+    name: str
+    description: Optional[str]
+    image_url: Optional[str]
+    item_id: uuid.UUID
+    list_id: uuid.UUID
+    prev_item_id: Optional[uuid.UUID]
+    next_item_id: Optional[uuid.UUID]
+    position: Optional[int]
+    rating: Optional[float]
+    tier: Optional[str]
+    tier_set: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+class ItemResponseRow(ItemRow):
+    """ItemRow plus the fields Item computes, in the order Item dumps them."""
+
+    thumbnail_url: Optional[str]
+
+
 # Schema for comparison
 class Comparison(BaseModel):
     """Schema for comparison."""
@@ -99,6 +138,41 @@ class Comparison(BaseModel):
 # Schema for comparison
 ComparisonResult = Literal["better", "worse"]
 
+# Comparison fields that can be requested as full Item objects
+ComparisonExpansion = Literal["reference_item", "target_item"]
+
+
+class ItemSummary(BaseModel):
+    """Display fields of an item, sent for compact comparison steps."""
+
+    item_id: uuid.UUID
+    name: str
+    image_url: Optional[HttpUrl] = None
+    thumbnail_url: Optional[str] = None
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class ComparisonStep(BaseModel):
+    """
+    Schema for a comparison as returned to clients.
+
+    The reference item is the same for the whole session, so it is only
+    included when the session starts or when expanded; the target is a
+    summary unless expanded.
+    """
+
+    reference_item: Optional[Item] = None
+    target_item: Union[Item, ItemSummary]
+    comparison_index: int
+    min_index: int
+    max_index: int
+    is_winner: Optional[bool] = None
+    done: bool = False
+
 
 class ComparisonSession(BaseModel):
     """Schema for comparison session."""
@@ -106,7 +180,7 @@ class ComparisonSession(BaseModel):
     session_id: str
     list_id: uuid.UUID
     item_id: uuid.UUID
-    current_comparison: Optional[Comparison] = None
+    current_comparison: Optional[ComparisonStep] = None
     is_complete: bool = False
     created_at: datetime
     updated_at: datetime
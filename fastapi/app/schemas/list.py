@@ -1,9 +1,19 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.item import Item, TierSet
+
+
+class ExportFormat(str, Enum):
+    """Enum for export formats."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
 
 class TierDistribution(BaseModel):
     """Schema for tier distribution counts."""
@@ -73,3 +83,24 @@ class ListSimple(ListBase):
         """Pydantic config."""
 
         from_attributes = True
+
+
+# Schema for merging two ranked lists
+class MergeSession(BaseModel):
+    """Schema for merge session."""
+
+    session_id: str
+    list_id: UUID
+    source_list_id: UUID
+    tier_set: TierSet
+    left_item: Optional[Item] = None
+    right_item: Optional[Item] = None
+    comparisons_done: int = 0
+    is_complete: bool = False
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
@@ -78,3 +78,4 @@ class TokenPayload(BaseModel):
     """Schema for token payload."""
 
     sub: Optional[str] = None
+    iat: Optional[int] = None
@@ -1,3 +1,15 @@
-from app.services import comparison_service, list_service, ranking
+from app.services import (
+    comparison_service,
+    export_service,
+    list_service,
+    merge_service,
+    ranking,
+)
 
-__all__ = ["ranking", "list_service", "comparison_service"]
+__all__ = [
+    "ranking",
+    "list_service",
+    "comparison_service",
+    "merge_service",
+    "export_service",
+]
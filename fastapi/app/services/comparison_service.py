@@ -1,19 +1,31 @@
 """Comparison session business logic."""
 
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import AbstractSet, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.algorithm import find_next_comparison
+from app.core.images import thumbnail_url_for
+from app.core.metrics import (
+    RANKING_COMPARISONS_PER_INSERTION,
+    RANKING_FINALIZE_DURATION,
+)
 from app.crud import comparison as comparison_crud
 from app.crud import item as item_crud
 from app.db.models import ComparisonSession as ComparisonSessionModel
 from app.db.models import Item as ItemModel
-from app.schemas.item import Comparison, ComparisonSession
-from app.services.ranking import assign_tiers_for_set
+from app.schemas.item import (
+    Comparison,
+    ComparisonExpansion,
+    ComparisonSession,
+    ComparisonStep,
+    ItemSummary,
+)
+from app.services.ranking import assign_positions_for_set, assign_tiers_for_set
 from app.utils.helper import sort_items_linked_list_style
 
 logger = logging.getLogger(__name__)
@@ -24,7 +36,7 @@ async def start_comparison(
     new_item: ItemModel,
     list_id: uuid.UUID,
     tier_set: str,
-    ranked_items: List[ItemModel],
+    sorted_items: List[ItemModel],
 ) -> ComparisonSessionModel:
     """
     Start a new comparison session for ranking an item.
@@ -34,38 +46,80 @@ async def start_comparison(
         new_item: The new item being ranked
         list_id: ID of the list
         tier_set: The tier set (good, mid, bad)
-        ranked_items: Already ranked items in the same tier_set
+        sorted_items: Already ranked items in the same tier_set, sorted
+            lowest first with sort_items_linked_list_style
 
     Returns:
-        The created comparison session model
+        The created comparison session model, with its target item loaded
     """
-    all_items = sort_items_linked_list_style(ranked_items)  # type: ignore[arg-type]
-
-    middle = len(all_items) // 2
-    target_item = all_items[middle]
+    middle = len(sorted_items) // 2
+    target_item = sorted_items[middle]
 
-    session_id = uuid.uuid4()
+    # Timestamps are set here rather than by the server so the response can
+    # be built without reading the row back
+    now = datetime.now(timezone.utc)
     db_session = ComparisonSessionModel(
-        session_id=session_id,
+        session_id=uuid.uuid4(),
         list_id=list_id,
         new_item_id=new_item.item_id,
         target_item_id=target_item.item_id,
         tier_set=tier_set,
         min_index=0,
-        max_index=len(all_items) - 1,
+        max_index=len(sorted_items) - 1,
         comparison_index=middle,
         is_complete=False,
+        created_at=now,
+        updated_at=now,
     )
+    db_session.target_item = target_item
 
     await comparison_crud.create(db, db_session)
     return db_session
 
 
+def build_comparison_step(
+    comparison: Comparison, expand: AbstractSet[ComparisonExpansion]
+) -> ComparisonStep:
+    """
+    Trim a comparison down to what the client asked for.
+
+    Args:
+        comparison: The full comparison
+        expand: Fields to return as full Item objects; the reference item is
+            left out and the target item summarized otherwise
+
+    Returns:
+        ComparisonStep schema object
+    """
+    target_item = comparison.target_item
+    return ComparisonStep(
+        reference_item=(
+            comparison.reference_item if "reference_item" in expand else None
+        ),
+        target_item=(
+            target_item
+            if "target_item" in expand
+            else ItemSummary(
+                item_id=target_item.item_id,
+                name=target_item.name,
+                image_url=target_item.image_url,
+                thumbnail_url=thumbnail_url_for(target_item.image_url),
+            )
+        ),
+        comparison_index=comparison.comparison_index,
+        min_index=comparison.min_index,
+        max_index=comparison.max_index,
+        is_winner=comparison.is_winner,
+        done=comparison.done,
+    )
+
+
 def build_comparison_session_response(
     db_session: ComparisonSessionModel,
     new_item: ItemModel,
     target_item: Optional[ItemModel],
     comparison: Optional[Comparison] = None,
+    expand: AbstractSet[ComparisonExpansion] = frozenset(),
 ) -> ComparisonSession:
     """
     Build a ComparisonSession response from database models.
@@ -75,6 +129,7 @@ def build_comparison_session_response(
         new_item: The new item being ranked
         target_item: The current target item for comparison
         comparison: Optional pre-built comparison object
+        expand: Comparison fields to return as full Item objects
 
     Returns:
         ComparisonSession schema object
@@ -94,7 +149,9 @@ def build_comparison_session_response(
         session_id=str(db_session.session_id),
         list_id=db_session.list_id,
         item_id=db_session.new_item_id,
-        current_comparison=comparison,
+        current_comparison=(
+            build_comparison_step(comparison, expand) if comparison else None
+        ),
         is_complete=db_session.is_complete,
         created_at=db_session.created_at,
         updated_at=db_session.updated_at,
@@ -157,33 +214,42 @@ async def finalize_comparison(
         list_id: ID of the list
         tier_set: The tier set (good, mid, bad)
     """
-    # Set reference item pointers
-    if comparison.is_winner:
-        new_item.prev_item_id = comparison.target_item.item_id
-        new_item.next_item_id = comparison.target_item.next_item_id
-    else:
-        new_item.next_item_id = comparison.target_item.item_id
-        new_item.prev_item_id = comparison.target_item.prev_item_id
-
-    new_item.updated_at = datetime.now(timezone.utc)
-    db.add(new_item)
-    await db.flush()
+    start = time.perf_counter()
+    all_set_items = await item_crud.get_by_list_and_tier_set(db, list_id, tier_set)
+    items_by_id = {item.item_id: item for item in all_set_items}
 
-    # Update target item pointer
+    # The final comparison may point at a different item than the session's
+    # stored target, so link against the item the comparison settled on
+    anchor = items_by_id.get(comparison.target_item.item_id, target_item)
+    now = datetime.now(timezone.utc)
     if comparison.is_winner:
-        target_item.next_item_id = new_item.item_id
+        neighbour = items_by_id.get(anchor.next_item_id)  # type: ignore[arg-type]
+        new_item.prev_item_id = anchor.item_id
+        new_item.next_item_id = anchor.next_item_id
+        anchor.next_item_id = new_item.item_id
+        if neighbour is not None:
+            neighbour.prev_item_id = new_item.item_id
     else:
-        target_item.prev_item_id = new_item.item_id
-    target_item.updated_at = datetime.now(timezone.utc)
+        neighbour = items_by_id.get(anchor.prev_item_id)  # type: ignore[arg-type]
+        new_item.next_item_id = anchor.item_id
+        new_item.prev_item_id = anchor.prev_item_id
+        anchor.prev_item_id = new_item.item_id
+        if neighbour is not None:
+            neighbour.next_item_id = new_item.item_id
 
+    for changed in (new_item, anchor, neighbour):
+        if changed is not None:
+            changed.updated_at = now
     await db.flush()
 
-    # Recalculate tiers for all items in this tier_set
-    all_set_items = await item_crud.get_by_list_and_tier_set(db, list_id, tier_set)
-
+    # Recalculate tiers and positions for all items in this tier_set
     try:
         sorted_items = sort_items_linked_list_style(all_set_items)  # type: ignore[arg-type]
         assign_tiers_for_set(sorted_items, tier_set)  # type: ignore[arg-type]
+        # The ORM only batches UPDATEs of rows changing the same columns, so
+        # tiers and positions are flushed apart to keep this to two statements
+        await db.flush()
+        assign_positions_for_set(sorted_items)  # type: ignore[arg-type]
     except ValueError as e:
         logger.warning(
             "Failed to assign tiers for list_id=%s, tier_set=%s: %s",
@@ -194,3 +260,5 @@ async def finalize_comparison(
 
     # Mark session as complete
     await comparison_crud.mark_complete(db, db_session)
+    RANKING_COMPARISONS_PER_INSERTION.observe(db_session.comparison_count)
+    RANKING_FINALIZE_DURATION.observe(time.perf_counter() - start)
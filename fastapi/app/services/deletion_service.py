@@ -0,0 +1,55 @@
+"""Deleting lists in chunks, for lists too large for one transaction."""
+
+import logging
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud import item as item_crud
+from app.crud import list as list_crud
+
+logger = logging.getLogger(__name__)
+
+
+async def delete_list_in_chunks(
+    db: AsyncSession, list_id: uuid.UUID, chunk_size: int
+) -> int:
+    """
+    Delete a list, removing its items in separately committed chunks first.
+
+    Args:
+        db: Database session
+        list_id: ID of the list
+        chunk_size: Items deleted per transaction
+
+    Returns:
+        Number of items deleted
+    """
+    deleted = await item_crud.delete_in_chunks(db, [list_id], chunk_size)
+    list_obj = await list_crud.get_by_id(db, list_id)
+    if list_obj is not None:
+        await list_crud.delete(db, list_obj)
+    return deleted
+
+
+async def run_list_deletion(
+    session_factory: async_sessionmaker[AsyncSession],
+    list_id: uuid.UUID,
+    chunk_size: int,
+) -> None:
+    """Background task deleting a large list in its own session."""
+    start = time.perf_counter()
+    try:
+        async with session_factory() as db:
+            deleted = await delete_list_in_chunks(db, list_id, chunk_size)
+    except Exception:  # pylint: disable=broad-except
+        # Chunks already committed stay deleted; deleting again resumes
+        logger.exception("Background deletion of list %s failed", list_id)
+        return
+    logger.info(
+        "Deleted list %s with %d items in %.1fs",
+        list_id,
+        deleted,
+        time.perf_counter() - start,
+    )
@@ -0,0 +1,98 @@
+"""Streaming export of lists and items."""
+
+import csv
+import io
+import json
+import uuid
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import item as item_crud
+from app.schemas.list import ExportFormat
+from app.services.ranking import TIER_SET_ORDER
+
+# Rows fetched per round trip while streaming
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_COLUMNS = (
+    "list_id",
+    "list_title",
+    "item_id",
+    "name",
+    "description",
+    "image_url",
+    "tier_set",
+    "tier",
+    "position",
+    "rating",
+    "created_at",
+    "updated_at",
+)
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _to_text(value: Any) -> Any:
+    """Convert UUIDs and datetimes to strings, leaving JSON-native values alone."""
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def format_export_row(row: Any) -> Dict[str, Any]:
+    """
+    Build an export record from a streamed row.
+
+    Args:
+        row: Row with the EXPORT_COLUMNS fields
+
+    Returns:
+        Dictionary of JSON-serializable values keyed by column name
+    """
+    return {column: _to_text(value) for column, value in zip(EXPORT_COLUMNS, row)}
+
+
+async def stream_export(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    export_format: ExportFormat,
+    list_id: Optional[uuid.UUID] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream a user's items as NDJSON or CSV, one chunk per fetched batch.
+
+    Args:
+        db: Database session, kept open until the response is fully sent
+        user_id: ID of the user whose lists are exported
+        export_format: Output format
+        list_id: Only export this list
+
+    Yields:
+        Encoded chunks of the export
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == ExportFormat.CSV:
+        writer.writerow(EXPORT_COLUMNS)
+        # Send the header before the query starts returning rows
+        yield buffer.getvalue().encode()
+
+    async for rows in item_crud.stream_export_rows(
+        db, user_id, TIER_SET_ORDER, list_id=list_id, batch_size=EXPORT_BATCH_SIZE
+    ):
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            record = format_export_row(row)
+            if export_format == ExportFormat.CSV:
+                writer.writerow(record.values())
+            else:
+                buffer.write(json.dumps(record, ensure_ascii=False))
+                buffer.write("\n")
+        yield buffer.getvalue().encode()
@@ -1,17 +1,40 @@
 """List-related business logic."""
 
-from typing import Any, Dict, List, Optional, Tuple
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from app.db.models import Item as ItemModel
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.images import thumbnail_url_for
+from app.crud import item as item_crud
+from app.crud import list as list_crud
+from app.schemas.item import ItemResponseRow, ItemRow
+from app.schemas.list import ListSimple
+from app.services.ranking import TIER_SET_ORDER, get_tier_set_for_tier
 from app.utils.helper import sort_items_linked_list_style
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# Page size for windowed item reads
+ITEMS_WINDOW_DEFAULT_LIMIT = 50
+ITEMS_WINDOW_MAX_LIMIT = 500
+
+# Precompiled serializers for list read responses
+ITEM_ROWS_ADAPTER = TypeAdapter(List[ItemResponseRow])
+# Row._asdict() goes through the row's key map on every call; zipping the
+# fixed column order is several times cheaper per row
+ITEM_RESPONSE_KEYS = tuple(ItemResponseRow.__annotations__)
+IMAGE_URL_INDEX = tuple(ItemRow.__annotations__).index("image_url")
+LIST_SUMMARIES_ADAPTER = TypeAdapter(List[ListSimple])
 
 
-def group_items_by_tier_set(items: List[ItemModel]) -> Dict[Optional[str], List]:
+def group_items_by_tier_set(items: Sequence[Any]) -> Dict[Optional[str], List]:
     """
     Group items by their tier_set value.
 
     Args:
-        items: List of items to group
+        items: Items or item rows to group
 
     Returns:
         Dictionary mapping tier_set to list of items
@@ -25,14 +48,14 @@ def group_items_by_tier_set(items: List[ItemModel]) -> Dict[Optional[str], List]
     return groups
 
 
-def get_items_sorted_by_tier_set(items: List[ItemModel]) -> List[ItemModel]:
+def get_items_sorted_by_tier_set(items: Sequence[Any]) -> List[Any]:
     """
     Sort items by their tier_set's linked list order.
     Each tier_set has its own linked list, so we sort each group separately
     and then combine them.
 
     Args:
-        items: List of items to sort
+        items: Items or item rows to sort
 
     Returns:
         List of items sorted by tier_set linked list order
@@ -56,6 +79,83 @@ def get_items_sorted_by_tier_set(items: List[ItemModel]) -> List[ItemModel]:
     return all_sorted
 
 
+async def get_ranked_items_window(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    db: AsyncSession,
+    list_id: uuid.UUID,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    tier_set: Optional[str] = None,
+    tier: Optional[str] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    Fetch one window of ranked item rows, ordered by tier_set and then position.
+
+    Only the rows in the window are read: each tier_set is an index range on
+    position, so a cursor resumes with a seek instead of re-reading earlier rows.
+
+    Args:
+        db: Database session
+        list_id: ID of the list
+        limit: Maximum number of items to return
+        offset: Number of ranked items to skip (ignored when a cursor is given)
+        cursor: Opaque cursor returned with the previous window
+        tier_set: Only return items of this tier_set
+        tier: Only return items of this tier
+
+    Returns:
+        Tuple of (item rows in the window, cursor for the next window or None)
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    tier_sets = list(TIER_SET_ORDER)
+    if tier_set is not None:
+        tier_sets = [ts for ts in tier_sets if ts == tier_set]
+    if tier is not None:
+        tier_sets = [ts for ts in tier_sets if ts == get_tier_set_for_tier(tier)]
+
+    cursor_tier_set: Optional[str] = None
+    after_position: Optional[int] = None
+    if cursor is not None:
+        cursor_tier_set, after_position = decode_cursor(cursor, 2)
+        if cursor_tier_set not in TIER_SET_ORDER or not isinstance(after_position, int):
+            raise ValueError("Malformed cursor")
+        start = TIER_SET_ORDER.index(cursor_tier_set)
+        tier_sets = [ts for ts in tier_sets if TIER_SET_ORDER.index(ts) >= start]
+        offset = 0
+    elif offset:
+        # Skip whole tier_sets using their counts, then offset into the next one
+        counts = await item_crud.count_ranked_by_tier_set(db, list_id, tier)
+        while tier_sets and offset >= counts.get(tier_sets[0], 0):
+            offset -= counts.get(tier_sets.pop(0), 0)
+
+    items: List[Row] = []
+    for current_set in tier_sets:
+        remaining = limit - len(items)
+        if remaining <= 0:
+            break
+        items.extend(
+            await item_crud.get_ranked_window(
+                db,
+                list_id,
+                current_set,
+                remaining,
+                offset=offset,
+                after_position=(
+                    after_position if current_set == cursor_tier_set else None
+                ),
+                tier=tier,
+            )
+        )
+        offset = 0
+
+    next_cursor = None
+    if items and len(items) == limit:
+        next_cursor = encode_cursor(items[-1].tier_set, items[-1].position)
+    return items, next_cursor
+
+
 def build_list_response(list_obj: Any, items: Optional[List] = None) -> Dict:
     """
     Build a standard list response dictionary.
@@ -110,3 +210,70 @@ def build_list_simple_response(row: Tuple) -> Dict:
         "item_count": item_count,
         "tier_distribution": tier_distribution,
     }
+
+
+def serialize_items(rows: Sequence[Row]) -> bytes:
+    """
+    Encode item rows as the JSON body of an Item list response.
+
+    Rows from item_crud's row queries are dumped straight to bytes, without
+    building Item models; the output matches the Item response model.
+
+    Args:
+        rows: Rows with ITEM_ROW_COLUMNS, in response order
+
+    Returns:
+        UTF-8 encoded JSON array
+    """
+    return ITEM_ROWS_ADAPTER.dump_json(
+        [
+            dict(  # type: ignore[misc]
+                zip(
+                    ITEM_RESPONSE_KEYS,
+                    (*row, thumbnail_url_for(row[IMAGE_URL_INDEX])),
+                )
+            )
+            for row in rows
+        ]
+    )
+
+
+def serialize_list_summaries(summaries: List[Dict]) -> bytes:
+    """
+    Encode list summaries as the JSON body of a ListSimple list response.
+
+    Args:
+        summaries: Dictionaries built by build_list_simple_response
+
+    Returns:
+        UTF-8 encoded JSON array
+    """
+    return LIST_SUMMARIES_ADAPTER.dump_json(
+        LIST_SUMMARIES_ADAPTER.validate_python(summaries)
+    )
+
+
+async def reconcile_list_counters(
+    db: AsyncSession, repair: bool = False
+) -> Dict[uuid.UUID, Dict[str, Dict[str, int]]]:
+    """
+    Compare every list's stored counters with a recount of its items.
+
+    Args:
+        db: Database session
+        repair: Overwrite drifted counters with the recounted values
+
+    Returns:
+        Dictionary mapping drifted list IDs to their stored and actual counters
+    """
+    stored = await list_crud.get_counters(db)
+    actual = await list_crud.count_items_by_list(db)
+    drift = {
+        list_id: {"stored": stored[list_id], "actual": counts}
+        for list_id, counts in actual.items()
+        if stored.get(list_id) != counts
+    }
+    if repair:
+        for list_id, counters in drift.items():
+            await list_crud.set_counters(db, list_id, counters["actual"])
+    return drift
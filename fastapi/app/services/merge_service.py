@@ -0,0 +1,232 @@
+"""Merge session business logic."""
+
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.algorithm import (
+    MERGE_TAKE_LEFT,
+    MERGE_TAKE_RIGHT,
+    find_next_merge_pair,
+    merge_by_decisions,
+)
+from app.crud import comparison as comparison_crud
+from app.crud import item as item_crud
+from app.crud import merge as merge_crud
+from app.db.models import Item as ItemModel
+from app.db.models import List as ListModel
+from app.db.models import MergeSession as MergeSessionModel
+from app.schemas.list import MergeSession
+from app.services.ranking import (
+    TIER_SET_ORDER,
+    assign_positions_for_set,
+    assign_tiers_for_set,
+    filter_ranked_items,
+)
+from app.utils.helper import sort_items_linked_list_style
+
+
+async def get_ranked_chain(
+    db: AsyncSession, list_id: uuid.UUID, tier_set: str
+) -> List[ItemModel]:
+    """
+    Get the ranked items of a tier_set sorted from lowest to highest.
+
+    Args:
+        db: Database session
+        list_id: ID of the list
+        tier_set: The tier set (good, mid, bad)
+
+    Returns:
+        Ranked items in linked list order, or unsorted if the chain is broken
+    """
+    set_items = await item_crud.get_by_list_and_tier_set(db, list_id, tier_set)
+    ranked_items = filter_ranked_items(set_items)
+    try:
+        return sort_items_linked_list_style(ranked_items)
+    except ValueError:
+        return ranked_items
+
+
+async def start_merge(
+    db: AsyncSession, list_id: uuid.UUID, source_list_id: uuid.UUID
+) -> MergeSessionModel:
+    """
+    Start a new merge session of a source list into a destination list.
+
+    Args:
+        db: Database session
+        list_id: ID of the destination list
+        source_list_id: ID of the list whose items are merged in
+
+    Returns:
+        The created merge session model
+    """
+    now = datetime.now(timezone.utc)
+    db_session = MergeSessionModel(
+        session_id=uuid.uuid4(),
+        list_id=list_id,
+        source_list_id=source_list_id,
+        tier_set=TIER_SET_ORDER[0],
+        decisions={},
+        is_complete=False,
+        created_at=now,
+        updated_at=now,
+    )
+    await merge_crud.create(db, db_session)
+    return db_session
+
+
+async def find_merge_pair(
+    db: AsyncSession, db_session: MergeSessionModel
+) -> Optional[Tuple[str, ItemModel, ItemModel]]:
+    """
+    Find the pair awaiting an answer without changing the session.
+
+    Safe on read-only sessions; the tier_set of the pair may be later than the
+    session's if the current one is exhausted.
+
+    Args:
+        db: Database session
+        db_session: The merge session
+
+    Returns:
+        Tuple of (tier_set, destination item, source item), or None when
+        nothing is left
+    """
+    start = TIER_SET_ORDER.index(db_session.tier_set)
+    for tier_set in TIER_SET_ORDER[start:]:
+        left = await get_ranked_chain(db, db_session.list_id, tier_set)
+        right = await get_ranked_chain(db, db_session.source_list_id, tier_set)
+        pair = find_next_merge_pair(
+            len(left), len(right), db_session.decisions.get(tier_set, "")
+        )
+        if pair is not None:
+            return tier_set, left[pair[0]], right[pair[1]]
+    return None
+
+
+async def get_next_merge_pair(
+    db: AsyncSession, db_session: MergeSessionModel
+) -> Optional[Tuple[ItemModel, ItemModel]]:
+    """
+    Get the next (left, right) pair the user has to compare.
+
+    Tier sets are merged one after another; the session moves on to the next
+    tier_set as soon as one side of the current one is exhausted.
+
+    Args:
+        db: Database session
+        db_session: The merge session
+
+    Returns:
+        Tuple of (destination item, source item), or None when nothing is left
+    """
+    found = await find_merge_pair(db, db_session)
+    if found is None:
+        return None
+    tier_set, left, right = found
+    if tier_set != db_session.tier_set:
+        await merge_crud.update(db, db_session, tier_set, db_session.decisions)
+    return left, right
+
+
+async def record_merge_decision(
+    db: AsyncSession, db_session: MergeSessionModel, left_is_better: bool
+) -> MergeSessionModel:
+    """
+    Record the answer for the current pair of a merge session.
+
+    The lower ranked item of the pair is placed next, so a better left item
+    means the right item is taken from its chain.
+
+    Args:
+        db: Database session
+        db_session: The merge session
+        left_is_better: Whether the destination item beat the source item
+
+    Returns:
+        The updated merge session model
+    """
+    decision = MERGE_TAKE_RIGHT if left_is_better else MERGE_TAKE_LEFT
+    decisions = dict(db_session.decisions)
+    decisions[db_session.tier_set] = decisions.get(db_session.tier_set, "") + decision
+    return await merge_crud.update(db, db_session, db_session.tier_set, decisions)
+
+
+async def finalize_merge(
+    db: AsyncSession, db_session: MergeSessionModel, source_list: ListModel
+) -> None:
+    """
+    Write the merged chains, tiers and list membership, then drop the source list.
+
+    All changes are flushed together so the caller commits them in a single
+    transaction.
+
+    Args:
+        db: Database session
+        db_session: The merge session
+        source_list: The list whose items were merged in
+    """
+    now = datetime.now(timezone.utc)
+    for tier_set in TIER_SET_ORDER:
+        left = await get_ranked_chain(db, db_session.list_id, tier_set)
+        right = await get_ranked_chain(db, db_session.source_list_id, tier_set)
+        merged = merge_by_decisions(left, right, db_session.decisions.get(tier_set, ""))
+        for index, item in enumerate(merged):
+            item.list_id = db_session.list_id
+            item.prev_item_id = merged[index - 1].item_id if index > 0 else None
+            item.next_item_id = (
+                merged[index + 1].item_id if index + 1 < len(merged) else None
+            )
+            item.updated_at = now
+        assign_tiers_for_set(merged, tier_set)
+        assign_positions_for_set(merged)
+
+    # Unranked leftovers of the source list move over unchanged
+    for item in await item_crud.get_by_list_id(db, db_session.source_list_id):
+        item.list_id = db_session.list_id
+        item.updated_at = now
+
+    await db.flush()
+    await comparison_crud.reassign_list(
+        db, db_session.source_list_id, db_session.list_id
+    )
+    await merge_crud.mark_complete(db, db_session)
+    # The session row goes with the source list (ON DELETE CASCADE)
+    await db.delete(source_list)
+    await db.flush()
+
+
+def build_merge_session_response(
+    db_session: MergeSessionModel,
+    left_item: Optional[ItemModel] = None,
+    right_item: Optional[ItemModel] = None,
+    tier_set: Optional[str] = None,
+) -> MergeSession:
+    """
+    Build a MergeSession response from database models.
+
+    Args:
+        db_session: The merge session model
+        left_item: The destination item of the current pair
+        right_item: The source item of the current pair
+        tier_set: The tier_set of the pair, if ahead of the session's
+
+    Returns:
+        MergeSession schema object
+    """
+    return MergeSession(
+        session_id=str(db_session.session_id),
+        list_id=db_session.list_id,
+        source_list_id=db_session.source_list_id,
+        tier_set=tier_set or db_session.tier_set,  # type: ignore[arg-type]
+        left_item=left_item,  # type: ignore[arg-type]
+        right_item=right_item,  # type: ignore[arg-type]
+        comparisons_done=sum(len(d) for d in db_session.decisions.values()),
+        is_complete=db_session.is_complete,
+        created_at=db_session.created_at,
+        updated_at=db_session.updated_at,
+    )
@@ -12,6 +12,9 @@ TIER_SET_MAP = {
     "bad": ("D", "F"),
 }
 
+# Order in which tier_sets are listed and merged
+TIER_SET_ORDER = tuple(TIER_SET_MAP)
+
 # Initial tier for first item in each tier_set (lower tier)
 INITIAL_TIER_MAP = {
     "good": "A",
@@ -52,6 +55,25 @@ def assign_tiers_for_set(sorted_items: List[ItemModel], tier_set: str) -> None:
             item.tier = high_tier
 
 
+def get_tier_set_for_tier(tier: str) -> Optional[str]:
+    """Get the tier_set a tier belongs to."""
+    for tier_set, tiers in TIER_SET_MAP.items():
+        if tier in tiers:
+            return tier_set
+    return None
+
+
+def assign_positions_for_set(sorted_items: List[ItemModel]) -> None:
+    """
+    Store each item's rank within its tier_set, matching the linked list order.
+
+    Args:
+        sorted_items: Items sorted from lowest to highest rank
+    """
+    for i, item in enumerate(sorted_items):
+        item.position = i
+
+
 def filter_ranked_items(
     items: List[ItemModel], exclude_id: Optional[uuid.UUID] = None
 ) -> List[ItemModel]:
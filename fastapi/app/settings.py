@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Optional, Union
 
 from pydantic import AnyHttpUrl, PostgresDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,12 +17,72 @@ class Settings(BaseSettings):
     # Database - allow string for test mode (SQLite)
     DATABASE_URL: Union[PostgresDsn, str]
 
+    # Connection pool per worker process (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PRE_PING: bool = True
+    # Connections each worker opens before it starts serving (capped at
+    # DB_POOL_SIZE)
+    DB_POOL_WARMUP: int = 2
+
+    # Health probes answer from a background check run on this interval
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+
+    # Optional read replica for read-only endpoints. Clients stay on the primary
+    # for this many seconds after a write so they see their own changes.
+    DATABASE_REPLICA_URL: Optional[str] = None
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # Report statement counts and DB time in X-DB-Queries / X-DB-Time-Ms
+    QUERY_STATS_HEADERS: bool = True
+    # Raise instead of logging when an endpoint exceeds its query budget
+    QUERY_BUDGET_STRICT: bool = False
+
+    # Append anonymized request traces to this JSONL file for
+    # scripts/replay_traffic.py ({pid} gives each worker its own file)
+    TRAFFIC_CAPTURE_PATH: Optional[str] = None
+
     # CORS
     CORS_ORIGINS: List[AnyHttpUrl] = []
 
     # Logging
     LOG_LEVEL: str = "INFO"
 
+    # Encoded response cache for list reads (0 disables it)
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # Authenticated user cache; the TTL bounds staleness across workers
+    # (0 disables it)
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # Argon2 runs on this many threads; requests beyond the queue limit get 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32
+
+    # Deleting a list removes its items in the same statement (ON DELETE
+    # CASCADE). Lists with at least DELETE_IN_BACKGROUND_MIN_ITEMS items are
+    # instead emptied by a background job, DELETE_CHUNK_SIZE rows per
+    # transaction (0 disables it).
+    DELETE_IN_BACKGROUND_MIN_ITEMS: int = 0
+    DELETE_CHUNK_SIZE: int = 1000
+
+    # Uploaded images, stored by content hash. Thumbnails fit in a square of
+    # IMAGE_THUMBNAIL_SIZE pixels and need the "images" extra (Pillow).
+    IMAGE_STORAGE_DIR: str = "data/images"
+    IMAGE_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    IMAGE_THUMBNAIL_SIZE: int = 320
+    IMAGE_THUMBNAIL_WORKERS: int = 2
+
+    # Argon2 cost, written by scripts/calibrate_argon2.py (unset uses passlib's
+    # defaults). Memory is in KiB.
+    ARGON2_TIME_COST: Optional[int] = None
+    ARGON2_MEMORY_COST: Optional[int] = None
+    ARGON2_PARALLELISM: Optional[int] = None
+
     model_config = SettingsConfigDict(
         env_file=(".env", ".env.local"), case_sensitive=True, extra="ignore"
     )
@@ -1,5 +1,7 @@
+import time
 from typing import List
 
+from app.core.metrics import RANKING_SORT_DURATION
 from app.db.models import Item as ItemModel
 
 
@@ -12,6 +14,15 @@ def sort_items_linked_list_style(all_items: List[ItemModel]) -> List[ItemModel]:
     if not all_items:
         return []
 
+    start = time.perf_counter()
+    try:
+        return _walk_linked_list(all_items)
+    finally:
+        RANKING_SORT_DURATION.observe(time.perf_counter() - start)
+
+
+def _walk_linked_list(all_items: List[ItemModel]) -> List[ItemModel]:
+    """Follow next_item_id pointers from the head item."""
     # Map from item_id to item
     id_to_next_item = {item.item_id: item for item in all_items}
 
@@ -0,0 +1,51 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Tuple
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor created by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or has the wrong number of values
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Malformed cursor")
+    return values
+
+
+def encode_keyset_cursor(timestamp: datetime, row_id: uuid.UUID) -> str:
+    """
+    Encode a (timestamp, id) sort key as an opaque cursor.
+    """
+    return encode_cursor(timestamp.isoformat(), str(row_id))
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor created by encode_keyset_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    timestamp, row_id = decode_cursor(cursor, 2)
+    if not isinstance(timestamp, str) or not isinstance(row_id, str):
+        raise ValueError("Malformed cursor")
+    return datetime.fromisoformat(timestamp), uuid.UUID(row_id)
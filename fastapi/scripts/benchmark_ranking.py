@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ranking hot paths.
+
+Times sort_items_linked_list_style, find_next_comparison,
+assign_tiers_for_set, filter_ranked_items and get_items_sorted_by_tier_set on
+synthetic items from 10 to 1M, records peak allocations, and saves the
+results as JSON. Pass --compare with an earlier file to flag regressions.
+Run with: make bench (or python scripts/benchmark_ranking.py --max-size 10000)
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.algorithm import find_next_comparison  # noqa: E402
+from app.schemas.item import Comparison  # noqa: E402
+from app.services.list_service import get_items_sorted_by_tier_set  # noqa: E402
+from app.services.ranking import (  # noqa: E402
+    TIER_SET_MAP,
+    assign_tiers_for_set,
+    filter_ranked_items,
+)
+from app.utils.helper import sort_items_linked_list_style  # noqa: E402
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+# Share of a list's items in each tier set, and of items still being ranked
+TIER_SET_MIX = {"good": 0.3, "mid": 0.5, "bad": 0.2}
+UNRANKED_SHARE = 0.01
+DEFAULT_OUTPUT = Path(__file__).parent.parent / "benchmarks" / "ranking.json"
+DEFAULT_THRESHOLD = 1.25
+
+Results = Dict[str, Dict[str, Dict[str, float]]]
+
+
+class SyntheticItem:
+    """Plain object with the attributes the ranking code reads and writes."""
+
+    __slots__ = (
+        "item_id",
+        "list_id",
+        "prev_item_id",
+        "next_item_id",
+        "tier",
+        "tier_set",
+        "position",
+    )
+
+    def __init__(self, list_id: uuid.UUID, tier_set: str) -> None:
+        self.item_id = uuid.uuid4()
+        self.list_id = list_id
+        self.prev_item_id: Optional[uuid.UUID] = None
+        self.next_item_id: Optional[uuid.UUID] = None
+        self.tier: Optional[str] = None
+        self.tier_set = tier_set
+        self.position: Optional[int] = None
+
+
+def make_tier_set(size: int, tier_set: str, rng: random.Random) -> List[Any]:
+    """Build one tier set's ranked chain, returned in random (database) order."""
+    list_id = uuid.uuid4()
+    items = [SyntheticItem(list_id, tier_set) for _ in range(size)]
+    for lower, higher in zip(items, items[1:]):
+        lower.next_item_id = higher.item_id
+        higher.prev_item_id = lower.item_id
+    assign_tiers_for_set(items, tier_set)  # type: ignore[arg-type]
+    rng.shuffle(items)
+    return items
+
+
+def make_list(size: int, rng: random.Random) -> List[Any]:
+    """Build a whole list with the usual tier set mix, in random order."""
+    items: List[Any] = []
+    for tier_set, share in TIER_SET_MIX.items():
+        items.extend(make_tier_set(max(1, int(size * share)), tier_set, rng))
+    rng.shuffle(items)
+    return items
+
+
+def make_mixed(size: int, rng: random.Random) -> List[Any]:
+    """Build a list where a few items are still waiting for comparisons."""
+    items = make_list(size, rng)
+    for item in rng.sample(items, max(1, int(len(items) * UNRANKED_SHARE))):
+        item.tier = None
+    return items
+
+
+def make_comparison(items: Sequence[Any]) -> Comparison:
+    """Build a mid-search comparison without validating the synthetic items."""
+    middle = len(items) // 2
+    return Comparison.model_construct(
+        reference_item=items[0],
+        target_item=items[middle],
+        min_index=0,
+        comparison_index=middle,
+        max_index=len(items) - 1,
+        is_winner=True,
+        done=False,
+    )
+
+
+def benchmark_cases(size: int, seed: int = 0) -> Dict[str, Callable[[], Any]]:
+    """Return the functions to time for one size, with their inputs prepared."""
+    rng = random.Random(seed)
+    chain = make_tier_set(size, "good", rng)
+    ordered = sort_items_linked_list_style(chain)
+    # Unranked items keep their links, so one list serves both list benchmarks
+    whole_list = make_mixed(size, rng)
+    excluded = whole_list[0].item_id
+
+    return {
+        "sort_items_linked_list_style": lambda: sort_items_linked_list_style(chain),
+        "find_next_comparison": lambda: find_next_comparison(
+            ordered, make_comparison(ordered)
+        ),
+        "assign_tiers_for_set": lambda: assign_tiers_for_set(ordered, "good"),
+        "filter_ranked_items": lambda: filter_ranked_items(whole_list, excluded),
+        "get_items_sorted_by_tier_set": lambda: get_items_sorted_by_tier_set(
+            whole_list
+        ),
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Time a call and record the memory it allocates."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    per_call = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "calls": number * repeat,
+        "min_us": min(per_call) * 1e6,
+        "median_us": statistics.median(per_call) * 1e6,
+        "peak_alloc_bytes": peak - baseline,
+        "retained_bytes": current - baseline,
+    }
+
+
+def run(sizes: Sequence[int], repeat: int) -> Results:
+    """Benchmark every case at every size."""
+    results: Results = {}
+    for size in sizes:
+        for name, fn in benchmark_cases(size).items():
+            stats = measure(fn, repeat)
+            results.setdefault(name, {})[str(size)] = stats
+            print(
+                f"{name:<30} {size:>9,}  {stats['median_us']:>12.1f} us"
+                f"  {stats['peak_alloc_bytes'] / 1024:>10.1f} KiB"
+            )
+    return results
+
+
+def compare(current: Results, baseline: Results, threshold: float) -> List[str]:
+    """Return the cases whose median time grew by more than the threshold."""
+    regressions = []
+    for name, by_size in current.items():
+        for size, stats in by_size.items():
+            previous = baseline.get(name, {}).get(size)
+            if not previous or not previous["median_us"]:
+                continue
+            ratio = stats["median_us"] / previous["median_us"]
+            if ratio > threshold:
+                regressions.append(
+                    f"{name} at {size}: {previous['median_us']:.1f} us -> "
+                    f"{stats['median_us']:.1f} us ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmarks, save them and optionally compare with a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    sizes = [size for size in SIZES if size <= args.max_size]
+    results = run(sizes, args.repeat)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(
+            {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+                "tier_sets": sorted(TIER_SET_MAP),
+                "results": results,
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions over {args.threshold:.2f}x against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Calibrate Argon2 cost for this machine.
+
+Benchmarks hashing on the local CPU and writes the ARGON2_* settings that
+keep one hash under the target latency. Existing hashes with other
+parameters are upgraded on the user's next login.
+Run with: make calibrate (or python scripts/calibrate_argon2.py --target-ms 150)
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.security import build_pwd_context  # noqa: E402
+
+# Never go below OWASP's minimum of 19 MiB of memory
+MIN_MEMORY_KIB = 19 * 1024
+MAX_TIME_COST = 10
+SAMPLE_PASSWORD = "calibration-password"
+
+# (time_cost, memory_kib, parallelism) -> seconds per hash
+Measure = Callable[[int, int, int], float]
+
+
+def measure_hash(time_cost: int, memory_kib: int, parallelism: int) -> float:
+    """Return the median time in seconds to hash a password with these costs."""
+    context = build_pwd_context(time_cost, memory_kib, parallelism)
+    samples = []
+    for _ in range(3):
+        start = time.perf_counter()
+        context.hash(SAMPLE_PASSWORD)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def calibrate(
+    target_seconds: float,
+    parallelism: int,
+    max_memory_kib: int,
+    measure: Measure = measure_hash,
+) -> Tuple[int, int, int]:
+    """
+    Find the strongest Argon2 cost that hashes within the target latency.
+
+    Memory is halved from the maximum until a single pass fits, then passes are
+    added while the hash stays under the target.
+    """
+    memory_kib = max_memory_kib
+    while memory_kib > MIN_MEMORY_KIB and (
+        measure(1, memory_kib, parallelism) > target_seconds
+    ):
+        memory_kib //= 2
+    memory_kib = max(memory_kib, MIN_MEMORY_KIB)
+
+    time_cost = 1
+    while time_cost < MAX_TIME_COST and (
+        measure(time_cost + 1, memory_kib, parallelism) <= target_seconds
+    ):
+        time_cost += 1
+    return time_cost, memory_kib, parallelism
+
+
+def write_env_settings(env_file: Path, values: Dict[str, str]) -> None:
+    """Set keys in an env file, replacing existing lines and keeping the rest."""
+    lines = env_file.read_text().splitlines() if env_file.exists() else []
+    remaining = dict(values)
+    for i, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if key in remaining:
+            lines[i] = f"{key}={remaining.pop(key)}"
+    lines.extend(f"{key}={value}" for key, value in remaining.items())
+    env_file.write_text("\n".join(lines) + "\n")
+
+
+def main() -> None:
+    """Benchmark, print and save the calibrated settings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target-ms", type=float, default=100.0)
+    parser.add_argument("--parallelism", type=int, default=1)
+    parser.add_argument("--max-memory-mib", type=int, default=64)
+    parser.add_argument(
+        "--env-file", type=Path, default=Path(__file__).parent.parent / ".env.local"
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    time_cost, memory_kib, parallelism = calibrate(
+        args.target_ms / 1000, args.parallelism, args.max_memory_mib * 1024
+    )
+    elapsed_ms = measure_hash(time_cost, memory_kib, parallelism) * 1000
+    values = {
+        "ARGON2_TIME_COST": str(time_cost),
+        "ARGON2_MEMORY_COST": str(memory_kib),
+        "ARGON2_PARALLELISM": str(parallelism),
+    }
+    for key, value in values.items():
+        print(f"{key}={value}")
+    print(f"One hash takes {elapsed_ms:.0f} ms (target {args.target_ms:.0f} ms)")
+
+    if not args.dry_run:
+        write_env_settings(args.env_file, values)
+        print(f"Wrote {args.env_file}")
+
+
+if __name__ == "__main__":
+    main()
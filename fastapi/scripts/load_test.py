@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Simulate ranking users against the app in-process.
+
+Drives app.main:app through httpx.ASGITransport, so no server or network is
+needed. Virtual users sign up, create lists, add items, answer comparison
+sessions and browse their lists with random think times. Prints throughput
+and p50/p95/p99 latency per endpoint.
+Run with: python scripts/load_test.py --users 50 --duration 60
+(add --database-url postgresql+asyncpg://... to use a local Postgres)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from httpx import ASGITransport, AsyncClient
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+PASSWORD = "load-test-password"
+TIER_SETS = ("good", "mid", "bad")
+# Weights of what a signed-in user does next
+ACTIONS = {"add_item": 5, "read_lists": 3, "read_list_items": 3, "read_list": 1}
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = max(
+        0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+class Recorder:
+    """Latencies and status codes per endpoint."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint: str, seconds: float, status: str) -> None:
+        """Record one request."""
+        self.latencies[endpoint].append(seconds)
+        self.statuses[endpoint][status] += 1
+
+    def summary(self, elapsed: float) -> Dict[str, Dict[str, Any]]:
+        """Throughput, latency percentiles (ms) and errors per endpoint."""
+        report: Dict[str, Dict[str, Any]] = {}
+        for endpoint in sorted(self.latencies):
+            values = sorted(self.latencies[endpoint])
+            statuses = dict(self.statuses[endpoint])
+            report[endpoint] = {
+                "requests": len(values),
+                "rps": len(values) / elapsed if elapsed else 0.0,
+                "p50_ms": percentile(values, 0.50) * 1000,
+                "p95_ms": percentile(values, 0.95) * 1000,
+                "p99_ms": percentile(values, 0.99) * 1000,
+                "errors": sum(
+                    count
+                    for status, count in statuses.items()
+                    if not status.startswith(("2", "3"))
+                ),
+                "statuses": statuses,
+            }
+        return report
+
+
+class VirtualUser:
+    """One simulated person using the app."""
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        recorder: Recorder,
+        rng: random.Random,
+        think_time: float,
+    ) -> None:
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.think_time = think_time
+        self.headers: Dict[str, str] = {}
+        self.lists: List[Dict[str, Any]] = []
+
+    async def request(
+        self, method: str, endpoint: str, url: str, **kwargs: Any
+    ) -> Optional[Any]:
+        """Send a request, record it under its endpoint and return the JSON."""
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, url, headers=self.headers, **kwargs
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            self.recorder.record(
+                endpoint, time.perf_counter() - start, type(exc).__name__
+            )
+            return None
+        self.recorder.record(
+            endpoint, time.perf_counter() - start, str(response.status_code)
+        )
+        if response.status_code >= 400 or not response.content:
+            return None
+        return response.json()
+
+    async def think(self, scale: float = 1.0) -> None:
+        """Pause like a person reading or deciding."""
+        if self.think_time > 0:
+            await asyncio.sleep(self.rng.expovariate(1 / (self.think_time * scale)))
+
+    async def sign_up(self) -> bool:
+        """Create an account and log in."""
+        name = f"load{uuid.uuid4().hex[:12]}"
+        await self.request(
+            "POST",
+            "POST /api/users/",
+            "/api/users/",
+            json={
+                "email": f"{name}@example.com",
+                "username": name,
+                "password": PASSWORD,
+            },
+        )
+        token = await self.request(
+            "POST",
+            "POST /api/users/token",
+            "/api/users/token",
+            data={"username": name, "password": PASSWORD},
+        )
+        if not token:
+            return False
+        self.headers = {"Authorization": f"Bearer {token['access_token']}"}
+        return True
+
+    async def create_list(self) -> None:
+        """Create a list to rank things in."""
+        created = await self.request(
+            "POST",
+            "POST /api/lists/",
+            "/api/lists/",
+            params={"name": f"List {uuid.uuid4().hex[:8]}", "description": "load"},
+        )
+        if created:
+            self.lists.append(created)
+
+    async def add_item(self) -> None:
+        """Add an item and answer comparisons until it is placed."""
+        list_obj = self.rng.choice(self.lists)
+        result = await self.request(
+            "POST",
+            "POST /api/items/",
+            "/api/items/",
+            params={"list_title": list_obj["title"]},
+            json={
+                "name": f"Item {uuid.uuid4().hex[:8]}",
+                "tier_set": self.rng.choice(TIER_SETS),
+            },
+        )
+        while result and "session_id" in result:
+            await self.think(scale=0.5)
+            result = await self.request(
+                "POST",
+                "POST /api/items/comparison/result",
+                "/api/items/comparison/result",
+                params={"session_id": result["session_id"]},
+                json={"result": self.rng.choice(("better", "worse"))},
+            )
+
+    async def browse(self, action: str) -> None:
+        """Look at the home screen or a list."""
+        if action == "read_lists":
+            await self.request("GET", "GET /api/lists/", "/api/lists/")
+            return
+        list_id = self.rng.choice(self.lists)["list_id"]
+        if action == "read_list_items":
+            await self.request(
+                "GET", "GET /api/lists/{list_id}/items", f"/api/lists/{list_id}/items"
+            )
+        else:
+            await self.request(
+                "GET", "GET /api/lists/{list_id}", f"/api/lists/{list_id}"
+            )
+
+    async def run(self, deadline: float) -> None:
+        """Sign up, then keep acting until the deadline."""
+        if not await self.sign_up():
+            return
+        for _ in range(self.rng.randint(1, 3)):
+            await self.create_list()
+        if not self.lists:
+            return
+
+        actions = list(ACTIONS)
+        weights = list(ACTIONS.values())
+        while time.monotonic() < deadline:
+            await self.think()
+            if time.monotonic() >= deadline:
+                break
+            action = self.rng.choices(actions, weights)[0]
+            if action == "add_item":
+                await self.add_item()
+            else:
+                await self.browse(action)
+
+
+async def run_load(
+    client: AsyncClient,
+    users: int,
+    duration: float,
+    think_time: float,
+    ramp_up: float,
+    seed: int = 0,
+) -> Dict[str, Dict[str, Any]]:
+    """Run a population of virtual users and summarize what they saw."""
+    recorder = Recorder()
+    rng = random.Random(seed)
+    start = time.monotonic()
+    deadline = start + duration
+
+    async def start_user(index: int) -> None:
+        await asyncio.sleep(ramp_up * index / max(users, 1))
+        user_rng = random.Random(rng.random())
+        await VirtualUser(client, recorder, user_rng, think_time).run(deadline)
+
+    await asyncio.gather(*(start_user(index) for index in range(users)))
+    return recorder.summary(time.monotonic() - start)
+
+
+def print_report(report: Dict[str, Dict[str, Any]]) -> None:
+    """Print the per-endpoint table."""
+    print(
+        f"{'endpoint':<38} {'reqs':>7} {'rps':>8} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'errors':>7}"
+    )
+    for endpoint, row in report.items():
+        print(
+            f"{endpoint:<38} {row['requests']:>7} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+            f"{row['errors']:>7}"
+        )
+    total = sum(row["requests"] for row in report.values())
+    rps = sum(row["rps"] for row in report.values())
+    print(f"{'total':<38} {total:>7} {rps:>8.1f}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Prepare the database, run the load and report."""
+    # Imported here so the database URL from the command line is used
+    from app.core.security import hashing_pool
+    from app.db.database import engine
+    from app.db.migrations import upgrade_database
+    from app.main import app
+
+    await upgrade_database(engine)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://loadtest"
+        ) as client:
+            report = await run_load(
+                client,
+                users=args.users,
+                duration=args.duration,
+                think_time=args.think_time,
+                ramp_up=args.ramp_up,
+                seed=args.seed,
+            )
+    finally:
+        await engine.dispose()
+        hashing_pool.shutdown()
+
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.json}")
+
+
+def main() -> None:
+    """Parse arguments, point the app at the chosen database and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds")
+    parser.add_argument(
+        "--think-time", type=float, default=2.0, help="mean seconds between actions"
+    )
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="seconds")
+    parser.add_argument(
+        "--database-url",
+        help="defaults to a fresh SQLite file in a temporary directory",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        database_path = Path(tempfile.mkdtemp()) / "loadtest.db"
+        database_url = f"sqlite+aiosqlite:///{database_path}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "load-test-secret-key")
+    os.environ.setdefault("APP_ENV", "loadtest")
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Reconcile denormalized list counters against the items table.
+
+Reports lists whose stored item_count or tier counters drifted from a
+recount of their items, and optionally overwrites them.
+Run with: make reconcile (add --repair to fix drift)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.database import SessionLocal  # noqa: E402
+from app.services import list_service  # noqa: E402
+
+
+async def main(repair: bool = False) -> int:
+    """Report counter drift, returning the number of drifted lists."""
+    async with SessionLocal() as session:
+        drift = await list_service.reconcile_list_counters(session, repair=repair)
+
+    for list_id, counters in drift.items():
+        print(f"{list_id}: stored={counters['stored']} actual={counters['actual']}")
+
+    if not drift:
+        print("All list counters match")
+    elif repair:
+        print(f"Repaired {len(drift)} list(s)")
+    else:
+        print(f"{len(drift)} list(s) drifted; rerun with --repair to fix")
+    return len(drift)
+
+
+if __name__ == "__main__":
+    repair = "--repair" in sys.argv
+    drifted = asyncio.run(main(repair=repair))
+    sys.exit(1 if drifted and not repair else 0)
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Replay captured production traffic against the app in-process.
+
+Reads the JSONL traces written when TRAFFIC_CAPTURE_PATH is set, rebuilds
+equivalent users, lists and ranked tier sets in a scratch database, then
+replays list reads, list creation, item inserts and comparison answers
+through httpx.ASGITransport. The scratch data comes from a seeded RNG and
+--speed 0 sends requests strictly one at a time, so two builds can be
+compared on identical workloads.
+Run with: python scripts/replay_traffic.py traffic-*.jsonl --speed 0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.load_test import TIER_SETS, Recorder, print_report  # noqa: E402
+
+Trace = Dict[str, Any]
+
+READ_LISTS = ("GET", "/api/lists/")
+CREATE_LIST = ("POST", "/api/lists/")
+READ_LIST = ("GET", "/api/lists/{list_id}")
+READ_LIST_ITEMS = ("GET", "/api/lists/{list_id}/items")
+CREATE_ITEM = ("POST", "/api/items/")
+ANSWER = ("POST", "/api/items/comparison/result")
+REPLAYED_ROUTES = frozenset(
+    {READ_LISTS, CREATE_LIST, READ_LIST, READ_LIST_ITEMS, CREATE_ITEM, ANSWER}
+)
+
+
+def load_traces(paths: Iterable[Path]) -> List[Trace]:
+    """Read trace files (e.g. one per worker) into one list ordered by time."""
+    traces: List[Trace] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as trace_file:
+            for line in trace_file:
+                try:
+                    traces.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A worker killed mid-write leaves a partial last line
+                    continue
+    traces.sort(key=lambda trace: trace["t"])
+    return traces
+
+
+def is_replayable(trace: Trace) -> bool:
+    """Whether a trace is a successful request the replay knows how to send."""
+    return (
+        (trace.get("method"), trace.get("route")) in REPLAYED_ROUTES
+        and trace.get("status", 500) < 400
+        and "user" in trace
+    )
+
+
+@dataclass
+class Scratch:
+    """Mapping from trace pseudonyms to the rows built for them."""
+
+    headers: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    lists: Dict[str, Tuple[uuid.UUID, str]] = field(default_factory=dict)
+    seeded_items: int = 0
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def plan_seed_data(
+    traces: Sequence[Trace],
+) -> Tuple[Dict[str, str], Dict[str, Dict[str, int]]]:
+    """
+    Work out which lists exist before the trace starts and how big they are.
+
+    Args:
+        traces: Replayable traces in time order
+
+    Returns:
+        Owner pseudonym per pre-existing list, and ranked items per tier set
+        for each of those lists, taken from the first time it was seen
+    """
+    owners: Dict[str, str] = {}
+    created: Set[str] = set()
+    sizes: Dict[str, Dict[str, int]] = defaultdict(dict)
+    list_sizes: Dict[str, int] = {}
+    for trace in traces:
+        list_key = trace.get("list")
+        if list_key is None or list_key in created:
+            continue
+        if list_key not in owners:
+            if (trace["method"], trace["route"]) == CREATE_LIST:
+                created.add(list_key)
+                continue
+            owners[list_key] = trace["user"]
+        if "tier_set" in trace and "tier_set_size" in trace:
+            sizes[list_key].setdefault(trace["tier_set"], trace["tier_set_size"])
+        if "list_size" in trace:
+            list_sizes.setdefault(list_key, trace["list_size"])
+
+    # Items seen only through whole-list reads go to a tier set nobody ranked in
+    for list_key, list_size in list_sizes.items():
+        remainder = list_size - sum(sizes[list_key].values())
+        unused = [name for name in TIER_SETS if name not in sizes[list_key]]
+        if remainder > 0 and unused:
+            sizes[list_key][unused[0]] = remainder
+    return owners, {list_key: dict(sizes[list_key]) for list_key in owners}
+
+
+async def build_scratch(
+    db: AsyncSession, traces: Sequence[Trace], seed: int = 0
+) -> Scratch:
+    """
+    Create the users, lists and ranked tier sets the trace refers to.
+
+    Args:
+        db: Session on the scratch database
+        traces: Replayable traces in time order
+        seed: Seed for every generated ID
+
+    Returns:
+        Auth headers per user pseudonym and list ID and title per list
+        pseudonym
+    """
+    # Imported here so the database URL from the command line is used
+    from app.core.auth import create_access_token
+    from app.db.models import Item as ItemModel
+    from app.db.models import List as ListModel
+    from app.db.models import User as UserModel
+    from app.services.ranking import assign_tiers_for_set
+
+    rng = random.Random(seed)
+    scratch = Scratch()
+    now = datetime.now(timezone.utc)
+
+    user_ids: Dict[str, uuid.UUID] = {}
+    for trace in traces:
+        user_key = trace["user"]
+        if user_key in user_ids:
+            continue
+        user_id = _uuid(rng)
+        user_ids[user_key] = user_id
+        name = f"replay{len(user_ids)}"
+        db.add(
+            UserModel(
+                user_id=user_id,
+                email=f"{name}@example.com",
+                username=name,
+                password_hash="!",
+            )
+        )
+        scratch.headers[user_key] = {
+            "Authorization": f"Bearer {create_access_token(user_id)}"
+        }
+
+    owners, sizes = plan_seed_data(traces)
+    for list_key, owner in owners.items():
+        list_id = _uuid(rng)
+        title = f"Replay list {len(scratch.lists) + 1}"
+        scratch.lists[list_key] = (list_id, title)
+        db.add(
+            ListModel(
+                list_id=list_id,
+                user_id=user_ids[owner],
+                title=title,
+                description="replay",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for tier_set, size in sorted(sizes[list_key].items()):
+            chain = [
+                ItemModel(
+                    item_id=_uuid(rng),
+                    list_id=list_id,
+                    name=f"Seeded {tier_set} {index}",
+                    tier_set=tier_set,
+                    position=index,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for index in range(size)
+            ]
+            for lower, higher in zip(chain, chain[1:]):
+                lower.next_item_id = higher.item_id
+                higher.prev_item_id = lower.item_id
+            assign_tiers_for_set(chain, tier_set)
+            db.add_all(chain)
+            scratch.seeded_items += size
+    await db.commit()
+    return scratch
+
+
+class Replayer:
+    """Turns traces back into requests against the scratch data."""
+
+    def __init__(self, client: AsyncClient, scratch: Scratch) -> None:
+        self.client = client
+        self.scratch = scratch
+        self.recorder = Recorder()
+        self.skipped: Dict[str, int] = defaultdict(int)
+        self.sessions: Dict[str, str] = {}
+        self.created_lists = 0
+        self.created_items = 0
+
+    def skip(self, trace: Trace) -> None:
+        """Count a trace that could not be replayed."""
+        self.skipped[f"{trace.get('method')} {trace.get('route')}"] += 1
+
+    async def send(self, trace: Trace) -> None:
+        """Replay one trace."""
+        key = (trace["method"], trace["route"])
+        endpoint = f"{trace['method']} {trace['route']}"
+        headers = self.scratch.headers[trace["user"]]
+        list_ref = self.scratch.lists.get(trace.get("list", ""))
+        kwargs: Dict[str, Any] = {}
+
+        if key == READ_LISTS:
+            url = "/api/lists/"
+        elif key == CREATE_LIST:
+            self.created_lists += 1
+            url = "/api/lists/"
+            kwargs["params"] = {
+                "name": f"Replay new list {self.created_lists}",
+                "description": "replay",
+            }
+        elif key in (READ_LIST, READ_LIST_ITEMS) and list_ref:
+            url = f"/api/lists/{list_ref[0]}"
+            if key == READ_LIST_ITEMS:
+                url += "/items"
+        elif key == CREATE_ITEM and list_ref and "tier_set" in trace:
+            self.created_items += 1
+            url = "/api/items/"
+            kwargs["params"] = {"list_title": list_ref[1]}
+            kwargs["json"] = {
+                "name": f"Replay item {self.created_items}",
+                "tier_set": trace["tier_set"],
+            }
+        elif key == ANSWER and trace.get("session") in self.sessions:
+            url = "/api/items/comparison/result"
+            kwargs["params"] = {"session_id": self.sessions[trace["session"]]}
+            kwargs["json"] = {"result": trace["answer"]}
+        else:
+            self.skip(trace)
+            return
+
+        start = time.perf_counter()
+        response = await self.client.request(
+            trace["method"], url, headers=headers, **kwargs
+        )
+        self.recorder.record(
+            endpoint, time.perf_counter() - start, str(response.status_code)
+        )
+        if response.status_code >= 400:
+            return
+        body = response.json() if response.content else None
+        if key == CREATE_LIST and "list" in trace:
+            self.scratch.lists[trace["list"]] = (
+                uuid.UUID(body["list_id"]),
+                body["title"],
+            )
+        elif key == CREATE_ITEM and "session" in trace and body:
+            self.sessions[trace["session"]] = body.get("session_id")
+        elif key == ANSWER and body is None:
+            # Placed; later answers for this session have nothing to answer
+            self.sessions.pop(trace["session"], None)
+
+
+async def replay(
+    client: AsyncClient,
+    traces: Sequence[Trace],
+    scratch: Scratch,
+    speed: float = 0.0,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Send the traces to the app.
+
+    Args:
+        client: Client bound to the app
+        traces: Replayable traces in time order
+        scratch: Data built by build_scratch
+        speed: 1.0 keeps the recorded pacing, higher values compress it and
+            0 sends every request back to back in trace order
+
+    Returns:
+        Per-endpoint report and skipped traces per endpoint
+    """
+    replayer = Replayer(client, scratch)
+    start = time.monotonic()
+
+    if speed <= 0:
+        for trace in traces:
+            await replayer.send(trace)
+    else:
+        # Each user's requests stay in order; users overlap as they did live
+        by_user: Dict[str, List[Trace]] = defaultdict(list)
+        for trace in traces:
+            by_user[trace["user"]].append(trace)
+        first = traces[0]["t"] if traces else 0.0
+
+        async def replay_user(user_traces: List[Trace]) -> None:
+            for trace in user_traces:
+                delay = start + (trace["t"] - first) / speed - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await replayer.send(trace)
+
+        await asyncio.gather(*(replay_user(user) for user in by_user.values()))
+
+    report = replayer.recorder.summary(time.monotonic() - start)
+    return report, dict(replayer.skipped)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Build the scratch database, replay the traces and report."""
+    from app.core.security import hashing_pool
+    from app.db.database import SessionLocal, engine
+    from app.db.migrations import upgrade_database
+    from app.main import app
+
+    traces = load_traces(args.traces)
+    replayable = [trace for trace in traces if is_replayable(trace)]
+    await upgrade_database(engine)
+    try:
+        async with SessionLocal() as db:
+            scratch = await build_scratch(db, replayable, seed=args.seed)
+        print(
+            f"Replaying {len(replayable)} of {len(traces)} requests from "
+            f"{len(scratch.headers)} users over {len(scratch.lists)} lists "
+            f"({scratch.seeded_items} seeded items)"
+        )
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://replay"
+        ) as client:
+            report, skipped = await replay(client, replayable, scratch, args.speed)
+    finally:
+        await engine.dispose()
+        hashing_pool.shutdown()
+
+    print_report(report)
+    for endpoint, count in sorted(skipped.items()):
+        print(f"skipped {count} x {endpoint}")
+    if args.json:
+        args.json.write_text(
+            json.dumps({"endpoints": report, "skipped": skipped}, indent=2) + "\n"
+        )
+        print(f"Wrote {args.json}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Parse arguments, point the app at the chosen database and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("traces", type=Path, nargs="+", help="JSONL trace files")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="1 for recorded pacing, N for N times faster, 0 for back to back",
+    )
+    parser.add_argument(
+        "--database-url",
+        help="defaults to a fresh SQLite file in a temporary directory",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    args = parser.parse_args(argv)
+
+    database_url = args.database_url
+    if database_url is None:
+        database_path = Path(tempfile.mkdtemp()) / "replay.db"
+        database_url = f"sqlite+aiosqlite:///{database_path}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "replay-secret-key")
+    os.environ.setdefault("APP_ENV", "replay")
+    # Don't record the replay itself
+    os.environ.pop("TRAFFIC_CAPTURE_PATH", None)
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
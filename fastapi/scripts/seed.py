@@ -20,10 +20,10 @@ from sqlalchemy import text, select  # noqa: E402
 from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
 
 from app.db.database import SessionLocal, engine  # noqa: E402
-from app.db.models import Base, User  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.models import User  # noqa: E402
 from app.core.security import get_password_hash  # noqa: E402
 
-
 # Dev users to seed
 DEV_USERS = [
     {
@@ -81,9 +81,8 @@ async def main(clear: bool = False) -> None:
     """Main seed function."""
     print("Starting database seed...")
 
-    # Create tables if they don't exist
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Bring the schema up to date
+    await upgrade_database(engine)
 
     async with SessionLocal() as session:
         if clear:
@@ -0,0 +1,132 @@
+"""Tests for the cached health checks and probe endpoints."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.health import HealthMonitor
+from app.db.database import engine_options
+from app.settings import settings
+
+
+class CountingMonitor(HealthMonitor):
+    """Monitor with a controllable clock that counts database round trips."""
+
+    def __init__(self, engine: AsyncEngine, interval: float = 5.0) -> None:
+        self.now = 100.0
+        self.pings = 0
+        super().__init__(
+            {"primary": engine, "replica": None},
+            interval_seconds=interval,
+            timeout_seconds=0.5,
+            clock=lambda: self.now,
+        )
+
+    async def _ping(self, engine: AsyncEngine) -> None:
+        self.pings += 1
+        await super()._ping(engine)
+
+
+def make_engine(tmp_path: Path, name: str = "app.db") -> AsyncEngine:
+    """Build a pooled SQLite engine like the app's."""
+    url = f"sqlite+aiosqlite:///{tmp_path / name}"
+    return create_async_engine(url, **engine_options(url, f"health-{name}"))
+
+
+@pytest.mark.asyncio
+class TestHealthMonitor:
+    """Tests for background checks and readiness decisions."""
+
+    async def test_results_are_cached_until_stale(self, tmp_path: Path):
+        """Test probes reuse the last check and only re-run it once stale."""
+        engine = make_engine(tmp_path)
+        monitor = CountingMonitor(engine)
+
+        assert (await monitor.readiness())["ready"]
+        assert (await monitor.readiness())["ready"]
+        assert monitor.pings == 1
+
+        monitor.now += 60
+        assert (await monitor.readiness())["ready"]
+        assert monitor.pings == 2
+        await engine.dispose()
+
+    async def test_stale_results_fail_while_task_is_stuck(self, tmp_path: Path):
+        """Test readiness fails if the background task stops refreshing."""
+        engine = make_engine(tmp_path)
+        monitor = CountingMonitor(engine, interval=3600)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        assert monitor.pings == 1
+
+        monitor.now += 3 * 3600 + 1
+        result = await monitor.readiness()
+        await monitor.stop()
+        await engine.dispose()
+
+        assert not result["ready"]
+        assert result["reasons"] == ["health checks are not running"]
+        assert not monitor.running
+
+    async def test_database_down_is_not_ready(self, tmp_path: Path):
+        """Test an unreachable database is reported with its error."""
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'app.db'}"
+        )
+        monitor = CountingMonitor(engine)
+
+        result = await monitor.readiness()
+        await engine.dispose()
+
+        assert not result["ready"]
+        assert result["database"] == "disconnected"
+        assert result["reasons"][0].startswith("primary: ")
+
+    async def test_saturated_pool_fails_fast(self, tmp_path: Path, monkeypatch):
+        """Test a saturated pool fails readiness without waiting for a connection."""
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+        monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+        engine = make_engine(tmp_path)
+        monitor = CountingMonitor(engine)
+        assert (await monitor.readiness())["ready"]
+
+        async with engine.connect():
+            monitor.now += 60
+            result = await asyncio.wait_for(monitor.readiness(), timeout=0.2)
+
+        assert not result["ready"]
+        assert result["reasons"] == ["primary: connection pool saturated"]
+        assert result["database"] == "connected"
+        assert monitor.pings == 1
+        assert (await monitor.readiness())["ready"]
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestHealthEndpoints:
+    """Tests for the probe endpoints."""
+
+    async def test_liveness(self, client: AsyncClient):
+        """Test liveness answers without touching the database."""
+        response = await client.get("/health/live")
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+
+    async def test_readiness(self, client: AsyncClient):
+        """Test readiness reports a connected database."""
+        response = await client.get("/health/ready")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert body["database"] == "connected"
+        assert body["reasons"] == []
+
+    async def test_health_summary(self, client: AsyncClient):
+        """Test the summary endpoint keeps its response shape."""
+        response = await client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+        assert response.json()["database"] == "connected"
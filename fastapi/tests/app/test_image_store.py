@@ -0,0 +1,98 @@
+"""Tests for content-addressed image storage and thumbnails."""
+
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+from app.core.images import (
+    ImageStore,
+    make_thumbnail,
+    sniff_image_type,
+    thumbnail_url_for,
+)
+
+DIGEST = "ab" * 32
+
+
+def png_bytes(width: int = 4, height: int = 4, shade: int = 0) -> bytes:
+    """Build a valid grayscale PNG without an imaging library."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    pixels = b"".join(b"\x00" + bytes([shade]) * width for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(pixels))
+        + chunk(b"IEND", b"")
+    )
+
+
+def test_sniff_image_type():
+    """Test formats are recognized by content, not by name."""
+    assert sniff_image_type(png_bytes()) == "png"
+    assert sniff_image_type(b"\xff\xd8\xff\xe0rest") == "jpg"
+    assert sniff_image_type(b"GIF89a...") == "gif"
+    assert sniff_image_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "webp"
+    assert sniff_image_type(b"<svg xmlns=...>") is None
+
+
+def test_thumbnail_url_only_for_uploaded_images():
+    """Test thumbnails are derived for uploaded images and nothing else."""
+    uploaded = f"https://api.example.com/api/images/{DIGEST}.png"
+
+    assert thumbnail_url_for(uploaded) == f"{uploaded}/thumbnail"
+    assert thumbnail_url_for("https://example.com/cat.png") is None
+    assert thumbnail_url_for(f"https://example.com/{DIGEST}.png") is None
+    assert thumbnail_url_for(None) is None
+
+
+def test_identical_uploads_are_stored_once(tmp_path: Path):
+    """Test the same bytes map to one image ID and one file."""
+    store = ImageStore(tmp_path, thumbnail_size=64, max_workers=1)
+
+    first, created = store.save(png_bytes(), "png")
+    second, created_again = store.save(png_bytes(), "png")
+    other, _ = store.save(png_bytes(shade=200), "png")
+
+    assert first == second
+    assert created and not created_again
+    assert other != first
+    assert store.original_path(first).read_bytes() == png_bytes()
+    assert len(list((tmp_path / "originals").rglob("*.png"))) == 2
+
+
+def test_missing_pillow_stops_scheduling(tmp_path: Path, monkeypatch):
+    """Test thumbnails are skipped, not retried, when Pillow is unavailable."""
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    store = ImageStore(tmp_path, thumbnail_size=64, max_workers=1)
+    image_id, _ = store.save(png_bytes(), "png")
+
+    future = store.schedule_thumbnail(image_id)
+    assert future is not None
+    assert future.result() is False
+    store.shutdown()
+
+    assert store.pillow_missing
+    assert store.schedule_thumbnail(image_id) is None
+    assert not store.thumbnail_path(image_id).exists()
+
+
+def test_make_thumbnail_downscales(tmp_path: Path):
+    """Test thumbnails fit the configured box."""
+    image_module = pytest.importorskip("PIL.Image")
+    source = tmp_path / "source.png"
+    source.write_bytes(png_bytes(width=640, height=320))
+    destination = tmp_path / "thumbs" / "source.webp"
+
+    assert make_thumbnail(source, destination, 64)
+
+    with image_module.open(destination) as thumbnail:
+        assert thumbnail.format == "WEBP"
+        assert thumbnail.size == (64, 32)
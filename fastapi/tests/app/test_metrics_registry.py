@@ -0,0 +1,46 @@
+"""Tests for the in-process metrics registry."""
+
+from app.core.metrics import Counter, Gauge, Histogram, Registry
+
+
+def test_counter_and_gauge_render():
+    """Test counters get a _total suffix and labels are escaped."""
+    registry = Registry()
+    counter = registry.register(Counter("hits", "Hits.", ("route",)))
+    gauge = registry.register(Gauge("busy", "Busy workers."))
+
+    counter.inc('/a"b')
+    counter.inc('/a"b', amount=2)
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    text = registry.render()
+    assert "# TYPE hits counter" in text
+    assert 'hits_total{route="/a\\"b"} 3' in text
+    assert "busy 1" in text
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test histogram buckets use le bounds and accumulate."""
+    histogram = Histogram("latency", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.1, "/x")
+    histogram.observe(0.5, "/x")
+    histogram.observe(5.0, "/x")
+
+    lines = histogram.render()
+    assert 'latency_bucket{route="/x",le="0.1"} 1' in lines
+    assert 'latency_bucket{route="/x",le="1"} 2' in lines
+    assert 'latency_bucket{route="/x",le="+Inf"} 3' in lines
+    assert 'latency_count{route="/x"} 3' in lines
+    assert histogram.sum("/x") == 5.6
+
+
+def test_collectors_run_before_render():
+    """Test collectors refresh gauges on every scrape."""
+    registry = Registry()
+    gauge = registry.register(Gauge("scrapes", "Scrapes."))
+    registry.add_collector(lambda: gauge.inc())
+
+    registry.render()
+    assert "scrapes 2" in registry.render()
@@ -0,0 +1,63 @@
+"""Tests for connection pool settings and instrumentation."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.database import engine_options
+from app.db.pool import InstrumentedAsyncQueuePool, get_pool_stats
+from app.settings import settings
+
+
+def test_in_memory_sqlite_skips_pool_sizing():
+    """Test in-memory SQLite keeps its static single-connection pool."""
+    options = engine_options("sqlite+aiosqlite:///:memory:", "memory")
+    assert "pool_size" not in options
+    assert "poolclass" not in options
+
+
+def test_pool_settings_applied(monkeypatch):
+    """Test pool sizing comes from settings and not from connect_args."""
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 3)
+    monkeypatch.setattr(settings, "APP_ENV", "production")
+
+    options = engine_options("postgresql+asyncpg://u:p@db:5432/app", "primary")
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == 3
+    assert "pool_size" not in options["connect_args"]
+    assert options["connect_args"]["server_settings"] == {"jit": "off"}
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_checkouts_and_timeouts(tmp_path: Path, monkeypatch):
+    """Test live stats report checked out connections, waits and timeouts."""
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 0.05)
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    engine = create_async_engine(url, **engine_options(url, "pool-stats-test"))
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = get_pool_stats(engine)
+            assert stats["checked_out"] == 1
+            assert stats["size"] == 1
+
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        await asyncio.sleep(0)
+        stats = get_pool_stats(engine)
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait_seconds_max"] >= 0.05
+    finally:
+        await engine.dispose()
@@ -0,0 +1,179 @@
+"""Tests for read-only sessions and read-your-writes routing."""
+
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.read_your_writes import (
+    LAST_WRITE_COOKIE,
+    ReadYourWritesMiddleware,
+    wrote_recently,
+)
+from app.db import database
+from app.db.database import get_read_db
+from app.db.models import Item as ItemModel
+from app.db.models import List as ListModel
+from app.db.models import User
+from app.main import app
+from app.settings import settings
+from fastapi import FastAPI, Request
+
+
+def make_request(cookie: str = "") -> Request:
+    """Build a bare request carrying the given Cookie header."""
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def make_app() -> FastAPI:
+    """Build a tiny app wrapped in the read-your-writes middleware."""
+    app = FastAPI()
+
+    @app.get("/thing")
+    async def read_thing() -> dict:
+        return {}
+
+    @app.post("/thing")
+    async def write_thing() -> dict:
+        return {}
+
+    @app.delete("/thing", status_code=404)
+    async def fail_thing() -> dict:
+        return {}
+
+    app.add_middleware(ReadYourWritesMiddleware)
+    return app
+
+
+def test_wrote_recently_checks_window(monkeypatch):
+    """Test the write cookie only counts within the configured window."""
+    monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 5.0)
+
+    assert not wrote_recently(make_request())
+    assert not wrote_recently(make_request(f"{LAST_WRITE_COOKIE}=garbage"))
+    assert wrote_recently(make_request(f"{LAST_WRITE_COOKIE}={time.time()}"))
+    assert not wrote_recently(make_request(f"{LAST_WRITE_COOKIE}={time.time() - 10}"))
+
+
+@pytest.mark.asyncio
+async def test_middleware_marks_successful_writes(monkeypatch):
+    """Test successful writes set the cookie while reads and errors do not."""
+    monkeypatch.setattr(settings, "DATABASE_REPLICA_URL", "sqlite+aiosqlite://")
+    monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 2.5)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=make_app()), base_url="http://test"
+    ) as client:
+        write = await client.post("/thing")
+        read = await client.get("/thing")
+        failed = await client.delete("/thing")
+
+    cookie = write.headers["set-cookie"]
+    assert cookie.startswith(f"{LAST_WRITE_COOKIE}=")
+    assert "Max-Age=3" in cookie
+    assert "set-cookie" not in read.headers
+    assert "set-cookie" not in failed.headers
+
+
+@pytest.mark.asyncio
+async def test_middleware_inactive_without_replica(monkeypatch):
+    """Test no cookie is set when reads already go to the primary."""
+    monkeypatch.setattr(settings, "DATABASE_REPLICA_URL", None)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=make_app()), base_url="http://test"
+    ) as client:
+        response = await client.post("/thing")
+
+    assert "set-cookie" not in response.headers
+
+
+def test_read_session_routing(monkeypatch):
+    """Test reads go to the replica unless the client just wrote."""
+    assert database.read_session_factory(make_request()) is (
+        database.PrimaryReadSessionLocal
+    )
+
+    monkeypatch.setattr(database, "replica_engine", object())
+    assert database.read_session_factory(make_request()) is database.ReadSessionLocal
+    assert database.read_session_factory(
+        make_request(f"{LAST_WRITE_COOKIE}={time.time()}")
+    ) is (database.PrimaryReadSessionLocal)
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_rejects_flush(test_db: AsyncSession):
+    """Test read-only sessions refuse to flush changes."""
+    factory = async_sessionmaker(
+        test_db.bind, class_=AsyncSession, info={"read_only": True}
+    )
+    async with factory() as session:
+        session.add(
+            User(username="reader", email="reader@example.com", password_hash="x")
+        )
+        with pytest.raises(InvalidRequestError):
+            await session.flush()
+
+
+async def add_item(client: AsyncClient, headers: dict, title: str, name: str) -> dict:
+    """Add an item to a list through the API."""
+    response = await client.post(
+        "/api/items/",
+        params={"list_title": title},
+        json={"name": name, "tier_set": "good"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_read_endpoints_work_on_read_only_sessions(
+    client: AsyncClient,
+    test_list: ListModel,
+    test_item: ItemModel,
+    auth_headers: dict,
+):
+    """Test every endpoint on get_read_db answers without flushing."""
+    # The client fixture hands out read-only sessions like get_read_db
+    async with asynccontextmanager(app.dependency_overrides[get_read_db])() as db:
+        db.add(User(username="reader", email="reader@example.com", password_hash="x"))
+        with pytest.raises(InvalidRequestError):
+            await db.flush()
+
+    for title in ("Source", "Other"):
+        response = await client.post(
+            "/api/lists/",
+            params={"name": title, "description": ""},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+    source = await add_item(client, auth_headers, "Source", "Ranked source")
+    await add_item(client, auth_headers, "Other", "First")
+    comparison = await add_item(client, auth_headers, "Other", "Second")
+
+    list_id = test_list.list_id
+    response = await client.post(
+        f"/api/lists/{list_id}/merge",
+        params={"source_list_id": source["list_id"]},
+        headers=auth_headers,
+    )
+    merge = response.json()
+
+    paths = [
+        "/api/lists/",
+        f"/api/lists/{list_id}",
+        f"/api/lists/{list_id}/items",
+        f"/api/lists/{list_id}/export",
+        "/api/users/me/export",
+        f"/api/lists/merge/{merge['session_id']}/status",
+        f"/api/items/items/{test_item.item_id}",
+        f"/api/items/comparison/{comparison['session_id']}/status",
+    ]
+    for path in paths:
+        response = await client.get(path, headers=auth_headers)
+        assert response.status_code == 200, path
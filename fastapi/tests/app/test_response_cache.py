@@ -0,0 +1,54 @@
+"""Tests for the encoded response cache."""
+
+from app.core.response_cache import CachedResponse, ResponseCache
+
+
+def make_entry(size: int) -> CachedResponse:
+    """Create an entry whose size is exactly the given number of bytes."""
+    return CachedResponse(b"x" * size, {})
+
+
+def test_get_and_set():
+    """Test a stored entry is returned and counted as a hit."""
+    cache = ResponseCache(max_bytes=100)
+    assert cache.get("a") is None
+    cache.set("a", make_entry(10))
+    assert cache.get("a").body == b"x" * 10
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["bytes_saved"] == 10
+
+
+def test_evicts_least_recently_used():
+    """Test the memory cap evicts the least recently used entries first."""
+    cache = ResponseCache(max_bytes=30)
+    cache.set("a", make_entry(10))
+    cache.set("b", make_entry(10))
+    cache.set("c", make_entry(10))
+    cache.get("a")
+    cache.set("d", make_entry(10))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    stats = cache.stats()
+    assert stats["size_bytes"] == 30
+    assert stats["evictions"] == 1
+
+
+def test_oversized_entry_not_stored():
+    """Test an entry larger than the cap is not cached."""
+    cache = ResponseCache(max_bytes=5)
+    cache.set("a", make_entry(10))
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_replacing_entry_updates_size():
+    """Test storing a key twice does not double count its size."""
+    cache = ResponseCache(max_bytes=100)
+    cache.set("a", make_entry(10))
+    cache.set("a", make_entry(20))
+    assert cache.stats()["size_bytes"] == 20
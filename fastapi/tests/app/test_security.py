@@ -0,0 +1,94 @@
+"""Tests for password hashing off the event loop."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.security import (
+    HashingPool,
+    PasswordHashingBusyError,
+    build_pwd_context,
+    get_password_hash,
+    get_password_hash_async,
+    get_pwd_context,
+    needs_rehash,
+    verify_and_update_password,
+    verify_password_async,
+)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_async():
+    """Test pooled hashing round-trips with pooled verification."""
+    hashed = await get_password_hash_async("pooledpassword")
+    assert await verify_password_async("pooledpassword", hashed)
+    assert not await verify_password_async("wrongpassword", hashed)
+
+
+@pytest.mark.asyncio
+async def test_pool_sheds_load_when_full():
+    """Test calls beyond the worker and queue limits are rejected."""
+    pool = HashingPool(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert pool.stats()["queued"] == 1
+
+        with pytest.raises(PasswordHashingBusyError):
+            await pool.run(release.wait)
+
+        release.set()
+        await asyncio.gather(*running)
+        stats = pool.stats()
+        assert stats["in_flight"] == 0
+        assert stats["completed"] == 2
+        assert stats["rejected"] == 1
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_keeps_event_loop_responsive():
+    """Test the event loop keeps running while a hash is in progress."""
+    pool = HashingPool(max_workers=1, max_queue=0)
+    release = threading.Event()
+    try:
+        pending = asyncio.ensure_future(pool.run(release.wait))
+        ticks = 0
+        for _ in range(5):
+            await asyncio.sleep(0)
+            ticks += 1
+        assert ticks == 5
+        assert not pending.done()
+        release.set()
+        assert await pending is True
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_only_weaker_hashes_are_rehashed():
+    """Test hashes from costlier hosts are kept while weaker ones are upgraded."""
+    local = get_pwd_context().handler("argon2")
+    time_cost, memory_cost = local.default_rounds, local.memory_cost
+
+    assert not needs_rehash(get_password_hash("secret"))
+    stronger = build_pwd_context(time_cost + 1, memory_cost * 2, 1).hash("secret")
+    assert get_pwd_context().needs_update(stronger)
+    assert not needs_rehash(stronger)
+    assert needs_rehash(build_pwd_context(time_cost - 1, memory_cost).hash("secret"))
+    assert needs_rehash(build_pwd_context(time_cost, memory_cost // 2).hash("secret"))
+
+
+def test_verify_and_update_password():
+    """Test a new hash is only returned for a correct password and a weak hash."""
+    weak = build_pwd_context(1, 8192, 1).hash("secret")
+
+    assert verify_and_update_password("wrong", weak) == (False, None)
+    valid, new_hash = verify_and_update_password("secret", weak)
+    assert valid and new_hash is not None
+    assert not needs_rehash(new_hash)
+    assert verify_and_update_password("secret", new_hash) == (True, None)
@@ -0,0 +1,101 @@
+"""Tests for worker startup: schema check, pool warmup and phase timing."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import main
+from app.core.metrics import APP_STARTUP_PHASE_DURATION
+from app.core.startup import StartupTimer
+from app.db.database import engine_options
+from app.db.migrations import SchemaOutOfDateError, upgrade_database
+from app.db.pool import get_pool_stats, warm_pool
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def test_timer_reports_phases_in_order():
+    """Test phases are recorded, exported as gauges and summarized."""
+    timer = StartupTimer()
+    timer.record("imports", 0.25)
+    with timer.phase("schema_check"):
+        pass
+
+    assert list(timer.phases) == ["imports", "schema_check"]
+    assert APP_STARTUP_PHASE_DURATION.get("imports") == 0.25
+    assert timer.summary().startswith("ready in ")
+    assert "imports 250 ms" in timer.summary()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_opens_connections(tmp_path: Path):
+    """Test warmup leaves connections idle in the pool, capped at its size."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"
+    engine = create_async_engine(url, **engine_options(url, "warmup"))
+
+    assert await warm_pool(engine, 3) == 3
+    assert get_pool_stats(engine)["checked_in"] == 3
+    assert await warm_pool(engine, 100) == get_pool_stats(engine)["size"]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_skips_static_pool():
+    """Test in-memory SQLite, which has no real pool, is left alone."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    assert await warm_pool(engine, 3) == 0
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_refuses_unmigrated_database(tmp_path: Path, monkeypatch):
+    """Test a worker does not start against a database that needs migrating."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setattr(main, "engine", engine)
+    monkeypatch.setattr(main, "replica_engine", None)
+
+    with pytest.raises(SchemaOutOfDateError):
+        async with main.lifespan(main.app):
+            pass
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_on_migrated_database(tmp_path: Path, monkeypatch):
+    """Test startup checks the schema and warms the pool without migrating."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"
+    engine = create_async_engine(url, **engine_options(url, "lifespan"))
+    await upgrade_database(engine)
+    await engine.dispose()
+    monkeypatch.setattr(main, "engine", engine)
+    monkeypatch.setattr(main, "replica_engine", None)
+    monkeypatch.setattr(main.settings, "DB_POOL_WARMUP", 2)
+
+    async with main.lifespan(main.app):
+        assert get_pool_stats(engine)["checked_in"] == 2
+        assert APP_STARTUP_PHASE_DURATION.get("schema_check") > 0
+
+
+def test_app_import_skips_heavy_modules():
+    """Test importing the app leaves Alembic, passlib and jose unloaded."""
+    code = (
+        "import sys, app.main; "
+        "print(sorted(m for m in ('alembic', 'passlib', 'jose') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            "PATH": "",
+            "SECRET_KEY": "test-secret-key",
+            "DATABASE_URL": "sqlite+aiosqlite:///:memory:",
+        },
+    )
+    assert result.stdout.strip() == "[]"
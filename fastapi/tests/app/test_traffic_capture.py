@@ -0,0 +1,99 @@
+"""Tests for anonymized request trace capture."""
+
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.traffic_capture import (
+    annotate_trace,
+    current_trace,
+    pseudonymize,
+    trace_writer,
+)
+from app.db.models import List as ListModel
+from app.db.models import User
+from app.settings import settings
+
+
+def test_pseudonyms_are_stable_and_opaque():
+    """Test the same ID always maps to the same short pseudonym."""
+    value = uuid.uuid4()
+
+    assert pseudonymize(value) == pseudonymize(value)
+    assert pseudonymize(value) != pseudonymize(uuid.uuid4())
+    assert len(pseudonymize(value)) == 16
+    assert value.hex[:16] != pseudonymize(value)
+
+
+def test_annotate_without_capture_is_noop():
+    """Test annotations are dropped when no trace is being recorded."""
+    annotate_trace(list=uuid.uuid4())
+    assert current_trace.get() is None
+
+    trace: dict = {}
+    token = current_trace.set(trace)
+    try:
+        list_id = uuid.uuid4()
+        annotate_trace(list=list_id, tier_set="good", tier_set_size=3)
+    finally:
+        current_trace.reset(token)
+    assert trace == {
+        "list": pseudonymize(list_id),
+        "tier_set": "good",
+        "tier_set_size": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_middleware_writes_anonymized_traces(
+    client: AsyncClient,
+    test_user: User,
+    test_list: ListModel,
+    auth_headers: dict,
+    tmp_path,
+    monkeypatch,
+):
+    """Test captured lines carry route templates and pseudonyms, never raw IDs."""
+    path = tmp_path / "traffic-{pid}.jsonl"
+    monkeypatch.setattr(settings, "TRAFFIC_CAPTURE_PATH", str(path))
+
+    await client.get(f"/api/lists/{test_list.list_id}/items", headers=auth_headers)
+    await client.post(
+        "/api/items/",
+        params={"list_title": test_list.title},
+        json={"name": "First", "tier_set": "good"},
+        headers=auth_headers,
+    )
+    trace_writer.close()
+
+    (written,) = tmp_path.glob("traffic-*.jsonl")
+    content = written.read_text()
+    traces = [json.loads(line) for line in content.splitlines()]
+    assert [trace["route"] for trace in traces] == [
+        "/api/lists/{list_id}/items",
+        "/api/items/",
+    ]
+    assert traces[0]["user"] == pseudonymize(test_user.user_id)
+    assert traces[0]["list"] == pseudonymize(test_list.list_id)
+    assert traces[0]["list_size"] == 0
+    assert traces[1]["tier_set"] == "good"
+    assert traces[1]["tier_set_size"] == 0
+    assert traces[1]["status"] == 200
+    assert str(test_list.list_id) not in content
+    assert str(test_user.user_id) not in content
+    assert test_list.title not in content
+
+
+@pytest.mark.asyncio
+async def test_capture_off_writes_nothing(
+    client: AsyncClient, test_list: ListModel, auth_headers: dict, tmp_path
+):
+    """Test nothing is recorded unless a capture path is configured."""
+    assert settings.TRAFFIC_CAPTURE_PATH is None
+
+    response = await client.get(f"/api/lists/{test_list.list_id}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert not list(tmp_path.iterdir())
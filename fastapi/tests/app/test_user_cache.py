@@ -0,0 +1,93 @@
+"""Tests for the authenticated user cache."""
+
+import uuid
+from datetime import datetime
+
+from app.core.user_cache import UserCache
+from app.schemas.user import User
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_user() -> User:
+    """Create a user snapshot."""
+    return User(
+        user_id=uuid.uuid4(),
+        email="cached@example.com",
+        username="cached",
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        is_admin=False,
+    )
+
+
+def test_get_and_set():
+    """Test a snapshot is returned for the same user and issue time only."""
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    user = make_user()
+    cache.set(user.user_id, 100, user)
+
+    assert cache.get(user.user_id, 100) is user
+    assert cache.get(user.user_id, 200) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_entries_expire():
+    """Test snapshots are dropped once their TTL has passed."""
+    clock = FakeClock()
+    cache = UserCache(max_entries=10, ttl_seconds=30, clock=clock)
+    user = make_user()
+    cache.set(user.user_id, 100, user)
+
+    clock.now = 29.0
+    assert cache.get(user.user_id, 100) is user
+    clock.now = 30.0
+    assert cache.get(user.user_id, 100) is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_evicts_least_recently_used():
+    """Test the entry limit evicts the least recently used snapshot."""
+    cache = UserCache(max_entries=2, ttl_seconds=60)
+    first, second, third = make_user(), make_user(), make_user()
+    cache.set(first.user_id, 1, first)
+    cache.set(second.user_id, 1, second)
+    cache.get(first.user_id, 1)
+    cache.set(third.user_id, 1, third)
+
+    assert cache.get(second.user_id, 1) is None
+    assert cache.get(first.user_id, 1) is first
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_drops_every_token():
+    """Test invalidation removes the user's snapshots for all tokens."""
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    user, other = make_user(), make_user()
+    cache.set(user.user_id, 1, user)
+    cache.set(user.user_id, 2, user)
+    cache.set(other.user_id, 1, other)
+
+    cache.invalidate(user.user_id)
+    assert cache.get(user.user_id, 1) is None
+    assert cache.get(user.user_id, 2) is None
+    assert cache.get(other.user_id, 1) is other
+
+
+def test_disabled_with_zero_ttl():
+    """Test a zero TTL disables caching."""
+    cache = UserCache(max_entries=10, ttl_seconds=0)
+    user = make_user()
+    cache.set(user.user_id, 1, user)
+    assert cache.stats()["entries"] == 0
@@ -5,7 +5,11 @@ from datetime import datetime
 
 import pytest
 
-from app.core.algorithm import find_next_comparison
+from app.core.algorithm import (
+    find_next_comparison,
+    find_next_merge_pair,
+    merge_by_decisions,
+)
 from app.schemas.item import Comparison, Item
 
 
@@ -176,3 +180,47 @@ async def test_find_next_comparison_edge_case_two_items():
     assert result.comparison_index == 0
     assert result.target_item == item1
     assert result.done is True  # 1 - 0 = 1, so done=True
+
+
+def test_find_next_merge_pair_start():
+    """Test that a merge starts with the lowest item of each chain."""
+    assert find_next_merge_pair(3, 2, "") == (0, 0)
+
+
+def test_find_next_merge_pair_advances_per_decision():
+    """Test that each decision consumes one item from one chain."""
+    assert find_next_merge_pair(3, 2, "L") == (1, 0)
+    assert find_next_merge_pair(3, 2, "LR") == (1, 1)
+
+
+def test_find_next_merge_pair_done_when_chain_exhausted():
+    """Test that the merge stops asking once either chain runs out."""
+    assert find_next_merge_pair(3, 2, "RR") is None
+    assert find_next_merge_pair(0, 2, "") is None
+    assert find_next_merge_pair(2, 0, "") is None
+
+
+def test_merge_needs_at_most_n_plus_m_minus_one_comparisons():
+    """Test the worst case of a perfectly interleaved merge."""
+    left = [1, 3, 5, 7]
+    right = [2, 4, 6]
+    decisions = ""
+    pair = find_next_merge_pair(len(left), len(right), decisions)
+    while pair is not None:
+        # The lower value is placed first
+        decisions += "L" if left[pair[0]] < right[pair[1]] else "R"
+        pair = find_next_merge_pair(len(left), len(right), decisions)
+
+    assert len(decisions) == len(left) + len(right) - 1
+    assert merge_by_decisions(left, right, decisions) == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_merge_by_decisions_appends_remainder():
+    """Test that the unexhausted chain is appended in order."""
+    assert merge_by_decisions([1, 2], [3, 4, 5], "LL") == [1, 2, 3, 4, 5]
+    assert merge_by_decisions([4, 5], [1, 2], "RR") == [1, 2, 4, 5]
+
+
+def test_merge_by_decisions_ignores_stale_decisions():
+    """Test that decisions beyond the end of a chain are skipped."""
+    assert merge_by_decisions([1], [2], "LLR") == [1, 2]
@@ -0,0 +1,57 @@
+"""Tests for opaque pagination cursors."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.pagination import (
+    decode_cursor,
+    decode_keyset_cursor,
+    encode_cursor,
+    encode_keyset_cursor,
+)
+
+
+def test_cursor_round_trip():
+    """Test values survive encoding and decoding."""
+    cursor = encode_cursor("good", 41)
+    assert decode_cursor(cursor, 2) == ["good", 41]
+
+
+def test_cursor_is_url_safe():
+    """Test cursors can be passed as query parameters without escaping."""
+    cursor = encode_cursor("2024-01-01T00:00:00+00:00", "a" * 40)
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "e30"])
+def test_decode_malformed_cursor(cursor):
+    """Test malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
+
+
+def test_decode_cursor_wrong_size():
+    """Test a cursor with the wrong number of values is rejected."""
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor("good"), 2)
+
+
+def test_keyset_cursor_round_trip():
+    """Test (timestamp, id) sort keys survive encoding and decoding."""
+    timestamp = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+    cursor = encode_keyset_cursor(timestamp, row_id)
+    assert decode_keyset_cursor(cursor) == (timestamp, row_id)
+
+
+@pytest.mark.parametrize(
+    "values", [(1, 2), ("not-a-date", str(uuid.uuid4())), ("2024-05-01", "x")]
+)
+def test_decode_malformed_keyset_cursor(values):
+    """Test keyset cursors with bad values raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_keyset_cursor(encode_cursor(*values))
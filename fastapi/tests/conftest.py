@@ -8,6 +8,7 @@ from typing import AsyncGenerator, Generator
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only"
 os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
 os.environ["APP_ENV"] = "test"
+os.environ["QUERY_BUDGET_STRICT"] = "true"
 
 import pytest  # noqa: E402
 import pytest_asyncio  # noqa: E402
@@ -19,12 +20,17 @@ from sqlalchemy.ext.asyncio import (  # noqa: E402
 )
 
 from app.core.auth import create_access_token  # noqa: E402
-from app.db.database import get_db  # noqa: E402
+from app.core.response_cache import response_cache  # noqa: E402
+from app.core.user_cache import user_cache  # noqa: E402
+from app.db.database import (  # noqa: E402
+    enable_sqlite_foreign_keys,
+    get_db,
+    get_read_db,
+)
 from app.db.models import Base, User, List as ListModel, Item as ItemModel  # noqa: E402
 from app.main import app  # noqa: E402
 from app.core.security import get_password_hash  # noqa: E402
 
-
 # Test database URL - using SQLite for tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -37,6 +43,16 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator:
+    """Start every test with empty in-process caches."""
+    response_cache.clear()
+    user_cache.clear()
+    yield
+    response_cache.clear()
+    user_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_db() -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session."""
@@ -46,6 +62,7 @@ async def test_db() -> AsyncGenerator[AsyncSession, None]:
         echo=False,
         connect_args={"check_same_thread": False},
     )
+    enable_sqlite_foreign_keys(engine)
 
     # Create tables
     async with engine.begin() as conn:
@@ -74,7 +91,15 @@ async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield test_db
 
+    async def override_get_read_db() -> AsyncGenerator[AsyncSession, None]:
+        # Same connection as test_db, but writes are refused like in get_read_db
+        async with AsyncSession(
+            test_db.bind, expire_on_commit=False, info={"read_only": True}
+        ) as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
@@ -0,0 +1,26 @@
+"""Tests for admin endpoints."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+class TestAdminStats:
+    """Tests for the runtime statistics endpoint."""
+
+    async def test_read_stats_as_admin(
+        self, client: AsyncClient, admin_auth_headers: dict
+    ):
+        """Test admins can read cache statistics."""
+        response = await client.get("/api/admin/stats", headers=admin_auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert "hit_ratio" in data["response_cache"]
+        assert "hit_ratio" in data["user_cache"]
+
+    async def test_read_stats_requires_admin(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test regular users cannot read statistics."""
+        response = await client.get("/api/admin/stats", headers=auth_headers)
+        assert response.status_code == 403
@@ -0,0 +1,49 @@
+"""Tests for the ranking benchmark script."""
+
+import random
+
+from scripts.benchmark_ranking import (
+    TIER_SET_MIX,
+    benchmark_cases,
+    compare,
+    make_list,
+    make_mixed,
+    measure,
+)
+
+
+def test_synthetic_lists_form_valid_chains():
+    """Test every tier set of a synthetic list sorts into one full chain."""
+    items = make_list(100, random.Random(1))
+    assert {item.tier_set for item in items} == set(TIER_SET_MIX)
+
+    cases = benchmark_cases(100)
+    assert len(cases["get_items_sorted_by_tier_set"]()) == 100
+    assert len(cases["sort_items_linked_list_style"]()) == 100
+
+
+def test_mixed_lists_include_unranked_items():
+    """Test the filter benchmark has items still waiting to be ranked."""
+    items = make_mixed(1000, random.Random(1))
+    assert 0 < sum(item.tier is None for item in items) < len(items)
+
+
+def test_measure_records_time_and_allocations():
+    """Test a measurement reports timings and allocated bytes."""
+    stats = measure(lambda: [0] * 1000, repeat=2)
+    assert stats["median_us"] >= stats["min_us"] > 0
+    assert stats["peak_alloc_bytes"] >= 8000
+
+
+def test_compare_flags_slower_cases():
+    """Test only cases slower than the threshold are reported."""
+    baseline = {
+        "sort": {"10": {"median_us": 10.0}, "100": {"median_us": 100.0}},
+    }
+    current = {
+        "sort": {"10": {"median_us": 11.0}, "100": {"median_us": 150.0}},
+        "new_case": {"10": {"median_us": 5.0}},
+    }
+    regressions = compare(current, baseline, threshold=1.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("sort at 100")
@@ -0,0 +1,46 @@
+"""Tests for the Argon2 calibration script."""
+
+from pathlib import Path
+
+from scripts.calibrate_argon2 import MIN_MEMORY_KIB, calibrate, write_env_settings
+
+
+def fake_measure(time_cost: int, memory_kib: int, parallelism: int) -> float:
+    """Pretend each pass over each MiB takes a millisecond."""
+    return time_cost * memory_kib / 1024 / 1000
+
+
+def test_calibrate_halves_memory_then_adds_passes():
+    """Test the search stays within the target latency."""
+    time_cost, memory_kib, parallelism = calibrate(
+        0.1, parallelism=2, max_memory_kib=256 * 1024, measure=fake_measure
+    )
+    assert (time_cost, memory_kib, parallelism) == (1, 64 * 1024, 2)
+    assert fake_measure(time_cost, memory_kib, parallelism) <= 0.1
+
+    time_cost, memory_kib, _ = calibrate(
+        0.1, parallelism=1, max_memory_kib=32 * 1024, measure=fake_measure
+    )
+    assert (time_cost, memory_kib) == (3, 32 * 1024)
+
+
+def test_calibrate_never_goes_below_minimum_memory():
+    """Test slow hosts still get the minimum memory cost."""
+    time_cost, memory_kib, _ = calibrate(
+        0.001, parallelism=1, max_memory_kib=64 * 1024, measure=fake_measure
+    )
+    assert time_cost == 1
+    assert memory_kib == MIN_MEMORY_KIB
+
+
+def test_write_env_settings_replaces_keys(tmp_path: Path):
+    """Test existing keys are replaced and other lines are kept."""
+    env_file = tmp_path / ".env.local"
+    env_file.write_text("LOG_LEVEL=DEBUG\nARGON2_TIME_COST=9\n")
+
+    write_env_settings(
+        env_file, {"ARGON2_TIME_COST": "2", "ARGON2_MEMORY_COST": "32768"}
+    )
+    assert env_file.read_text() == (
+        "LOG_LEVEL=DEBUG\nARGON2_TIME_COST=2\nARGON2_MEMORY_COST=32768\n"
+    )
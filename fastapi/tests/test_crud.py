@@ -16,6 +16,7 @@ from app.db.models import (
     List as ListModel,
     User,
 )
+from app.services.list_service import reconcile_list_counters
 
 
 @pytest.mark.asyncio
@@ -345,6 +346,82 @@ class TestItemCRUD:
         result = await item_crud.get_by_id(test_db, item_id)
         assert result is None
 
+    async def test_delete_item_closes_position_gap(
+        self, test_db: AsyncSession, item_factory
+    ):
+        """Test deleting a ranked item shifts the items above it down."""
+        items = [item_factory(name=f"Item {i}") for i in range(3)]
+        for position, item in enumerate(items):
+            item.position = position
+            test_db.add(item)
+        await test_db.commit()
+
+        await item_crud.delete(test_db, items[0])
+        await test_db.commit()
+
+        assert items[1].position == 0
+        assert items[2].position == 1
+
+    async def test_get_ranked_window(
+        self, test_db: AsyncSession, test_list: ListModel, item_factory
+    ):
+        """Test windows are ordered by position and skip unranked items."""
+        items = [item_factory(name=f"Item {i}") for i in range(4)]
+        for position, item in enumerate(items[:3]):
+            item.position = position
+        for item in items:
+            test_db.add(item)
+        await test_db.commit()
+
+        window = await item_crud.get_ranked_window(
+            test_db, test_list.list_id, "good", limit=2, after_position=0
+        )
+        assert [item.name for item in window] == ["Item 1", "Item 2"]
+
+        counts = await item_crud.count_ranked_by_tier_set(test_db, test_list.list_id)
+        assert counts == {"good": 3}
+
+    async def test_delete_in_chunks_keeps_counters_when_interrupted(
+        self,
+        test_db: AsyncSession,
+        test_list: ListModel,
+        item_factory,
+        monkeypatch,
+    ):
+        """Test counters match the remaining items after a run fails partway."""
+        list_id = test_list.list_id
+        test_db.add_all(
+            item_factory(name=f"Item {i}", tier=tier)
+            for i, tier in enumerate(["S", "A", "A", None, "F"])
+        )
+        await test_db.commit()
+
+        commit = test_db.commit
+        commits = 0
+
+        async def failing_commit() -> None:
+            nonlocal commits
+            commits += 1
+            if commits == 2:
+                raise RuntimeError("connection lost")
+            await commit()
+
+        monkeypatch.setattr(test_db, "commit", failing_commit)
+        with pytest.raises(RuntimeError):
+            await item_crud.delete_in_chunks(test_db, [list_id], 2)
+        monkeypatch.undo()
+        await test_db.rollback()
+
+        result = await test_db.execute(
+            select(ItemModel).where(ItemModel.list_id == list_id)
+        )
+        assert len(result.scalars().all()) == 3
+        assert await reconcile_list_counters(test_db) == {}
+
+        deleted = await item_crud.delete_in_chunks(test_db, [list_id], 2)
+        assert deleted == 3
+        assert await reconcile_list_counters(test_db) == {}
+
 
 @pytest.mark.asyncio
 class TestListCRUD:
@@ -439,6 +516,114 @@ class TestListCRUD:
         )
         assert len(result) == 2
 
+    async def test_version_bumped_by_item_changes(
+        self, test_db: AsyncSession, test_list: ListModel, test_user: User
+    ):
+        """Test adding, editing and deleting items bumps the list version."""
+        version = await list_crud.get_version(
+            test_db, test_list.list_id, test_user.user_id
+        )
+
+        item = ItemModel(
+            item_id=uuid.uuid4(),
+            list_id=test_list.list_id,
+            name="Versioned",
+            tier_set="good",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        test_db.add(item)
+        await test_db.flush()
+        item.name = "Versioned again"
+        await test_db.flush()
+        await test_db.delete(item)
+        await test_db.commit()
+
+        assert (
+            await list_crud.get_version(test_db, test_list.list_id, test_user.user_id)
+            == version + 3
+        )
+
+    async def test_version_not_bumped_without_changes(
+        self, test_db: AsyncSession, test_list: ListModel, test_item: ItemModel
+    ):
+        """Test flushing an unchanged item leaves the version alone."""
+        versions = await list_crud.get_versions_by_user(test_db, test_list.user_id)
+        test_item.name = test_item.name
+        await test_db.commit()
+        assert await list_crud.get_versions_by_user(test_db, test_list.user_id) == (
+            versions
+        )
+
+    async def test_counters_follow_item_changes(
+        self,
+        test_db: AsyncSession,
+        test_list: ListModel,
+        test_item: ItemModel,
+        test_user: User,
+    ):
+        """Test item creates, tier changes and deletes update the list counters."""
+
+        async def counters() -> tuple:
+            rows = await list_crud.get_by_user_with_stats(test_db, test_user.user_id)
+            return tuple(rows[0][1:])
+
+        assert await counters() == (1, 0, 1, 0, 0, 0, 0)
+
+        item = ItemModel(
+            item_id=uuid.uuid4(),
+            list_id=test_list.list_id,
+            name="Counted",
+            tier="S",
+            tier_set="good",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        test_db.add(item)
+        await test_db.commit()
+        assert await counters() == (2, 1, 1, 0, 0, 0, 0)
+
+        test_item.tier = "F"
+        await test_db.commit()
+        assert await counters() == (2, 1, 0, 0, 0, 0, 1)
+
+        await item_crud.delete(test_db, item)
+        assert await counters() == (1, 0, 0, 0, 0, 0, 1)
+
+    async def test_counters_follow_item_moves(
+        self,
+        test_db: AsyncSession,
+        test_list: ListModel,
+        test_item: ItemModel,
+        test_user: User,
+    ):
+        """Test moving an item between lists updates both lists' counters."""
+        other = ListModel(
+            list_id=uuid.uuid4(),
+            user_id=test_user.user_id,
+            title="Other List",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        test_db.add(other)
+        await test_db.flush()
+        test_item.list_id = other.list_id
+        await test_db.commit()
+
+        counters = await list_crud.get_counters(test_db)
+        assert counters[test_list.list_id]["item_count"] == 0
+        assert counters[test_list.list_id]["tier_a"] == 0
+        assert counters[other.list_id]["item_count"] == 1
+        assert counters[other.list_id]["tier_a"] == 1
+
+    async def test_counters_match_recount(
+        self, test_db: AsyncSession, test_list: ListModel, test_item: ItemModel
+    ):
+        """Test stored counters agree with a recount of the items table."""
+        assert await list_crud.get_counters(
+            test_db
+        ) == await list_crud.count_items_by_list(test_db)
+
     async def test_create_list(self, test_db: AsyncSession, test_user: User):
         """Test creating a list."""
         list_obj = ListModel(
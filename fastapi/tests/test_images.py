@@ -0,0 +1,201 @@
+"""Tests for image upload and serving endpoints."""
+
+from typing import AsyncIterator, Generator
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.endpoints.images import MULTIPART_OVERHEAD_BYTES
+from app.core.images import IMMUTABLE_CACHE_CONTROL, image_store
+from app.db.models import List as ListModel
+from app.settings import settings
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"pixels" * 10
+
+
+@pytest.fixture(autouse=True)
+def image_root(tmp_path, monkeypatch) -> Generator:
+    """Store images in a temporary directory without generating thumbnails."""
+    monkeypatch.setattr(image_store, "root", tmp_path)
+    monkeypatch.setattr(image_store, "pillow_missing", True)
+    yield tmp_path
+
+
+async def upload(client: AsyncClient, headers: dict, data: bytes = PNG) -> dict:
+    """Upload an image and return the response body."""
+    response = await client.post(
+        "/api/images/",
+        files={"file": ("photo.jpg", data, "image/jpeg")},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.asyncio
+class TestUploadImage:
+    """Tests for the upload endpoint."""
+
+    async def test_upload_is_content_addressed(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test identical uploads return the same image, typed by content."""
+        first = await upload(client, auth_headers)
+        second = await upload(client, auth_headers)
+
+        assert first == second
+        assert first["image_id"].endswith(".png")
+        assert first["image_url"].endswith(f"/api/images/{first['image_id']}")
+        assert first["thumbnail_url"] == first["image_url"] + "/thumbnail"
+
+    async def test_upload_rejects_non_images(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test files that are not a supported image format are refused."""
+        response = await client.post(
+            "/api/images/",
+            files={"file": ("evil.png", b"<svg onload=alert(1)>", "image/png")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 415
+
+    async def test_upload_rejects_large_files(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        """Test uploads over the size limit are refused."""
+        monkeypatch.setattr(settings, "IMAGE_MAX_UPLOAD_BYTES", len(PNG) - 1)
+        response = await client.post(
+            "/api/images/",
+            files={"file": ("photo.png", PNG, "image/png")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 413
+
+    async def test_upload_refused_by_declared_length(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        """Test bodies declared over the limit are refused before being read."""
+        monkeypatch.setattr(settings, "IMAGE_MAX_UPLOAD_BYTES", 1024)
+        body = b"x" * (1024 + MULTIPART_OVERHEAD_BYTES + 1)
+        response = await client.post(
+            "/api/images/",
+            content=body,
+            headers={**auth_headers, "Content-Type": "multipart/form-data; boundary=b"},
+        )
+        assert response.status_code == 413
+
+    async def test_upload_refused_while_streaming(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        """Test chunked bodies are cut off once they pass the limit."""
+        monkeypatch.setattr(settings, "IMAGE_MAX_UPLOAD_BYTES", 1024)
+        yielded = []
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield (
+                b"--b\r\n"
+                b"Content-Disposition: form-data; name=file; filename=a.png\r\n\r\n"
+            )
+            for _ in range(100):
+                yielded.append(1)
+                yield PNG * 100
+
+        response = await client.post(
+            "/api/images/",
+            content=chunks(),
+            headers={**auth_headers, "Content-Type": "multipart/form-data; boundary=b"},
+        )
+        assert response.status_code == 413
+        assert "content-length" not in response.request.headers
+        assert len(yielded) < 100
+
+    async def test_upload_requires_authentication(self, client: AsyncClient):
+        """Test anonymous uploads are refused."""
+        response = await client.post(
+            "/api/images/", files={"file": ("photo.png", PNG, "image/png")}
+        )
+        assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+class TestReadImage:
+    """Tests for serving originals and thumbnails."""
+
+    async def test_original_is_immutable(self, client: AsyncClient, auth_headers: dict):
+        """Test originals are served with immutable caching and revalidate."""
+        uploaded = await upload(client, auth_headers)
+
+        response = await client.get(f"/api/images/{uploaded['image_id']}")
+        assert response.status_code == 200
+        assert response.content == PNG
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+        cached = await client.get(
+            f"/api/images/{uploaded['image_id']}",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        assert cached.status_code == 304
+
+    async def test_thumbnail_falls_back_to_original(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test a missing thumbnail serves the original without long caching."""
+        uploaded = await upload(client, auth_headers)
+
+        response = await client.get(f"/api/images/{uploaded['image_id']}/thumbnail")
+
+        assert response.status_code == 200
+        assert response.content == PNG
+        assert response.headers["cache-control"] == "no-cache"
+
+    async def test_thumbnail_is_immutable_once_generated(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test a generated thumbnail replaces the original for revalidating clients."""
+        uploaded = await upload(client, auth_headers)
+        fallback = await client.get(f"/api/images/{uploaded['image_id']}/thumbnail")
+        path = image_store.thumbnail_path(uploaded["image_id"])
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"RIFF\x00\x00\x00\x00WEBPthumb")
+
+        response = await client.get(
+            f"/api/images/{uploaded['image_id']}/thumbnail",
+            headers={"If-None-Match": fallback.headers["etag"]},
+        )
+
+        assert response.status_code == 200
+        assert response.content == path.read_bytes()
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    @pytest.mark.parametrize(
+        "image_id", ["../../etc/passwd", "a" * 64 + ".png", "a" * 64 + ".svg"]
+    )
+    async def test_unknown_images_are_not_found(
+        self, client: AsyncClient, image_id: str
+    ):
+        """Test invalid or unknown image IDs are 404s."""
+        response = await client.get(f"/api/images/{image_id}")
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_items_reference_thumbnails(
+    client: AsyncClient, test_list: ListModel, auth_headers: dict
+):
+    """Test items with uploaded images expose their thumbnail URL."""
+    uploaded = await upload(client, auth_headers)
+    created = await client.post(
+        "/api/items/",
+        params={"list_title": test_list.title},
+        json={"name": "Photo", "image_url": uploaded["image_url"], "tier_set": "good"},
+        headers=auth_headers,
+    )
+    assert created.json()["thumbnail_url"] == uploaded["thumbnail_url"]
+
+    response = await client.get(
+        f"/api/lists/{test_list.list_id}/items", headers=auth_headers
+    )
+    (item,) = response.json()
+    assert item["thumbnail_url"] == uploaded["thumbnail_url"]
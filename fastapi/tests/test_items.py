@@ -910,3 +910,121 @@ class TestItemCreateValidation:
         assert response.status_code == 200
         data = response.json()
         assert data["description"] == ""
+
+
+@pytest.mark.asyncio
+class TestCompactComparisons:
+    """Tests for compact comparison payloads and expansion."""
+
+    SUMMARY_KEYS = {"item_id", "name", "image_url", "thumbnail_url"}
+
+    async def start_session(
+        self,
+        client: AsyncClient,
+        test_db: AsyncSession,
+        test_list: ListModel,
+        auth_headers: dict,
+        item_factory,
+        params: dict | None = None,
+    ) -> dict:
+        """Rank a chain of eight items and start a session for a new one."""
+        chain = [
+            item_factory(name=f"Ranked {i}", image_url=f"https://example.com/{i}.jpg")
+            for i in range(8)
+        ]
+        for i, item in enumerate(chain):
+            item.position = i
+            item.prev_item_id = chain[i - 1].item_id if i else None
+            item.next_item_id = chain[i + 1].item_id if i < 7 else None
+        test_db.add_all(chain)
+        await test_db.commit()
+
+        response = await client.post(
+            "/api/items/",
+            params={"list_title": test_list.title, **(params or {})},
+            json={"name": "Newcomer", "description": "Long text", "tier_set": "good"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    async def test_start_sends_reference_once_and_summarizes_target(
+        self,
+        client: AsyncClient,
+        test_db: AsyncSession,
+        test_list: ListModel,
+        auth_headers: dict,
+        item_factory,
+    ):
+        """Test the first step has the full reference and later steps omit it."""
+        session = await self.start_session(
+            client, test_db, test_list, auth_headers, item_factory
+        )
+        first = session["current_comparison"]
+        assert first["reference_item"]["description"] == "Long text"
+        assert set(first["target_item"]) == self.SUMMARY_KEYS
+
+        response = await client.post(
+            "/api/items/comparison/result",
+            params={"session_id": session["session_id"]},
+            json={"result": "better"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        step = response.json()["current_comparison"]
+        assert step["reference_item"] is None
+        assert set(step["target_item"]) == self.SUMMARY_KEYS
+        assert step["target_item"]["item_id"] != first["target_item"]["item_id"]
+
+        status_response = await client.get(
+            f"/api/items/comparison/{session['session_id']}/status",
+            headers=auth_headers,
+        )
+        resumed = status_response.json()["current_comparison"]
+        assert resumed["reference_item"] is None
+        assert resumed["target_item"] == step["target_item"]
+
+    async def test_expand_returns_full_items(
+        self,
+        client: AsyncClient,
+        test_db: AsyncSession,
+        test_list: ListModel,
+        auth_headers: dict,
+        item_factory,
+    ):
+        """Test expand restores full reference and target items."""
+        expand = {"expand": ["reference_item", "target_item"]}
+        session = await self.start_session(
+            client, test_db, test_list, auth_headers, item_factory, expand
+        )
+        assert "created_at" in session["current_comparison"]["target_item"]
+
+        response = await client.post(
+            "/api/items/comparison/result",
+            params={"session_id": session["session_id"], **expand},
+            json={"result": "worse"},
+            headers=auth_headers,
+        )
+        step = response.json()["current_comparison"]
+        assert step["reference_item"]["name"] == "Newcomer"
+        assert step["target_item"]["list_id"] == str(test_list.list_id)
+
+        status_response = await client.get(
+            f"/api/items/comparison/{session['session_id']}/status",
+            params={"expand": "reference_item"},
+            headers=auth_headers,
+        )
+        resumed = status_response.json()["current_comparison"]
+        assert resumed["reference_item"] == step["reference_item"]
+        assert set(resumed["target_item"]) == self.SUMMARY_KEYS
+
+    async def test_unknown_expansion_is_rejected(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test only comparison item fields can be expanded."""
+        response = await client.get(
+            f"/api/items/comparison/{uuid.uuid4()}/status",
+            params={"expand": "list"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
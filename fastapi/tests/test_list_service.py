@@ -1,15 +1,24 @@
 """Tests for list_service module - pure function unit tests."""
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import List
 
+import pytest
+from pydantic import HttpUrl, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud import item as item_crud
 from app.db.models import Item as ItemModel
+from app.db.models import List as ListModel
+from app.schemas.item import Item
 from app.services.list_service import (
     build_list_response,
     build_list_simple_response,
     get_items_sorted_by_tier_set,
+    get_ranked_items_window,
     group_items_by_tier_set,
+    serialize_items,
 )
 
 
@@ -300,3 +309,58 @@ class TestBuildListSimpleResponse:
         assert result["tier_distribution"]["C"] == 0
         assert result["tier_distribution"]["D"] == 0
         assert result["tier_distribution"]["F"] == 0
+
+
+@pytest.mark.asyncio
+class TestSerializeItems:
+    """Tests for the ORM-free item serializer."""
+
+    async def test_rows_serialize_like_the_item_model(
+        self, test_db: AsyncSession, test_list: ListModel
+    ):
+        """Test row output is byte for byte what the Item model produces."""
+        ids = [uuid.uuid4() for _ in range(3)]
+        fields = [
+            ("Café ☕", "https://Example.com", "A", "good", 2.5, 'quoted "text"'),
+            ("Plain", "https://example.com/a b?q=1#x", "S", "good", None, None),
+            ("Unranked", None, None, "mid", None, ""),
+        ]
+        for index, (name, url, tier, tier_set, rating, description) in enumerate(
+            fields
+        ):
+            test_db.add(
+                ItemModel(
+                    item_id=ids[index],
+                    list_id=test_list.list_id,
+                    name=name,
+                    description=description,
+                    # Stored the way the API stores it
+                    image_url=str(HttpUrl(url)) if url else None,
+                    prev_item_id=ids[0] if index == 1 else None,
+                    next_item_id=ids[1] if index == 0 else None,
+                    position=index if tier else None,
+                    rating=rating,
+                    tier=tier,
+                    tier_set=tier_set,
+                    created_at=datetime(2024, 1, 2, 3, 4, 5, 678901, timezone.utc),
+                    updated_at=datetime.now(timezone.utc),
+                )
+            )
+        await test_db.commit()
+
+        orm_items = get_items_sorted_by_tier_set(
+            await item_crud.get_by_list_id(test_db, test_list.list_id)
+        )
+        rows = get_items_sorted_by_tier_set(
+            await item_crud.get_rows_by_list_id(test_db, test_list.list_id)
+        )
+        model_adapter = TypeAdapter(List[Item])
+        expected = model_adapter.dump_json(
+            model_adapter.validate_python(orm_items, from_attributes=True)
+        )
+        assert serialize_items(rows) == expected
+
+        window, _ = await get_ranked_items_window(test_db, test_list.list_id, 10)
+        assert serialize_items(window) == model_adapter.dump_json(
+            model_adapter.validate_python(orm_items[:2], from_attributes=True)
+        )
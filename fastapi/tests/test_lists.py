@@ -1,14 +1,72 @@
 """Tests for list endpoints."""
 
+import csv
+import io
+import json
 import uuid
 from datetime import datetime
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.db.models import User, List as ListModel, Item as ItemModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.constants import MERGE_IN_PROGRESS_ERROR
+from app.core.response_cache import response_cache
+from app.db.database import get_session_factory
+from app.db.models import (
+    ComparisonSession as ComparisonSessionModel,
+    Item as ItemModel,
+    List as ListModel,
+    MergeSession as MergeSessionModel,
+    User,
+)
+from app.main import app
+from app.settings import settings
+from app.utils.helper import sort_items_linked_list_style
+
+
+async def create_ranked_chain(
+    test_db: AsyncSession, list_id: uuid.UUID, names: list[str], tier_set: str = "good"
+) -> list[ItemModel]:
+    """Create a linked chain of ranked items, sorted from lowest to highest."""
+    item_ids = [uuid.uuid4() for _ in names]
+    items = []
+    for i, name in enumerate(names):
+        item = ItemModel(
+            item_id=item_ids[i],
+            list_id=list_id,
+            name=name,
+            description=None,
+            image_url=None,
+            prev_item_id=item_ids[i - 1] if i > 0 else None,
+            next_item_id=item_ids[i + 1] if i + 1 < len(names) else None,
+            position=i,
+            rating=None,
+            tier="A",
+            tier_set=tier_set,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        test_db.add(item)
+        items.append(item)
+    await test_db.commit()
+    return items
+
+
+async def create_list_for(test_db: AsyncSession, user: User, title: str) -> ListModel:
+    """Create an empty list owned by the given user."""
+    list_obj = ListModel(
+        list_id=uuid.uuid4(),
+        user_id=user.user_id,
+        title=title,
+        description=None,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    test_db.add(list_obj)
+    await test_db.commit()
+    return list_obj
 
 
 @pytest.mark.asyncio
@@ -114,6 +172,45 @@ class TestReadLists:
         response = await client.get("/api/lists/?skip=1", headers=auth_headers)
         assert response.status_code == 200
 
+    async def test_read_lists_cursor_pages(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test following X-Next-Cursor visits every list once, newest first."""
+        for i in range(4):
+            await create_list_for(test_db, test_user, f"Paged List {i}")
+
+        seen = []
+        params: dict = {"limit": 2}
+        while True:
+            response = await client.get(
+                "/api/lists/", params=params, headers=auth_headers
+            )
+            assert response.status_code == 200
+            seen.extend(response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if next_cursor is None:
+                break
+            params = {"limit": 2, "cursor": next_cursor}
+
+        assert len(seen) == 5
+        assert len({row["list_id"] for row in seen}) == 5
+        updated = [row["updated_at"] for row in seen]
+        assert updated == sorted(updated, reverse=True)
+
+    async def test_read_lists_invalid_cursor(
+        self, client: AsyncClient, test_list: ListModel, auth_headers: dict
+    ):
+        """Test a malformed cursor is rejected."""
+        response = await client.get(
+            "/api/lists/", params={"cursor": "garbage"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
 
 @pytest.mark.asyncio
 class TestCreateList:
@@ -443,6 +540,93 @@ class TestDeleteList:
         )
         assert len(result.scalars().all()) == 0
 
+    async def test_delete_list_is_one_cascading_statement(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test the database cascades items and sessions without loading them."""
+        list_id = test_list.list_id
+        items = await create_ranked_chain(
+            test_db, list_id, [f"Item {i}" for i in range(20)]
+        )
+        test_db.add(
+            ComparisonSessionModel(
+                session_id=uuid.uuid4(),
+                list_id=list_id,
+                new_item_id=items[0].item_id,
+                target_item_id=items[1].item_id,
+                tier_set="good",
+                is_complete=False,
+            )
+        )
+        await test_db.commit()
+
+        response = await client.delete(f"/api/lists/{list_id}", headers=auth_headers)
+        assert response.status_code == 204
+        # Auth, list lookup and a single DELETE, whatever the list size
+        assert int(response.headers["X-DB-Queries"]) <= 4
+
+        test_db.expire_all()
+        for model in (ItemModel, ComparisonSessionModel):
+            result = await test_db.execute(
+                select(model).where(model.list_id == list_id)
+            )
+            assert result.scalars().all() == []
+
+    async def test_delete_large_list_in_background(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+        monkeypatch,
+    ):
+        """Test lists over the threshold are emptied in chunks after a 202."""
+        monkeypatch.setattr(settings, "DELETE_IN_BACKGROUND_MIN_ITEMS", 3)
+        monkeypatch.setattr(settings, "DELETE_CHUNK_SIZE", 2)
+        app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+            test_db.bind, expire_on_commit=False
+        )
+        list_id = test_list.list_id
+        await create_ranked_chain(test_db, list_id, [f"Item {i}" for i in range(5)])
+        test_db.expire_all()  # Pick up the counters the flush hooks updated
+
+        try:
+            response = await client.delete(
+                f"/api/lists/{list_id}", headers=auth_headers
+            )
+        finally:
+            del app.dependency_overrides[get_session_factory]
+        assert response.status_code == 202
+
+        # The transport runs background tasks before returning the response
+        test_db.expire_all()
+        result = await test_db.execute(
+            select(ItemModel).where(ItemModel.list_id == list_id)
+        )
+        assert result.scalars().all() == []
+        assert await test_db.get(ListModel, list_id) is None
+
+    async def test_delete_small_list_below_background_threshold(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+        monkeypatch,
+    ):
+        """Test lists under the threshold are still deleted inline."""
+        monkeypatch.setattr(settings, "DELETE_IN_BACKGROUND_MIN_ITEMS", 10)
+        await create_ranked_chain(test_db, test_list.list_id, ["A", "B"])
+
+        response = await client.delete(
+            f"/api/lists/{test_list.list_id}", headers=auth_headers
+        )
+        assert response.status_code == 204
+
 
 @pytest.mark.asyncio
 class TestReadListItems:
@@ -562,6 +746,118 @@ class TestReadListItems:
         assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+class TestReadListItemsWindow:
+    """Tests for windowed and cursor-paginated item reads."""
+
+    async def test_window_limit_and_cursor(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test paging through all tier_sets with a cursor."""
+        await create_ranked_chain(test_db, test_list.list_id, ["g0", "g1", "g2"])
+        await create_ranked_chain(test_db, test_list.list_id, ["m0", "m1"], "mid")
+
+        names = []
+        params = {"limit": 2}
+        while True:
+            response = await client.get(
+                f"/api/lists/{test_list.list_id}/items",
+                params=params,
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) <= 2
+            names.extend(item["name"] for item in data)
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            params = {"limit": 2, "cursor": cursor}
+
+        assert names == ["g0", "g1", "g2", "m0", "m1"]
+
+    async def test_window_offset_spans_tier_sets(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test an offset that skips past a whole tier_set."""
+        await create_ranked_chain(test_db, test_list.list_id, ["g0", "g1"])
+        await create_ranked_chain(test_db, test_list.list_id, ["m0", "m1"], "mid")
+
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/items",
+            params={"offset": 3, "limit": 10},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()] == ["m1"]
+        assert "X-Next-Cursor" not in response.headers
+
+    async def test_window_tier_filters(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test filtering a window by tier_set and by tier."""
+        items = await create_ranked_chain(test_db, test_list.list_id, ["g0", "g1"])
+        items[1].tier = "S"
+        await create_ranked_chain(test_db, test_list.list_id, ["m0"], "mid")
+        await test_db.commit()
+
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/items",
+            params={"tier_set": "mid"},
+            headers=auth_headers,
+        )
+        assert [item["name"] for item in response.json()] == ["m0"]
+
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/items",
+            params={"tier": "S"},
+            headers=auth_headers,
+        )
+        data = response.json()
+        assert [item["name"] for item in data] == ["g1"]
+        assert data[0]["position"] == 1
+
+    async def test_window_invalid_cursor(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test a malformed cursor is rejected."""
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/items",
+            params={"cursor": "not-a-cursor"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    async def test_window_limit_validation(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test the window size is bounded."""
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/items",
+            params={"limit": 0},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 class TestReadListsWithStats:
     """Tests for reading lists with tier distribution stats."""
@@ -651,3 +947,668 @@ class TestReadListsWithStats:
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 5  # At least the 5 we created
+
+
+@pytest.mark.asyncio
+class TestMergeLists:
+    """Tests for merging two ranked lists."""
+
+    async def answer_merge(
+        self, client: AsyncClient, auth_headers: dict, data: dict
+    ) -> int:
+        """Answer merge questions by comparing the numeric item names."""
+        questions = 0
+        while data is not None:
+            left = int(data["left_item"]["name"])
+            right = int(data["right_item"]["name"])
+            response = await client.post(
+                "/api/lists/merge/result",
+                params={"session_id": data["session_id"]},
+                json={"result": "better" if left > right else "worse"},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            data = response.json()
+            questions += 1
+        return questions
+
+    async def test_merge_interleaves_chains(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test merging interleaved chains asks n + m - 1 questions."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        await create_ranked_chain(test_db, test_list.list_id, ["1", "3", "5", "7"])
+        await create_ranked_chain(test_db, source.list_id, ["2", "4", "6"])
+
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source.list_id)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tier_set"] == "good"
+        assert data["left_item"]["name"] == "1"
+        assert data["right_item"]["name"] == "2"
+
+        questions = await self.answer_merge(client, auth_headers, data)
+        assert questions == 6
+
+        result = await test_db.execute(
+            select(ItemModel).where(ItemModel.list_id == test_list.list_id)
+        )
+        merged = sort_items_linked_list_style(list(result.scalars().all()))
+        assert [item.name for item in merged] == ["1", "2", "3", "4", "5", "6", "7"]
+        assert [item.tier for item in merged] == ["A", "A", "A", "S", "S", "S", "S"]
+        assert [item.position for item in merged] == list(range(7))
+
+        # Source list is gone once its items are merged in
+        result = await test_db.execute(
+            select(ListModel).where(ListModel.list_id == source.list_id)
+        )
+        assert result.scalar_one_or_none() is None
+
+        # Counters follow the moved items
+        response = await client.get("/api/lists/", headers=auth_headers)
+        summary = response.json()[0]
+        assert summary["item_count"] == 7
+        assert summary["tier_distribution"]["S"] == 4
+        assert summary["tier_distribution"]["A"] == 3
+
+    async def test_merge_multiple_tier_sets(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test each tier_set is merged separately and disjoint sets move over."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        await create_ranked_chain(test_db, test_list.list_id, ["10", "30"], "good")
+        await create_ranked_chain(test_db, source.list_id, ["20"], "good")
+        await create_ranked_chain(test_db, test_list.list_id, ["1"], "mid")
+        await create_ranked_chain(test_db, source.list_id, ["2"], "mid")
+        await create_ranked_chain(test_db, source.list_id, ["5"], "bad")
+
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source.list_id)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        questions = await self.answer_merge(client, auth_headers, response.json())
+        assert questions == 3
+
+        result = await test_db.execute(
+            select(ItemModel).where(ItemModel.list_id == test_list.list_id)
+        )
+        items = list(result.scalars().all())
+        assert len(items) == 6
+        by_set = {}
+        for item in items:
+            by_set.setdefault(item.tier_set, []).append(item)
+        assert [i.name for i in sort_items_linked_list_style(by_set["good"])] == [
+            "10",
+            "20",
+            "30",
+        ]
+        assert [i.name for i in sort_items_linked_list_style(by_set["mid"])] == [
+            "1",
+            "2",
+        ]
+        assert [i.tier for i in by_set["bad"]] == ["D"]
+
+    async def test_merge_without_questions_completes_immediately(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test merging into an empty list needs no comparisons."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        await create_ranked_chain(test_db, source.list_id, ["1", "2"])
+
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source.list_id)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["list_id"] == str(test_list.list_id)
+
+        result = await test_db.execute(
+            select(ItemModel).where(ItemModel.list_id == test_list.list_id)
+        )
+        assert len(result.scalars().all()) == 2
+
+    async def test_merge_status(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test reading the pending pair of a merge session."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        await create_ranked_chain(test_db, test_list.list_id, ["1", "3"])
+        await create_ranked_chain(test_db, source.list_id, ["2"])
+
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source.list_id)},
+            headers=auth_headers,
+        )
+        session_id = response.json()["session_id"]
+
+        response = await client.get(
+            f"/api/lists/merge/{session_id}/status", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["is_complete"] is False
+        assert data["comparisons_done"] == 0
+        assert data["left_item"]["name"] == "1"
+
+        result = await test_db.execute(
+            select(MergeSessionModel).where(
+                MergeSessionModel.session_id == uuid.UUID(session_id)
+            )
+        )
+        assert result.scalar_one().source_list_id == source.list_id
+
+    async def test_merge_status_is_read_only(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test the status reports a later tier_set without advancing the session."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        good = await create_ranked_chain(test_db, test_list.list_id, ["1"])
+        await create_ranked_chain(test_db, source.list_id, ["2"])
+        await create_ranked_chain(test_db, test_list.list_id, ["3"], tier_set="mid")
+        await create_ranked_chain(test_db, source.list_id, ["4"], tier_set="mid")
+
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source.list_id)},
+            headers=auth_headers,
+        )
+        session_id = response.json()["session_id"]
+        assert response.json()["tier_set"] == "good"
+
+        # Exhaust the good tier_set behind the session's back
+        await test_db.delete(good[0])
+        await test_db.commit()
+
+        response = await client.get(
+            f"/api/lists/merge/{session_id}/status", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tier_set"] == "mid"
+        assert data["left_item"]["name"] == "3"
+
+        merge_session = await test_db.get(MergeSessionModel, uuid.UUID(session_id))
+        await test_db.refresh(merge_session)
+        assert merge_session.tier_set == "good"
+
+    async def test_merge_locks_both_lists(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test items cannot be added or deleted while a merge is in progress."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        dest_items = await create_ranked_chain(test_db, test_list.list_id, ["1", "3"])
+        source_items = await create_ranked_chain(test_db, source.list_id, ["2"])
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source.list_id)},
+            headers=auth_headers,
+        )
+        data = response.json()
+
+        for title in (test_list.title, source.title):
+            response = await client.post(
+                "/api/items/",
+                params={"list_title": title},
+                json={"name": "Late", "tier_set": "good"},
+                headers=auth_headers,
+            )
+            assert response.status_code == 409
+        for item in (dest_items[0], source_items[0]):
+            response = await client.delete(
+                f"/api/items/items/{item.item_id}", headers=auth_headers
+            )
+            assert response.status_code == 409
+
+        # The merge still finishes with every item in place
+        questions = await self.answer_merge(client, auth_headers, data)
+        assert questions == 2
+        result = await test_db.execute(
+            select(ItemModel).where(ItemModel.list_id == test_list.list_id)
+        )
+        assert len(result.scalars().all()) == 3
+
+        response = await client.delete(
+            f"/api/items/items/{dest_items[0].item_id}", headers=auth_headers
+        )
+        assert response.status_code == 204
+
+    async def test_merge_blocks_deleting_either_list(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test neither list of an open merge can be deleted."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        source_id = source.list_id
+        await create_ranked_chain(test_db, test_list.list_id, ["1"])
+        await create_ranked_chain(test_db, source_id, ["2"])
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source_id)},
+            headers=auth_headers,
+        )
+        data = response.json()
+
+        for list_id in (source_id, test_list.list_id):
+            response = await client.delete(
+                f"/api/lists/{list_id}", headers=auth_headers
+            )
+            assert response.status_code == 409
+            assert response.json()["detail"] == MERGE_IN_PROGRESS_ERROR
+
+        # The merge still finishes and removes the source list itself
+        await self.answer_merge(client, auth_headers, data)
+        response = await client.get(f"/api/lists/{source_id}", headers=auth_headers)
+        assert response.status_code == 404
+        # Along with the session, through the source_list_id cascade
+        result = await test_db.execute(
+            select(MergeSessionModel).where(
+                MergeSessionModel.session_id == uuid.UUID(data["session_id"])
+            )
+        )
+        assert result.scalar_one_or_none() is None
+
+    async def test_merge_refused_while_another_is_active(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test a list already in a merge cannot join another one."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        other = await create_list_for(test_db, test_user, "Other List")
+        await create_ranked_chain(test_db, test_list.list_id, ["1"])
+        await create_ranked_chain(test_db, source.list_id, ["2"])
+        await create_ranked_chain(test_db, other.list_id, ["3"])
+
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source.list_id)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        for list_id, source_list_id in (
+            (test_list.list_id, source.list_id),
+            (other.list_id, source.list_id),
+            (test_list.list_id, other.list_id),
+        ):
+            response = await client.post(
+                f"/api/lists/{list_id}/merge",
+                params={"source_list_id": str(source_list_id)},
+                headers=auth_headers,
+            )
+            assert response.status_code == 409
+
+    async def test_merge_into_itself(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test a list cannot be merged into itself."""
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(test_list.list_id)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    async def test_merge_wrong_user(
+        self,
+        client: AsyncClient,
+        test_user2: User,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test merging another user's list fails."""
+        other = await create_list_for(test_db, test_user2, "Other List")
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(other.list_id)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+    async def test_merge_with_pending_comparison(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_list: ListModel,
+        test_item: ItemModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test merging is refused while a comparison session is active."""
+        source = await create_list_for(test_db, test_user, "Source List")
+        test_db.add(
+            ComparisonSessionModel(
+                session_id=uuid.uuid4(),
+                list_id=source.list_id,
+                new_item_id=test_item.item_id,
+                target_item_id=test_item.item_id,
+                tier_set="good",
+                is_complete=False,
+            )
+        )
+        await test_db.commit()
+
+        response = await client.post(
+            f"/api/lists/{test_list.list_id}/merge",
+            params={"source_list_id": str(source.list_id)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 409
+
+    async def test_merge_result_invalid_session(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test submitting a result for an unknown merge session."""
+        response = await client.post(
+            "/api/lists/merge/result",
+            params={"session_id": str(uuid.uuid4())},
+            json={"result": "better"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestExportList:
+    """Tests for streaming list export."""
+
+    async def test_export_ndjson_in_rank_order(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test NDJSON export lists tier_sets in order, lowest rank first."""
+        await create_ranked_chain(test_db, test_list.list_id, ["m0"], "mid")
+        await create_ranked_chain(test_db, test_list.list_id, ["g0", "g1"])
+
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/export", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in rows] == ["g0", "g1", "m0"]
+        assert rows[0]["list_title"] == test_list.title
+        assert rows[0]["position"] == 0
+
+    async def test_export_unranked_after_their_tier_set(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test items without a position follow the ranked items of their tier_set."""
+        await create_ranked_chain(test_db, test_list.list_id, ["m0"], "mid")
+        await create_ranked_chain(test_db, test_list.list_id, ["g0", "g1"])
+        pending = await create_ranked_chain(test_db, test_list.list_id, ["g?"])
+        pending[0].position = None
+        await test_db.commit()
+
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/export", headers=auth_headers
+        )
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in rows] == ["g0", "g1", "g?", "m0"]
+        assert rows[2]["position"] is None
+
+    async def test_export_csv(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        test_item: ItemModel,
+        auth_headers: dict,
+    ):
+        """Test CSV export starts with a header row."""
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/export",
+            params={"format": "csv"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["item_id"] == str(test_item.item_id)
+        assert rows[0]["tier"] == "A"
+
+    async def test_export_wrong_user(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers_user2: dict,
+    ):
+        """Test exporting another user's list fails."""
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}/export", headers=auth_headers_user2
+        )
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestConditionalReads:
+    """Tests for ETag and If-None-Match support on list reads."""
+
+    async def test_list_items_not_modified(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        test_item: ItemModel,
+        auth_headers: dict,
+    ):
+        """Test a matching If-None-Match returns 304 without a body."""
+        url = f"/api/lists/{test_list.list_id}/items"
+        response = await client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            url, headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    async def test_list_items_etag_changes_on_item_mutation(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        test_item: ItemModel,
+        auth_headers: dict,
+    ):
+        """Test editing an item invalidates the list's ETag."""
+        url = f"/api/lists/{test_list.list_id}/items"
+        etag = (await client.get(url, headers=auth_headers)).headers["ETag"]
+
+        response = await client.put(
+            f"/api/items/items/{test_item.item_id}",
+            json={"name": "Renamed"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        response = await client.get(
+            url, headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["name"] == "Renamed"
+
+    async def test_list_items_etag_depends_on_window(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test different windows of the same list get different ETags."""
+        url = f"/api/lists/{test_list.list_id}/items"
+        full = await client.get(url, headers=auth_headers)
+        window = await client.get(url, params={"limit": 5}, headers=auth_headers)
+        assert full.headers["ETag"] != window.headers["ETag"]
+
+    async def test_read_lists_not_modified(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test the list overview supports conditional requests."""
+        response = await client.get("/api/lists/", headers=auth_headers)
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            "/api/lists/", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+    async def test_read_lists_etag_changes_on_new_item(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test adding an item changes the overview ETag."""
+        etag = (await client.get("/api/lists/", headers=auth_headers)).headers["ETag"]
+        response = await client.post(
+            "/api/items/",
+            params={"list_title": test_list.title},
+            json={"name": "New Item", "tier_set": "good"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        response = await client.get(
+            "/api/lists/", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()[0]["item_count"] == 1
+
+
+@pytest.mark.asyncio
+class TestResponseCache:
+    """Tests for the encoded response cache on list reads."""
+
+    async def test_list_items_served_from_cache(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        test_item: ItemModel,
+        auth_headers: dict,
+    ):
+        """Test a repeated read returns identical bytes from the cache."""
+        url = f"/api/lists/{test_list.list_id}/items"
+        first = await client.get(url, headers=auth_headers)
+        second = await client.get(url, headers=auth_headers)
+
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second.headers["ETag"] == first.headers["ETag"]
+        stats = response_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["bytes_saved"] == len(first.content)
+
+    async def test_list_items_cache_keyed_by_version(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        test_item: ItemModel,
+        auth_headers: dict,
+    ):
+        """Test a mutation makes the next read miss the cache."""
+        url = f"/api/lists/{test_list.list_id}/items"
+        await client.get(url, headers=auth_headers)
+        await client.delete(
+            f"/api/items/items/{test_item.item_id}", headers=auth_headers
+        )
+
+        response = await client.get(url, headers=auth_headers)
+        assert response.json() == []
+        assert response_cache.stats()["hits"] == 0
+
+    async def test_window_cursor_header_cached(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test cached windows keep their X-Next-Cursor header."""
+        await create_ranked_chain(test_db, test_list.list_id, ["g0", "g1", "g2"])
+        url = f"/api/lists/{test_list.list_id}/items"
+        first = await client.get(url, params={"limit": 2}, headers=auth_headers)
+        second = await client.get(url, params={"limit": 2}, headers=auth_headers)
+        assert response_cache.stats()["hits"] == 1
+        assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    async def test_read_lists_served_from_cache(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test the list overview is cached until a list changes."""
+        first = await client.get("/api/lists/", headers=auth_headers)
+        second = await client.get("/api/lists/", headers=auth_headers)
+        assert second.json() == first.json()
+        assert response_cache.stats()["hits"] == 1
+
+        await client.put(
+            f"/api/lists/{test_list.list_id}",
+            json={"title": "Renamed List"},
+            headers=auth_headers,
+        )
+        response = await client.get("/api/lists/", headers=auth_headers)
+        assert response.json()[0]["title"] == "Renamed List"
+        assert response_cache.stats()["hits"] == 1
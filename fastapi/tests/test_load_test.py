@@ -0,0 +1,40 @@
+"""Tests for the in-process load harness."""
+
+import pytest
+from httpx import AsyncClient
+
+from scripts.load_test import Recorder, percentile, run_load
+
+
+def test_percentile_uses_nearest_rank():
+    """Test percentiles pick an observed value."""
+    values = [float(n) for n in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([3.0], 0.95) == 3.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_summary_counts_errors_and_throughput():
+    """Test the report splits out failed requests."""
+    recorder = Recorder()
+    recorder.record("GET /a", 0.010, "200")
+    recorder.record("GET /a", 0.030, "503")
+    recorder.record("GET /a", 0.020, "ConnectError")
+
+    row = recorder.summary(elapsed=2.0)["GET /a"]
+    assert row["requests"] == 3
+    assert row["rps"] == 1.5
+    assert row["errors"] == 2
+    assert row["p50_ms"] == pytest.approx(20.0)
+
+
+@pytest.mark.asyncio
+async def test_virtual_user_ranks_items(client: AsyncClient):
+    """Test a short run signs up, creates lists and ranks items."""
+    report = await run_load(client, users=1, duration=1.0, think_time=0, ramp_up=0)
+
+    assert report["POST /api/users/token"]["errors"] == 0
+    assert report["POST /api/lists/"]["requests"] >= 1
+    assert report["POST /api/items/"]["requests"] >= 1
+    assert all(row["errors"] == 0 for row in report.values())
@@ -0,0 +1,81 @@
+"""Tests for the Prometheus metrics endpoint and middleware."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    RANKING_COMPARISONS_PER_INSERTION,
+    RANKING_FINALIZE_DURATION,
+)
+from app.db.models import Item as ItemModel
+from app.db.models import List as ListModel
+
+
+@pytest.mark.asyncio
+class TestMetrics:
+    """Tests for request, database and ranking metrics."""
+
+    async def test_metrics_endpoint_format(self, client: AsyncClient):
+        """Test /metrics serves the Prometheus text format."""
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+    async def test_requests_labelled_by_route_template(
+        self, client: AsyncClient, test_list: ListModel, auth_headers: dict
+    ):
+        """Test requests are recorded per route template with DB round trips."""
+        route = "/api/lists/{list_id}"
+        before = HTTP_REQUEST_DURATION.count("GET", route)
+        queries_before = DB_QUERIES_PER_REQUEST.sum(route)
+
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        assert HTTP_REQUEST_DURATION.count("GET", route) == before + 1
+        assert DB_QUERIES_PER_REQUEST.sum(route) > queries_before
+        assert HTTP_REQUESTS_IN_FLIGHT.get() == 0
+
+        text = (await client.get("/metrics")).text
+        assert (
+            'http_requests_total{method="GET",route="/api/lists/{list_id}",'
+            'status="200"}' in text
+        )
+        assert str(test_list.list_id) not in text
+
+    async def test_comparisons_per_insertion(
+        self,
+        client: AsyncClient,
+        test_list: ListModel,
+        test_item: ItemModel,
+        auth_headers: dict,
+    ):
+        """Test a finished insertion records its comparison count and timing."""
+        insertions = RANKING_COMPARISONS_PER_INSERTION.count()
+        total = RANKING_COMPARISONS_PER_INSERTION.sum()
+        finalized = RANKING_FINALIZE_DURATION.count()
+
+        create_response = await client.post(
+            "/api/items/",
+            params={"list_title": test_list.title},
+            json={"name": "New Item", "tier_set": "good"},
+            headers=auth_headers,
+        )
+        session_id = create_response.json()["session_id"]
+        response = await client.post(
+            "/api/items/comparison/result",
+            params={"session_id": session_id},
+            json={"result": "better"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        assert RANKING_COMPARISONS_PER_INSERTION.count() == insertions + 1
+        assert RANKING_COMPARISONS_PER_INSERTION.sum() == total + 1
+        assert RANKING_FINALIZE_DURATION.count() == finalized + 1
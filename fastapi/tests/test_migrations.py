@@ -0,0 +1,144 @@
+"""Tests for the Alembic migration history."""
+
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from app.db.migrations import (
+    ALEMBIC_INI,
+    BASELINE_REVISION,
+    SchemaOutOfDateError,
+    get_alembic_config,
+    get_head_revisions,
+    upgrade_database,
+    verify_schema,
+)
+from app.db.models import Base
+
+
+@pytest.mark.asyncio
+class TestMigrations:
+    """Tests for upgrading database schemas."""
+
+    async def test_upgrade_matches_models(self, tmp_path: Path):
+        """Test a fresh database upgraded to head matches the models."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+        await upgrade_database(engine)
+
+        async with engine.connect() as conn:
+            diff = await conn.run_sync(
+                lambda sync_conn: compare_metadata(
+                    MigrationContext.configure(sync_conn), Base.metadata
+                )
+            )
+        await engine.dispose()
+        assert diff == []
+
+    async def test_upgrade_stamps_and_backfills_legacy_database(self, tmp_path: Path):
+        """Test a create_all database is stamped and its new columns backfilled."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: command.upgrade(
+                    get_alembic_config(sync_conn), BASELINE_REVISION
+                )
+            )
+            # Drop the version table to look like a pre-migration database
+            await conn.execute(text("DROP TABLE alembic_version"))
+
+            user_id, list_id = uuid.uuid4().hex, uuid.uuid4().hex
+            low, high = uuid.uuid4().hex, uuid.uuid4().hex
+            await conn.execute(
+                text(
+                    "INSERT INTO users (user_id, email, password_hash, is_admin) "
+                    "VALUES (:id, 'legacy@example.com', 'x', 0)"
+                ),
+                {"id": user_id},
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO lists (list_id, user_id, title) "
+                    "VALUES (:id, :user_id, 'Legacy')"
+                ),
+                {"id": list_id, "user_id": user_id},
+            )
+            for item_id, prev_id, next_id, tier in (
+                (high, low, None, "S"),
+                (low, None, high, "A"),
+            ):
+                await conn.execute(
+                    text(
+                        "INSERT INTO items (item_id, list_id, name, prev_item_id, "
+                        "next_item_id, tier, tier_set) VALUES "
+                        "(:id, :list_id, :id, :prev, :next, :tier, 'good')"
+                    ),
+                    {
+                        "id": item_id,
+                        "list_id": list_id,
+                        "prev": prev_id,
+                        "next": next_id,
+                        "tier": tier,
+                    },
+                )
+
+        await upgrade_database(engine)
+
+        async with engine.connect() as conn:
+            positions = dict(
+                (await conn.execute(text("SELECT item_id, position FROM items"))).all()
+            )
+            counters = (
+                await conn.execute(
+                    text("SELECT version, item_count, tier_s, tier_a FROM lists")
+                )
+            ).one()
+        await engine.dispose()
+
+        assert positions == {low: 0, high: 1}
+        assert tuple(counters) == (1, 2, 1, 1)
+
+    async def test_downgrade_to_base(self, tmp_path: Path):
+        """Test every migration can be reverted."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+        await upgrade_database(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: command.downgrade(
+                    get_alembic_config(sync_conn), "base"
+                )
+            )
+            tables = (
+                await conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'table'")
+                )
+            ).scalars()
+            assert set(tables) == {"alembic_version"}
+        await engine.dispose()
+
+    async def test_head_revisions_match_alembic(self):
+        """Test the fast head lookup agrees with Alembic's script directory."""
+        script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+
+        assert get_head_revisions() == tuple(sorted(script.get_heads()))
+
+    async def test_verify_schema_requires_head(self, tmp_path: Path):
+        """Test the startup check passes only once every migration is applied."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+        with pytest.raises(SchemaOutOfDateError, match="no revision"):
+            await verify_schema(engine)
+
+        await upgrade_database(engine, BASELINE_REVISION)
+        with pytest.raises(SchemaOutOfDateError, match=BASELINE_REVISION):
+            await verify_schema(engine)
+
+        await upgrade_database(engine)
+        assert await verify_schema(engine) == get_head_revisions()
+        await engine.dispose()
@@ -0,0 +1,190 @@
+"""Tests for per-request SQL statement accounting and query budgets."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.endpoints.items import create_item, submit_comparison_result
+from app.core.metrics import DB_QUERY_BUDGET_EXCEEDED, MetricsMiddleware
+from app.db.models import Item as ItemModel
+from app.db.models import List as ListModel
+from app.db.query_stats import (
+    QueryBudgetExceededError,
+    get_query_budget,
+    query_budget,
+    track_queries,
+)
+from app.settings import settings
+from fastapi import FastAPI
+
+
+async def add_ranked_chain(db: AsyncSession, list_obj: ListModel, count: int) -> None:
+    """Add a correctly linked chain of ranked items to the good tier set."""
+    ids = [uuid.uuid4() for _ in range(count)]
+    for index, item_id in enumerate(ids):
+        db.add(
+            ItemModel(
+                item_id=item_id,
+                list_id=list_obj.list_id,
+                name=f"Ranked {index}",
+                prev_item_id=ids[index - 1] if index > 0 else None,
+                next_item_id=ids[index + 1] if index + 1 < count else None,
+                tier="A",
+                tier_set="good",
+                position=index,
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+    await db.commit()
+
+
+async def rank_new_item(
+    client: AsyncClient, list_obj: ListModel, headers: dict
+) -> list[int]:
+    """Insert an item and answer every comparison; return statements per call."""
+    response = await client.post(
+        "/api/items/",
+        params={"list_title": list_obj.title},
+        json={"name": "Newcomer", "tier_set": "good"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    counts = [int(response.headers["X-DB-Queries"])]
+    session_id = response.json()["session_id"]
+
+    for _ in range(10):
+        response = await client.post(
+            "/api/items/comparison/result",
+            params={"session_id": session_id},
+            json={"result": "better"},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        counts.append(int(response.headers["X-DB-Queries"]))
+        if response.json() is None:
+            return counts
+    raise AssertionError("comparison never finished")
+
+
+def make_app(db: AsyncSession, budget: int) -> FastAPI:
+    """Build a tiny app with one budgeted endpoint that runs two statements."""
+    app = FastAPI()
+
+    @app.get("/work")
+    @query_budget(budget)
+    async def work() -> dict:
+        await db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 2"))
+        return {}
+
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+@pytest.mark.asyncio
+class TestQueryBudgets:
+    """Tests for statement counting and budget enforcement."""
+
+    async def test_track_queries_counts_statements(self, test_db: AsyncSession):
+        """Test statements inside the block are counted and timed."""
+        with track_queries() as stats:
+            await test_db.execute(text("SELECT 1"))
+            await test_db.execute(text("SELECT 2"))
+        await test_db.execute(text("SELECT 3"))
+
+        assert stats.count == 2
+        assert stats.seconds > 0
+
+    async def test_headers_report_statements(
+        self, client: AsyncClient, test_list: ListModel, auth_headers: dict
+    ):
+        """Test responses carry statement counts and database time."""
+        response = await client.get(
+            f"/api/lists/{test_list.list_id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Queries"]) >= 1
+        assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+    async def test_ranking_statements_do_not_grow_with_list_size(
+        self,
+        client: AsyncClient,
+        test_db: AsyncSession,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test inserting and ranking an item stays within budget at any size."""
+        await add_ranked_chain(test_db, test_list, 31)
+
+        counts = await rank_new_item(client, test_list, auth_headers)
+
+        assert len(counts) <= 6  # one insert plus at most log2(32) comparisons
+        assert counts[0] <= get_query_budget(create_item)
+        assert max(counts[1:]) <= get_query_budget(submit_comparison_result)
+
+    async def test_create_item_statements(
+        self,
+        client: AsyncClient,
+        test_db: AsyncSession,
+        test_list: ListModel,
+        auth_headers: dict,
+    ):
+        """Test creating an item reads nothing back after writing it."""
+        title = test_list.title
+        await add_ranked_chain(test_db, test_list, 7)
+
+        response = await client.post(
+            "/api/items/",
+            params={"list_title": title},
+            json={"name": "Newcomer", "tier_set": "good"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        comparison = response.json()["current_comparison"]
+        assert comparison["target_item"]["name"] == "Ranked 3"
+        assert comparison["reference_item"]["name"] == "Newcomer"
+        # User, list, merge check and tier set reads; item, session and list
+        # counter writes
+        assert int(response.headers["X-DB-Queries"]) <= 7
+
+        response = await client.post(
+            "/api/items/",
+            params={"list_title": title},
+            json={"name": "First mid", "tier_set": "mid"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["position"] == 0
+        assert int(response.headers["X-DB-Queries"]) <= 6
+
+    async def test_strict_budget_raises(self, test_db: AsyncSession):
+        """Test an endpoint over budget fails loudly in strict mode."""
+        app = make_app(test_db, budget=1)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            with pytest.raises(QueryBudgetExceededError):
+                await client.get("/work")
+
+    async def test_budget_logged_when_not_strict(
+        self, test_db: AsyncSession, monkeypatch
+    ):
+        """Test an endpoint over budget is counted and still answers."""
+        monkeypatch.setattr(settings, "QUERY_BUDGET_STRICT", False)
+        app = make_app(test_db, budget=1)
+        before = DB_QUERY_BUDGET_EXCEEDED.get("/work")
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/work")
+
+        assert response.status_code == 200
+        assert response.headers["X-DB-Queries"] == "2"
+        assert DB_QUERY_BUDGET_EXCEEDED.get("/work") == before + 1
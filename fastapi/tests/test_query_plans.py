@@ -0,0 +1,169 @@
+"""Tests that the hot CRUD queries are driven by indexes.
+
+Each test runs a real CRUD call, captures the SQL it sends and asks SQLite's
+query planner how it would execute it.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import comparison as comparison_crud
+from app.crud import crud_user
+from app.crud import item as item_crud
+from app.crud import list as list_crud
+from app.crud import merge as merge_crud
+
+
+async def query_plan(db: AsyncSession, run: Callable[[], Awaitable[Any]]) -> List[str]:
+    """Run a CRUD call and return the planner detail lines of its SELECT."""
+    statements: List[tuple] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    sync_engine = db.bind.sync_engine  # type: ignore[union-attr]
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await run()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+    return [row[3] for row in result]
+
+
+def assert_index_driven(plan: List[str], index: str) -> None:
+    """Check the plan searches the given index and never scans a table."""
+    assert any(index in line for line in plan), plan
+    assert not any(line.startswith("SCAN") for line in plan), plan
+
+
+@pytest.mark.asyncio
+class TestItemQueryPlans:
+    """Query plans for item reads."""
+
+    async def test_get_by_list_id(self, test_db: AsyncSession):
+        """Test reading a list's items searches the list index."""
+        plan = await query_plan(
+            test_db, lambda: item_crud.get_by_list_id(test_db, uuid.uuid4())
+        )
+        assert_index_driven(plan, "ix_items_list_id_tier_set_position")
+
+    async def test_get_by_list_and_tier_set(self, test_db: AsyncSession):
+        """Test reading one tier_set chain searches the list index."""
+        plan = await query_plan(
+            test_db,
+            lambda: item_crud.get_by_list_and_tier_set(test_db, uuid.uuid4(), "good"),
+        )
+        assert_index_driven(plan, "ix_items_list_id_tier_set_position")
+
+    async def test_get_ranked_window(self, test_db: AsyncSession):
+        """Test ranked windows seek by position without sorting."""
+        plan = await query_plan(
+            test_db,
+            lambda: item_crud.get_ranked_window(
+                test_db, uuid.uuid4(), "good", limit=10, after_position=20
+            ),
+        )
+        assert_index_driven(plan, "ix_items_list_id_tier_set_position")
+        assert not any("TEMP B-TREE" in line for line in plan), plan
+
+    async def test_count_ranked_by_tier_set(self, test_db: AsyncSession):
+        """Test per-tier_set counts search the list index."""
+        plan = await query_plan(
+            test_db,
+            lambda: item_crud.count_ranked_by_tier_set(test_db, uuid.uuid4()),
+        )
+        assert_index_driven(plan, "ix_items_list_id_tier_set_position")
+
+
+@pytest.mark.asyncio
+class TestListQueryPlans:
+    """Query plans for list reads."""
+
+    async def test_get_by_title_and_user(self, test_db: AsyncSession):
+        """Test the duplicate title check searches the title index."""
+        plan = await query_plan(
+            test_db,
+            lambda: list_crud.get_by_title_and_user(test_db, "Title", uuid.uuid4()),
+        )
+        assert_index_driven(plan, "ix_lists_user_id_title")
+
+    async def test_get_by_user_with_stats_page(self, test_db: AsyncSession):
+        """Test keyset pages of lists seek the updated_at index without sorting."""
+        plan = await query_plan(
+            test_db,
+            lambda: list_crud.get_by_user_with_stats(
+                test_db,
+                uuid.uuid4(),
+                limit=20,
+                after=(datetime.now(), uuid.uuid4()),
+            ),
+        )
+        assert_index_driven(plan, "ix_lists_user_id_updated_at")
+        assert not any("TEMP B-TREE" in line for line in plan), plan
+
+
+@pytest.mark.asyncio
+class TestUserQueryPlans:
+    """Query plans for user reads."""
+
+    async def test_get_users_page(self, test_db: AsyncSession):
+        """Test keyset pages of users seek the created_at index without sorting."""
+        plan = await query_plan(
+            test_db,
+            lambda: crud_user.get_users(
+                test_db, limit=20, after=(datetime.now(), uuid.uuid4())
+            ),
+        )
+        assert_index_driven(plan, "ix_users_created_at_user_id")
+        assert not any("TEMP B-TREE" in line for line in plan), plan
+
+
+@pytest.mark.asyncio
+class TestSessionQueryPlans:
+    """Query plans for comparison and merge session reads."""
+
+    async def test_get_active_comparison(self, test_db: AsyncSession):
+        """Test active comparison lookups never scan the table."""
+        plan = await query_plan(
+            test_db, lambda: comparison_crud.get_active(test_db, uuid.uuid4())
+        )
+        assert_index_driven(plan, "ix_comparison_sessions_session_id_is_complete")
+
+    async def test_has_active_for_lists(self, test_db: AsyncSession):
+        """Test pending comparison checks search the list index."""
+        plan = await query_plan(
+            test_db,
+            lambda: comparison_crud.has_active_for_lists(
+                test_db, [uuid.uuid4(), uuid.uuid4()]
+            ),
+        )
+        assert_index_driven(plan, "ix_comparison_sessions_list_id_is_complete")
+
+    async def test_has_active_merge_for_lists(self, test_db: AsyncSession):
+        """Test open merge checks search both list indexes."""
+        plan = await query_plan(
+            test_db,
+            lambda: merge_crud.has_active_for_lists(test_db, [uuid.uuid4()]),
+        )
+        assert_index_driven(plan, "ix_merge_sessions_list_id")
+        assert_index_driven(plan, "ix_merge_sessions_source_list_id_is_complete")
+
+    async def test_get_active_merge(self, test_db: AsyncSession):
+        """Test active merge lookups use the primary key."""
+        plan = await query_plan(
+            test_db, lambda: merge_crud.get_active(test_db, uuid.uuid4())
+        )
+        assert not any(line.startswith("SCAN") for line in plan), plan
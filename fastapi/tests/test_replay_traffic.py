@@ -0,0 +1,146 @@
+"""Tests for capturing traffic and replaying it against a scratch database."""
+
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.traffic_capture import trace_writer
+from app.db.models import Item as ItemModel
+from app.db.models import List as ListModel
+from app.settings import settings
+from scripts.replay_traffic import (
+    build_scratch,
+    is_replayable,
+    load_traces,
+    plan_seed_data,
+    replay,
+)
+
+TRACES = [
+    {"t": 1.0, "method": "GET", "route": "/api/lists/", "status": 200, "user": "u1"},
+    {
+        "t": 2.0,
+        "method": "POST",
+        "route": "/api/items/",
+        "status": 200,
+        "user": "u1",
+        "list": "l1",
+        "tier_set": "good",
+        "tier_set_size": 7,
+        "session": "s1",
+    },
+    {
+        "t": 3.0,
+        "method": "GET",
+        "route": "/api/lists/{list_id}/items",
+        "status": 200,
+        "user": "u2",
+        "list": "l2",
+        "list_size": 4,
+    },
+    {
+        "t": 4.0,
+        "method": "POST",
+        "route": "/api/lists/",
+        "status": 200,
+        "user": "u2",
+        "list": "l3",
+    },
+    {
+        "t": 5.0,
+        "method": "POST",
+        "route": "/api/items/",
+        "status": 200,
+        "user": "u2",
+        "list": "l3",
+        "tier_set": "bad",
+        "tier_set_size": 0,
+    },
+]
+
+
+def test_load_traces_merges_files_in_time_order(tmp_path):
+    """Test worker files are merged by start time and torn lines dropped."""
+    first = tmp_path / "a.jsonl"
+    second = tmp_path / "b.jsonl"
+    first.write_text(json.dumps(TRACES[2]) + "\n" + json.dumps(TRACES[0]) + "\n")
+    second.write_text(json.dumps(TRACES[1]) + "\n" + '{"t": 9, "meth')
+
+    assert load_traces([first, second]) == TRACES[:3]
+
+
+def test_is_replayable_skips_failures_and_unknown_routes():
+    """Test only successful, supported, authenticated requests are replayed."""
+    assert is_replayable(TRACES[1])
+    assert not is_replayable({**TRACES[1], "status": 404})
+    assert not is_replayable({**TRACES[1], "route": "/api/users/token"})
+    assert not is_replayable({k: v for k, v in TRACES[1].items() if k != "user"})
+
+
+def test_plan_seed_data_sizes_lists_from_first_sighting():
+    """Test pre-existing lists are sized while lists created live are not."""
+    owners, sizes = plan_seed_data(TRACES)
+
+    assert owners == {"l1": "u1", "l2": "u2"}
+    assert sizes == {"l1": {"good": 7}, "l2": {"good": 4}}
+
+
+@pytest.mark.asyncio
+async def test_replay_rebuilds_and_replays_trace(
+    client: AsyncClient, test_db: AsyncSession
+):
+    """Test the scratch data matches the trace and every request succeeds."""
+    scratch = await build_scratch(test_db, TRACES, seed=1)
+    assert scratch.seeded_items == 11
+    assert set(scratch.headers) == {"u1", "u2"}
+
+    report, skipped = await replay(client, TRACES, scratch)
+
+    assert skipped == {}
+    assert all(row["errors"] == 0 for row in report.values())
+    assert report["POST /api/items/"]["requests"] == 2
+    lists = await test_db.scalar(select(func.count()).select_from(ListModel))
+    items = await test_db.scalar(select(func.count()).select_from(ItemModel))
+    assert lists == 3
+    assert items == 13
+
+
+@pytest.mark.asyncio
+async def test_captured_session_replays_comparison_answers(
+    client: AsyncClient,
+    test_db: AsyncSession,
+    test_list: ListModel,
+    auth_headers: dict,
+    tmp_path,
+    monkeypatch,
+):
+    """Test a captured ranking session replays its recorded answers."""
+    path = tmp_path / "traffic.jsonl"
+    monkeypatch.setattr(settings, "TRAFFIC_CAPTURE_PATH", str(path))
+    for name in ("First", "Second"):
+        response = await client.post(
+            "/api/items/",
+            params={"list_title": test_list.title},
+            json={"name": name, "tier_set": "mid"},
+            headers=auth_headers,
+        )
+    result = await client.post(
+        "/api/items/comparison/result",
+        params={"session_id": response.json()["session_id"]},
+        json={"result": "worse"},
+        headers=auth_headers,
+    )
+    assert result.status_code == 200
+    trace_writer.close()
+    monkeypatch.setattr(settings, "TRAFFIC_CAPTURE_PATH", None)
+
+    traces = [trace for trace in load_traces([path]) if is_replayable(trace)]
+    assert traces[-1]["answer"] == "worse"
+    scratch = await build_scratch(test_db, traces)
+    report, skipped = await replay(client, traces, scratch, speed=1000)
+
+    assert skipped == {}
+    assert report["POST /api/items/comparison/result"]["statuses"] == {"200": 1}
@@ -7,12 +7,14 @@ from typing import Callable
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud import list as list_crud
 from app.db.models import (
     ComparisonSession as ComparisonSessionModel,
     Item as ItemModel,
     List as ListModel,
 )
 from app.schemas.item import Comparison
+from app.services import list_service
 from app.services.comparison_service import (
     build_comparison_session_response,
     finalize_comparison,
@@ -227,6 +229,8 @@ class TestComparisonService:
         await test_db.refresh(target_item)
         assert new_item.prev_item_id == target_item.item_id
         assert target_item.next_item_id == new_item.item_id
+        assert target_item.position == 0
+        assert new_item.position == 1
 
     async def test_finalize_comparison_loser(
         self,
@@ -466,3 +470,30 @@ class TestHelperFunctions:
 
         result = sort_items_linked_list_style([])
         assert result == []
+
+
+@pytest.mark.asyncio
+class TestReconcileListCounters:
+    """Tests for list counter reconciliation."""
+
+    async def test_no_drift(
+        self, test_db: AsyncSession, test_list: ListModel, test_item: ItemModel
+    ):
+        """Test consistent counters report no drift."""
+        assert await list_service.reconcile_list_counters(test_db) == {}
+
+    async def test_detects_and_repairs_drift(
+        self, test_db: AsyncSession, test_list: ListModel, test_item: ItemModel
+    ):
+        """Test drifted counters are reported and repaired on request."""
+        await list_crud.set_counters(
+            test_db, test_list.list_id, {"item_count": 5, "tier_a": 0}
+        )
+
+        drift = await list_service.reconcile_list_counters(test_db)
+        assert drift[test_list.list_id]["stored"]["item_count"] == 5
+        assert drift[test_list.list_id]["actual"]["item_count"] == 1
+        assert drift[test_list.list_id]["actual"]["tier_a"] == 1
+
+        await list_service.reconcile_list_counters(test_db, repair=True)
+        assert await list_service.reconcile_list_counters(test_db) == {}
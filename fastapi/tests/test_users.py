@@ -1,12 +1,15 @@
 """Tests for user endpoints and CRUD operations."""
 
+import json
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import User
+from app.db.models import Item as ItemModel, List as ListModel, User
 from app.core.security import verify_password
+from app.core.user_cache import user_cache
 from app.crud import crud_user
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -195,6 +198,64 @@ class TestUserLogin:
         assert response.status_code == 200
         assert "access_token" in response.json()
 
+    async def test_login_rehashes_outdated_hash(
+        self, client: AsyncClient, test_db: AsyncSession, test_user: User
+    ):
+        """Test logging in upgrades a hash made with other Argon2 parameters."""
+        from app.core.security import build_pwd_context, pwd_context
+
+        test_user.password_hash = build_pwd_context(1, 8192, 1).hash("testpassword123")
+        await test_db.commit()
+        assert pwd_context.needs_update(test_user.password_hash)
+
+        response = await client.post(
+            "/api/users/token",
+            data={"username": test_user.email, "password": "testpassword123"},
+        )
+        assert response.status_code == 200
+
+        await test_db.refresh(test_user)
+        assert not pwd_context.needs_update(test_user.password_hash)
+        assert verify_password("testpassword123", test_user.password_hash)
+
+    async def test_login_keeps_stronger_hash(
+        self, client: AsyncClient, test_db: AsyncSession, test_user: User
+    ):
+        """Test a hash made by a costlier host is not re-hashed on login."""
+        from app.core.security import build_pwd_context, pwd_context
+
+        local = pwd_context.handler("argon2")
+        stronger = build_pwd_context(
+            local.default_rounds + 1, local.memory_cost, 1
+        ).hash("testpassword123")
+        test_user.password_hash = stronger
+        await test_db.commit()
+
+        response = await client.post(
+            "/api/users/token",
+            data={"username": test_user.email, "password": "testpassword123"},
+        )
+        assert response.status_code == 200
+
+        await test_db.refresh(test_user)
+        assert test_user.password_hash == stronger
+
+    async def test_login_sheds_load_when_hashing_is_busy(
+        self, client: AsyncClient, test_user: User, monkeypatch
+    ):
+        """Test logins get 503 with Retry-After when the hashing queue is full."""
+        from app.core.security import hashing_pool
+
+        monkeypatch.setattr(hashing_pool, "max_workers", 0)
+        monkeypatch.setattr(hashing_pool, "max_queue", 0)
+
+        response = await client.post(
+            "/api/users/token",
+            data={"username": test_user.email, "password": "testpassword123"},
+        )
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
 
 @pytest.mark.asyncio
 class TestReadUsers:
@@ -273,6 +334,45 @@ class TestReadUsers:
         assert isinstance(data, list)
         assert len(data) == 1  # Should return 1 user (total 2 - skip 1)
 
+    async def test_read_users_cursor_pages(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        admin_auth_headers: dict,
+    ):
+        """Test following X-Next-Cursor visits every user once in signup order."""
+        first = await client.get(
+            "/api/users/", params={"limit": 1}, headers=admin_auth_headers
+        )
+        next_cursor = first.headers["X-Next-Cursor"]
+
+        second = await client.get(
+            "/api/users/",
+            params={"limit": 1, "cursor": next_cursor},
+            headers=admin_auth_headers,
+        )
+        assert second.status_code == 200
+        assert len(second.json()) == 1
+        assert second.json()[0]["user_id"] != first.json()[0]["user_id"]
+        assert second.json()[0]["created_at"] >= first.json()[0]["created_at"]
+
+        last = await client.get(
+            "/api/users/",
+            params={"limit": 1, "cursor": second.headers["X-Next-Cursor"]},
+            headers=admin_auth_headers,
+        )
+        assert last.json() == []
+        assert "X-Next-Cursor" not in last.headers
+
+    async def test_read_users_invalid_cursor(
+        self, client: AsyncClient, admin_auth_headers: dict
+    ):
+        """Test a malformed cursor is rejected."""
+        response = await client.get(
+            "/api/users/", params={"cursor": "garbage"}, headers=admin_auth_headers
+        )
+        assert response.status_code == 400
+
 
 @pytest.mark.asyncio
 class TestReadCurrentUser:
@@ -449,6 +549,21 @@ class TestUserCRUD:
         user = await crud_user.get_user_by_id(test_db, user_id)
         assert user is None
 
+    async def test_delete_user_cascades_lists_and_items(
+        self, test_db: AsyncSession, test_user: User, test_list: ListModel
+    ):
+        """Test deleting a user removes their lists and items in the database."""
+        item = ItemModel(list_id=test_list.list_id, name="Item", tier_set="good")
+        test_db.add(item)
+        await test_db.commit()
+        list_id, item_id = test_list.list_id, item.item_id
+
+        await crud_user.delete_user(test_db, test_user.user_id)
+
+        test_db.expire_all()
+        assert await test_db.get(ListModel, list_id) is None
+        assert await test_db.get(ItemModel, item_id) is None
+
     async def test_delete_user_nonexistent(self, test_db: AsyncSession):
         """Test deleting a user that doesn't exist (should not raise)."""
         import uuid
@@ -552,3 +667,98 @@ class TestUpdateCurrentUser:
         data = response.json()
         assert data["email"] == "all@example.com"
         assert data["username"] == "allupdated"
+
+
+@pytest.mark.asyncio
+class TestCurrentUserCache:
+    """Tests for the authenticated user cache."""
+
+    async def test_repeat_requests_served_from_cache(
+        self, client: AsyncClient, test_user: User, auth_headers: dict
+    ):
+        """Test only the first request with a token looks the user up."""
+        for _ in range(3):
+            response = await client.get("/api/users/me", headers=auth_headers)
+            assert response.status_code == 200
+
+        stats = user_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+
+    async def test_update_invalidates_cache(
+        self, client: AsyncClient, test_user: User, auth_headers: dict
+    ):
+        """Test the cached user is dropped when the profile changes."""
+        await client.get("/api/users/me", headers=auth_headers)
+        await client.put(
+            "/api/users/me", json={"username": "renamed"}, headers=auth_headers
+        )
+
+        response = await client.get("/api/users/me", headers=auth_headers)
+        assert response.json()["username"] == "renamed"
+        assert user_cache.stats()["invalidations"] == 1
+
+    async def test_delete_invalidates_cache(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test a deleted user's cached token stops working."""
+        await client.get("/api/users/me", headers=auth_headers)
+        await crud_user.delete_user(test_db, test_user.user_id)
+
+        response = await client.get("/api/users/me", headers=auth_headers)
+        assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+class TestExportCurrentUser:
+    """Tests for whole-account export."""
+
+    async def test_export_account(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        test_item: ItemModel,
+        auth_headers: dict,
+        test_db: AsyncSession,
+    ):
+        """Test every list is exported, including lists without items."""
+        from datetime import datetime
+        import uuid
+
+        empty_list = ListModel(
+            list_id=uuid.uuid4(),
+            user_id=test_user.user_id,
+            title="Empty List",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        test_db.add(empty_list)
+        await test_db.commit()
+
+        response = await client.get("/api/users/me/export", headers=auth_headers)
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 2
+        by_title = {row["list_title"]: row for row in rows}
+        assert by_title["Test List"]["item_id"] == str(test_item.item_id)
+        assert by_title["Empty List"]["item_id"] is None
+
+    async def test_export_only_own_lists(
+        self,
+        client: AsyncClient,
+        test_item: ItemModel,
+        auth_headers_user2: dict,
+    ):
+        """Test another user's items are not exported."""
+        response = await client.get("/api/users/me/export", headers=auth_headers_user2)
+        assert response.status_code == 200
+        assert response.text == ""
+
+    async def test_export_unauthenticated(self, client: AsyncClient):
+        """Test exporting without auth fails."""
+        response = await client.get("/api/users/me/export")
+        assert response.status_code == 401